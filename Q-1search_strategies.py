@@ -1,5 +1,10 @@
 from collections import deque  # Import deque for BFS queue
 
+from compact_graph import reverse_view, successor_keys, to_node_id, to_node_name, to_node_names  # Translate names at the API boundary of compact graphs
+from components import component_index  # Reject unreachable queries before searching
+from instrumentation import probe_phase, probe_search  # Optional counters and trace sinks
+from level_bfs import LevelSynchronousBFS  # Whole-level expansion for large sparse graphs
+
 # Adjacency dictionary representing the state space graph
 adjacency_dict = {
     "Axum": ["Shire", "Adwa"],
@@ -48,29 +53,59 @@ adjacency_dict = {
 }
 
 class SearchStrategies:
-    def __init__(self, graph, initial_state, goal_state):
+    def __init__(self, graph, initial_state, goal_state, components=None):
+        """
+        Initialize the search strategies.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph, either as an adjacency dictionary
+            or as a CompactGraph built from one.
+        initial_state (str): The initial state.
+        goal_state (str): The goal state.
+        components (ComponentIndex): An optional component index used to reject unreachable
+            goals without searching. CompactGraphs get one automatically.
+        """
         self.graph = graph
         self.initial_state = initial_state
         self.goal_state = goal_state
+        self.components = components
 
-    def bfs(self):
+    def bfs(self, probe=None):
         """
         Performs Breadth-First Search (BFS) to find the shortest path from the initial state to the goal state.
 
+        Args:
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
+
         Returns:
         tuple: The path from the initial state to the goal state and the maximum breadth reached.
         """
+        with probe_search(probe, "bfs"), probe_phase(probe, "search"):
+            return self._bfs(probe)
+
+    def _bfs(self, probe):
+        if not self.is_reachable():
+            return [], 0  # The goal lies in a component the initial state cannot reach
+
+        start, goal = self._endpoints()
         visited = set()  # A set to keep track of visited nodes
-        queue = deque([(self.initial_state, 0)])  # Initialize the queue with the initial state and depth 0
-        parent = {self.initial_state: None}  # A dictionary to track the parent of each node
+        queue = deque([(start, 0)])  # Initialize the queue with the initial state and depth 0
+        if probe is not None:
+            probe.push(1)
+        parent = {start: None}  # A dictionary to track the parent of each node
         max_breadth = 0
 
         while queue:
             node, depth = queue.popleft()  # Dequeue the first node and its depth
+            if probe is not None:
+                if node in visited:
+                    probe.stale_pop()
+                else:
+                    probe.expand(to_node_name(self.graph, node), depth=depth)
             max_breadth = max(max_breadth, depth)
 
-            if node == self.goal_state:
-                return self.construct_path(parent), max_breadth  # If the goal state is found, construct and return the path
+            if node == goal:
+                return self.construct_path(parent, goal), max_breadth  # If the goal state is found, construct and return the path
 
             if node not in visited:
                 visited.add(node)  # Mark the node as visited
@@ -78,26 +113,46 @@ class SearchStrategies:
                     if neighbor not in visited:
                         parent[neighbor] = node  # Set the parent of the neighbor to the current node
                         queue.append((neighbor, depth + 1))  # Enqueue the neighbor with updated depth
+                        if probe is not None:
+                            probe.push(len(queue))
         return [], max_breadth
 
-    def dfs(self):
+    def dfs(self, probe=None):
         """
         Performs Depth-First Search (DFS) to explore the graph from the initial state to the goal state.
 
+        Args:
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
+
         Returns:
         tuple: The path from the initial state to the goal state and the maximum depth reached.
         """
+        with probe_search(probe, "dfs"), probe_phase(probe, "search"):
+            return self._dfs(probe)
+
+    def _dfs(self, probe):
+        if not self.is_reachable():
+            return [], 0  # The goal lies in a component the initial state cannot reach
+
+        start, goal = self._endpoints()
         visited = set()  # A set to keep track of visited nodes
-        stack = [(self.initial_state, 0)]  # Initialize the stack with the initial state and depth 0
-        parent = {self.initial_state: None}  # A dictionary to track the parent of each node
+        stack = [(start, 0)]  # Initialize the stack with the initial state and depth 0
+        if probe is not None:
+            probe.push(1)
+        parent = {start: None}  # A dictionary to track the parent of each node
         max_depth = 0
 
         while stack:
             node, depth = stack.pop()  # Pop the last node and its depth from the stack
+            if probe is not None:
+                if node in visited:
+                    probe.stale_pop()
+                else:
+                    probe.expand(to_node_name(self.graph, node), depth=depth)
             max_depth = max(max_depth, depth)
 
-            if node == self.goal_state:
-                return self.construct_path(parent), max_depth  # If the goal state is found, construct and return the path
+            if node == goal:
+                return self.construct_path(parent, goal), max_depth  # If the goal state is found, construct and return the path
 
             if node not in visited:
                 visited.add(node)  # Mark the node as visited
@@ -105,24 +160,118 @@ class SearchStrategies:
                     if neighbor not in visited:
                         parent[neighbor] = node  # Set the parent of the neighbor to the current node
                         stack.append((neighbor, depth + 1))  # Push the neighbor with updated depth onto the stack
+                        if probe is not None:
+                            probe.push(len(stack))
         return [], max_depth
 
-    def construct_path(self, parent):
+    def level_bfs(self, alpha=14, beta=24):
+        """
+        Performs a level-synchronous, direction-optimizing Breadth-First Search that expands a whole
+        level per step instead of one node at a time.
+
+        Args:
+        alpha (float): The push-to-pull switching factor (default is 14).
+        beta (float): The pull-to-push switching factor (default is 24).
+
+        Returns:
+        tuple: A path with the fewest hops from the initial state to the goal state and the maximum
+            depth reached, like bfs(). Pass a CompactGraph to avoid converting the dictionary per call.
+        """
+        if not self.is_reachable():
+            return [], 0  # The goal lies in a component the initial state cannot reach
+
+        return LevelSynchronousBFS(self.graph, alpha, beta).search(self.initial_state, self.goal_state)
+
+    def bidirectional_bfs(self):
+        """
+        Performs a bidirectional Breadth-First Search that grows one frontier from the initial state
+        and one from the goal state (over the reverse graph) until they meet in the middle.
+
+        The smaller frontier is always expanded by one whole level, and the level that first meets the
+        other search is finished before the shortest meeting point is picked.
+
+        Returns:
+        tuple: The shortest path from the initial state to the goal state and the number of levels
+            explored, which is the path length in edges when a path is found.
+        """
+        if not self.is_reachable():
+            return [], 0  # The goal lies in a component the initial state cannot reach
+
+        start, goal = self._endpoints()
+        if start == goal:
+            return to_node_names(self.graph, [start]), 0
+
+        graphs = (self.graph, reverse_view(self.graph))
+        parents = ({start: None}, {goal: None})  # Parent of each node in the forward and backward trees
+        depths = ({start: 0}, {goal: 0})  # Level of each node in the forward and backward trees
+        frontiers = ([start], [goal])
+        levels = [0, 0]
+
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1  # Expand the cheaper frontier
+            parent, depth, other_depth = parents[side], depths[side], depths[1 - side]
+            next_frontier = []
+            meeting, meeting_length = None, None
+            for node in frontiers[side]:
+                for neighbor in successor_keys(graphs[side], node):
+                    if neighbor in parent:
+                        continue
+                    parent[neighbor] = node
+                    depth[neighbor] = levels[side] + 1
+                    next_frontier.append(neighbor)
+                    if neighbor in other_depth:
+                        length = levels[side] + 1 + other_depth[neighbor]
+                        if meeting is None or length < meeting_length:
+                            meeting, meeting_length = neighbor, length
+            frontiers[side][:] = next_frontier
+            levels[side] += 1
+
+            if meeting is not None:
+                tail = []
+                node = parents[1][meeting]
+                while node is not None:
+                    tail.append(node)  # Walk the backward tree from the meeting point to the goal
+                    node = parents[1][node]
+                return self.construct_path(parents[0], meeting) + to_node_names(self.graph, tail), meeting_length
+
+        return [], levels[0] + levels[1]
+
+    def is_reachable(self):
+        """
+        Checks the component index to see whether the goal state can be reached at all.
+
+        Returns:
+        bool: False only if an index is available and proves the goal unreachable.
+        """
+        components = component_index(self.graph, self.components)
+        return components is None or components.reachable(self.initial_state, self.goal_state)
+
+    def _endpoints(self):
+        """
+        Translates the initial and goal states into the keys used by the graph.
+
+        Returns:
+        tuple: The start and goal keys (node IDs for a CompactGraph, names for a dictionary).
+        """
+        return to_node_id(self.graph, self.initial_state), to_node_id(self.graph, self.goal_state)
+
+    def construct_path(self, parent, goal=None):
         """
         Constructs the path from the initial state to the goal state using the parent dictionary.
 
         Args:
         parent (dict): A dictionary mapping each node to its parent.
+        goal: The key the path ends at (default is the goal state).
 
         Returns:
         list: The path from the initial state to the goal state.
         """
         path = []
-        node = self.goal_state
-        while node:
+        node = self.goal_state if goal is None else goal
+        while node is not None:
             path.append(node)  # Append the node to the path
             node = parent[node]  # Move to the parent node
-        return path[::-1]  # Reverse the path to get it from initial state to goal state
+        return to_node_names(self.graph, path[::-1])  # Reverse the path and translate IDs back to names
 
 if __name__ == "__main__":
     # Test 1: From 'Addis Ababa' to 'Moyale'
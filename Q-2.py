@@ -1,4 +1,10 @@
-import heapq
+from bounded_search import sma_star_search  # Memory-bounded search for frontiers that would not fit in RAM
+from compact_graph import reverse_view, to_node_id, to_node_name, to_node_names  # Translate names at the API boundary of compact graphs
+from components import component_index  # Reject unreachable queries before searching
+from contraction import contraction_hierarchy  # Preprocessed hierarchy for repeated point-to-point queries
+from instrumentation import probe_search  # Optional counters and trace sinks
+from search_core import best_first_search, bidirectional_search, reconstruct_path, shortest_path_tree  # Shared priority-search core
+from voronoi import FacilityIndex  # Multi-source labeling of every node with its nearest facility
 
 # Adjacency dictionary representing the state space graph with backward costs
 adjacency_dict_costs = {
@@ -42,71 +48,137 @@ adjacency_dict_costs = {
     "Sof Oumer": [("Goba", 5)]
 }
 
-def uniform_cost_search(graph, start, goal):
+def uniform_cost_search(graph, start, goal, components=None, probe=None, max_nodes=None):
     """
     Perform uniform cost search to find the least-cost path from start to goal.
 
     Args:
-    graph (dict): The state space graph with costs.
+    graph (dict or CompactGraph): The state space graph with costs.
     start (str): The initial state.
     goal (str): The goal state.
+    components (ComponentIndex): An optional component index used to reject an unreachable
+        goal without searching. CompactGraphs get one automatically.
+    probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
+    max_nodes (int): If given, search with SMA* holding at most this many search nodes instead of
+        keeping every reached state, for state spaces whose frontier would not fit in memory.
 
     Returns:
     list: The path from the start to the goal.
     """
-    priority_queue = [(0, start, [])]  # (cost, current_node, path)
-    visited = set()  # A set to keep track of visited nodes
+    with probe_search(probe, "ucs"):
+        components = component_index(graph, components)
+        if components is not None and not components.reachable(start, goal):
+            return None, float('inf')
+
+        start, goal = to_node_id(graph, start), to_node_id(graph, goal)
+        if max_nodes is not None:
+            path, cost = sma_star_search(graph, start, goal, max_nodes=max_nodes, probe=probe)
+        else:
+            path, cost = best_first_search(graph, start, goal, probe=probe)  # Predecessor map and indexed heap, no path copies
+        return to_node_names(graph, path), cost
+
+def bidirectional_uniform_cost_search(graph, start, goal, components=None, reverse_graph=None):
+    """
+    Perform bidirectional uniform cost search (bidirectional Dijkstra) to find the least-cost path
+    from start to goal, growing one search from the start and one from the goal until they meet.
 
-    while priority_queue:
-        cost, node, path = heapq.heappop(priority_queue)  # Pop the node with the lowest cost
-        if node in visited:
-            continue
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs.
+    start (str): The initial state.
+    goal (str): The goal state.
+    components (ComponentIndex): An optional component index used to reject an unreachable
+        goal without searching. CompactGraphs get one automatically.
+    reverse_graph (dict or CompactGraph): The graph with every edge reversed. It is derived from
+        graph if omitted; pass it in when running many queries against the same dictionary.
 
-        visited.add(node)
-        path = path + [node]
+    Returns:
+    tuple: The path from the start to the goal and its cost.
+    """
+    components = component_index(graph, components)
+    if components is not None and not components.reachable(start, goal):
+        return None, float('inf')
 
-        if node == goal:
-            return path, cost  # Return the path and its cost when the goal is reached
+    if reverse_graph is None:
+        reverse_graph = reverse_view(graph)
+    start, goal = to_node_id(graph, start), to_node_id(graph, goal)
+    path, cost = bidirectional_search(graph, reverse_graph, start, goal)
+    return to_node_names(graph, path), cost
+
+def contraction_hierarchy_search(graph, start, goal, hierarchy=None, components=None):
+    """
+    Find the least-cost path from start to goal over a contraction hierarchy, which answers each
+    query with two small upward searches once the graph has been preprocessed.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs.
+    start (str): The initial state.
+    goal (str): The goal state.
+    hierarchy (ContractionHierarchy): The hierarchy of graph. CompactGraphs get one built and
+        cached automatically; for a dictionary it is rebuilt on every call if omitted, so build
+        one with ContractionHierarchy.build() and pass it in when running many queries.
+    components (ComponentIndex): An optional component index used to reject an unreachable
+        goal without searching. CompactGraphs get one automatically.
 
-        for neighbor, weight in graph.get(node, []):
-            if neighbor not in visited:
-                heapq.heappush(priority_queue, (cost + weight, neighbor, path))
+    Returns:
+    tuple: The path from the start to the goal and its cost.
+    """
+    components = component_index(graph, components)
+    if components is not None and not components.reachable(start, goal):
+        return None, float('inf')
 
-    return None, float('inf')
+    if hierarchy is None:
+        hierarchy = contraction_hierarchy(graph)
+    return hierarchy.search(start, goal)
 
-def customized_uniform_cost_search(graph, start, goals):
+def customized_uniform_cost_search(graph, start, goals, components=None, probe=None):
     """
     Perform customized uniform cost search to find the least-cost path from start to any of the goal states.
 
     Args:
-    graph (dict): The state space graph with costs.
+    graph (dict or CompactGraph): The state space graph with costs.
     start (str): The initial state.
-    goals (set): The set of goal states.
+    goals (set): The set of goal states. It is not modified.
+    components (ComponentIndex): An optional component index used to drop unreachable goals
+        up front, so the search stops as soon as the reachable ones are settled.
+    probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
 
     Returns:
     dict: A dictionary with goal states as keys and tuples of (path, cost) as values.
     """
-    priority_queue = [(0, start, [])]  # (cost, current_node, path)
-    visited = set()  # A set to keep track of visited nodes
+    with probe_search(probe, "customized_ucs"):
+        components = component_index(graph, components)
+        if components is not None:
+            goals = set(goals) - components.unreachable_goals(start, goals)
+
+        start = to_node_id(graph, start)
+        goals = {to_node_id(graph, goal) for goal in goals}
+        distances, parent = shortest_path_tree(graph, start, goals, probe)  # Stops once every goal is settled
     solutions = {}  # A dictionary to store paths and costs for each goal
 
-    while priority_queue and len(goals) > 0:
-        cost, node, path = heapq.heappop(priority_queue)  # Pop the node with the lowest cost
-        if node in visited:
-            continue
+    for node, cost in distances.items():  # Settled nodes in order of increasing cost
+        if node in goals:
+            path = reconstruct_path(parent, node)
+            solutions[to_node_name(graph, node)] = (to_node_names(graph, path), cost)  # Store the solution for the goal
 
-        visited.add(node)
-        path = path + [node]
+    return solutions
 
-        if node in goals:
-            solutions[node] = (path, cost)  # Store the solution for the goal
-            goals.remove(node)  # Remove the goal from the set
+def multi_source_uniform_cost_search(graph, facilities, to_facilities=False, probe=None):
+    """
+    Perform one uniform cost search seeded with every facility at once, labeling each state with
+    its nearest facility, the cost to it and its predecessor.
 
-        for neighbor, weight in graph.get(node, []):
-            if neighbor not in visited:
-                heapq.heappush(priority_queue, (cost + weight, neighbor, path))
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs.
+    facilities (iterable): The facility states, such as depots.
+    to_facilities (bool): Whether costs run from each state to the facility instead of from the
+        facility to each state (default is False).
+    probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
 
-    return solutions
+    Returns:
+    FacilityIndex: The labeling. Its nearest_facility() answers in constant time, and
+        open_facility() and close_facility() update it incrementally.
+    """
+    return FacilityIndex(graph, facilities, to_facilities, probe)
 
 if __name__ == "__main__":
     # Part 2.2: UCS from 'Addis Ababa' to 'Lalibela'
@@ -1,72 +1,212 @@
-import heapq
+from anytime_search import AnytimeAStar  # Bounded-suboptimality search for latency-capped queries
+from bounded_search import ida_star_search, sma_star_search  # Memory-bounded alternatives to A*
+from compact_graph import CompactGraph, to_node_id, to_node_names, watch_edits  # Translate names at the API boundary of compact graphs
+from components import component_index  # Reject unreachable queries before searching
+from edge_index import edge_index  # O(1) edge costs for costing and auditing paths
+from instrumentation import SearchProbe, TraceTableSink, probe_phase, probe_search  # Optional counters and trace sinks
+from landmarks import LandmarkHeuristic  # Goal-independent heuristic used when none is given
+from search_core import best_first_search  # Shared priority-search core
 
 class AStarSearch:
-    def __init__(self, graph, heuristics):
+    def __init__(self, graph, heuristics=None, components=None, landmark_count=8):
+        """
+        Initialize the A* search.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph with costs.
+        heuristics (dict or LandmarkHeuristic): The heuristic value of every state keyed by name, which
+            only holds for the goal it was written for, or a LandmarkHeuristic that works for any goal.
+            If omitted, a LandmarkHeuristic is built for the graph on the first search, and
+            rebuilt after edits reported through graph_edited(), such as those made by
+            ShortestPathCache or ReplanningService. A LandmarkHeuristic passed in is only valid
+            while the graph is not edited.
+        components (ComponentIndex): An optional component index used to reject unreachable
+            goals without searching. CompactGraphs get one automatically.
+        landmark_count (int): The number of landmarks used when the heuristic is built automatically.
+        """
         self.graph = graph
         self.heuristics = heuristics
+        self.components = components
+        self.landmark_count = landmark_count
+        self.landmarks_built = False  # Whether self.heuristics is a LandmarkHeuristic built here
+        self.edge_weights = None  # EdgeWeightIndex of the graph, built on first use
+        if isinstance(graph, CompactGraph) and isinstance(heuristics, dict):
+            # Re-key the heuristics by node ID once so the search loop never touches names
+            self.heuristics = {graph.node_id(name): value for name, value in heuristics.items() if name in graph.index}
+        elif not isinstance(graph, CompactGraph):
+            watch_edits(graph, self.invalidate)
+
+    def heuristic_for(self, goal):
+        """
+        Return the heuristic function A* uses for a goal.
+
+        Args:
+        goal (str): The goal state.
+
+        Returns:
+        callable: A function h(node) estimating the cost from a search key to the goal.
+        """
+        if self.heuristics is None:
+            self.heuristics = LandmarkHeuristic(self.graph, self.landmark_count)
+            self.landmarks_built = True
+        if isinstance(self.heuristics, LandmarkHeuristic):
+            return self.heuristics.for_goal(goal)
+        return self.heuristics.__getitem__
+
+    def invalidate(self, start=None):
+        """
+        Drop the edge weight index and the landmark tables built for the graph, so they are
+        rebuilt when next needed. Edits reported through graph_edited() call this; call it after
+        editing the graph directly. The edited state given as start is not used, since the
+        landmark tables depend on every edge.
+        """
+        self.edge_weights = None
+        if self.landmarks_built:
+            self.heuristics = None
+            self.landmarks_built = False
 
-    def a_star_search(self, start, goal):
+    def a_star_search(self, start, goal, probe=None):
         """
         Perform A* search to find the least-cost path from start to goal.
 
         Args:
-        graph (dict): The state space graph with costs.
         start (str): The initial state.
         goal (str): The goal state.
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
+            Give it a TraceTableSink to print the g, h and f scores of every expanded node.
 
         Returns:
         tuple: The path from the start to the goal and the total cost.
         """
-        priority_queue = [(0 + self.heuristics[start], 0, start, [])]  # (f_score, g_score, current_node, path)
-        visited = set()  # A set to keep track of visited nodes
+        with probe_search(probe, "a_star"):
+            components = component_index(self.graph, self.components)
+            if components is not None and not components.reachable(start, goal):
+                return None, float('inf')
 
-        print(f"{'Node':<12} {'g_score (Backward Cost)':<25} {'Heuristic (h_score)':<20} {'f_score (Total)'}")
+            with probe_phase(probe, "heuristic"):
+                heuristic = self.heuristic_for(goal)
+            start, goal = to_node_id(self.graph, start), to_node_id(self.graph, goal)
+            path, cost = best_first_search(self.graph, start, goal, heuristic, probe)
+            return to_node_names(self.graph, path), cost
 
-        while priority_queue:
-            f_score, g_score, node, path = heapq.heappop(priority_queue)  # Pop the node with the lowest f_score
-            if node in visited:
-                continue
+    def ida_star_search(self, start, goal, table_size=1 << 16, probe=None):
+        """
+        Perform iterative deepening A* (IDA*), which needs memory only for the current path and a
+        bounded transposition table, to find the least-cost path from start to goal.
 
-            visited.add(node)
-            path = path + [node]
+        Args:
+        start (str): The initial state.
+        goal (str): The goal state.
+        table_size (int): The most states the transposition table remembers (default is 65536).
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
 
-            print(f"{node:<12} {g_score:<25} {self.heuristics[node]:<20} {f_score}")
+        Returns:
+        tuple: The path from the start to the goal and the total cost.
+        """
+        with probe_search(probe, "ida_star"):
+            return self._bounded_search(ida_star_search, start, goal, table_size, probe)
 
-            if node == goal:
-                return path, g_score  # Return the path and its cost when the goal is reached
+    def sma_star_search(self, start, goal, max_nodes=100000, probe=None):
+        """
+        Perform simplified memory-bounded A* (SMA*), which holds at most max_nodes search nodes, to
+        find the least-cost path from start to goal.
 
-            for neighbor, cost in self.graph.get(node, []):
-                if neighbor not in visited:
-                    g = g_score + cost
-                    f = g + self.heuristics[neighbor]
-                    heapq.heappush(priority_queue, (f, g, neighbor, path))
+        Args:
+        start (str): The initial state.
+        goal (str): The goal state.
+        max_nodes (int): The most search nodes held at once (default is 100000).
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
 
-        return None, float('inf')
+        Returns:
+        tuple: The path from the start to the goal and the total cost, or (None, inf) if the goal
+            is unreachable or no path fits within max_nodes.
+        """
+        with probe_search(probe, "sma_star"):
+            return self._bounded_search(sma_star_search, start, goal, max_nodes, probe)
 
-    def detailed_path(self, path):
+    def _bounded_search(self, search, start, goal, limit, probe):
+        components = component_index(self.graph, self.components)
+        if components is not None and not components.reachable(start, goal):
+            return None, float('inf')
+
+        with probe_phase(probe, "heuristic"):
+            heuristic = self.heuristic_for(goal)
+        start, goal = to_node_id(self.graph, start), to_node_id(self.graph, goal)
+        path, cost = search(self.graph, start, goal, heuristic, limit, probe)
+        return to_node_names(self.graph, path), cost
+
+    def anytime(self, start, goal, epsilon=3.0, epsilon_step=0.5):
         """
-        Provide a detailed breakdown of the path with costs between nodes.
+        Prepare an ARA* search that can be advanced and queried for its best path at any time.
+
+        Args:
+        start (str): The initial state.
+        goal (str): The goal state.
+        epsilon (float): The heuristic inflation of the first solution (default is 3.0).
+        epsilon_step (float): How much epsilon drops after every solution (default is 0.5).
+
+        Returns:
+        AnytimeAStar: The search, not yet started. Call run() or improve() on it and read its
+            path, cost and bound.
+        """
+        return AnytimeAStar(self.graph, start, goal, self.heuristic_for(goal), epsilon, epsilon_step)
+
+    def anytime_search(self, start, goal, time_budget=0.005, epsilon=3.0, epsilon_step=0.5, probe=None):
+        """
+        Find the best path A* can prove within a time budget.
+
+        A weighted A* solution costing at most epsilon times the optimum comes first, and is then
+        improved with smaller epsilons, reusing the earlier search, until it is optimal or the
+        budget runs out.
 
         Args:
-        path (list): The path from the start to the goal.
+        start (str): The initial state.
+        goal (str): The goal state.
+        time_budget (float): The wall-clock budget in seconds (default is 0.005), or None to run
+            until the path is optimal.
+        epsilon (float): The heuristic inflation of the first solution (default is 3.0).
+        epsilon_step (float): How much epsilon drops after every solution (default is 0.5).
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
+
+        Returns:
+        tuple: The best path found, its total cost and a bound on cost / optimal cost, which is 1.0
+            for a proven optimal path and inf if no path was found in time.
+        """
+        with probe_search(probe, "anytime_a_star"):
+            components = component_index(self.graph, self.components)
+            if components is not None and not components.reachable(start, goal):
+                return None, float('inf'), float('inf')
+
+            with probe_phase(probe, "heuristic"):
+                search = self.anytime(start, goal, epsilon, epsilon_step)
+            with probe_phase(probe, "search"):
+                return search.run(time_budget, probe=probe)
+
+    def edge_index(self):
+        """
+        Return the edge weight index of the graph, building it on first use. The index of an
+        adjacency dictionary is dropped by invalidate() when the graph is edited.
 
         Returns:
-        str: A formatted string with the detailed path and costs.
+        EdgeWeightIndex: The index. Its path_costs() and ragged_path_costs() cost many stored
+            paths at once.
         """
-        detailed_str = "Detailed Path:\n"
-        total_cost = 0
+        if self.edge_weights is None:
+            self.edge_weights = edge_index(self.graph)
+        return self.edge_weights
 
-        for i in range(len(path) - 1):
-            current_node = path[i]
-            next_node = path[i + 1]
-            for neighbor, cost in self.graph[current_node]:
-                if neighbor == next_node:
-                    detailed_str += f"{current_node} -> {next_node} (Cost: {cost})\n"
-                    total_cost += cost
-                    break
+    def detailed_path(self, path):
+        """
+        Provide a detailed breakdown of the path with costs between nodes.
 
-        detailed_str += f"Total Cost: {total_cost}"
-        return detailed_str
+        Args:
+        path (list): The path from the start to the goal, as node names.
+
+        Returns:
+        DetailedPath: The hops with their costs, the total cost and the hops that are not edges.
+            Print it, or call render(), for the formatted breakdown.
+        """
+        return self.edge_index().detailed_path(path)
 
 # Example adjacency list with backward costs
 adjacency_dict_costs = {
@@ -153,9 +293,10 @@ heuristics = {
     "Asella": 6  # Add the missing heuristic value for Asella
 }
 
-# Usage example
-search = AStarSearch(adjacency_dict_costs, heuristics)
-path, cost = search.a_star_search('Addis Ababa', 'Moyale')
-print(f"Path to Moyale: {path}")
-print(f"Total Cost: {cost}\n")
-print(search.detailed_path(path))
+if __name__ == "__main__":
+    # Usage example
+    search = AStarSearch(adjacency_dict_costs, heuristics)
+    path, cost = search.a_star_search('Addis Ababa', 'Moyale', SearchProbe([TraceTableSink()]))
+    print(f"Path to Moyale: {path}")
+    print(f"Total Cost: {cost}\n")
+    print(search.detailed_path(path))
@@ -1,5 +1,26 @@
+import multiprocessing  # Import multiprocessing for the bound shared between parallel workers
+import time  # Import time for the anytime search deadline
+from array import array  # Import array for the flat game tree representation
+from concurrent.futures import ProcessPoolExecutor  # Spread root subtrees across CPU cores
+
+from instrumentation import probe_phase, probe_search  # Optional counters and trace sinks
+
+# Transposition table entry flags: the stored value is exact, a lower bound or an upper bound
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+class SearchBudgetExceeded(Exception):
+    """
+    Raised inside a search when its wall-clock deadline or node budget runs out.
+    """
+
+# Per-process state of a parallel search worker, set up once when the worker starts
+_worker_search = None
+_worker_alpha = None
+
 class Node:
-    def __init__(self, name, utility=0, children=None):
+    __slots__ = ("name", "utility", "children", "key")  # No per-node __dict__, which matters for large trees
+
+    def __init__(self, name, utility=0, children=None, key=None):
         """
         Initialize a node in the graph.
 
@@ -7,20 +28,200 @@ class Node:
         name (str): The name of the node (city).
         utility (int): The utility value of the node (default is 0).
         children (list): The list of child nodes (default is None).
+        key: A hashable state identifier, so that repeated positions reached through different
+            nodes share transposition table entries (default is None, which uses the node's identity).
         """
         self.name = name
         self.utility = utility
         self.children = children if children is not None else []
+        self.key = key
+
+    @property
+    def is_terminal(self):
+        """
+        Whether the node has no children.
+        """
+        return not self.children
+
+class LazyNode:
+    __slots__ = ("name", "utility", "expand", "key")
+
+    def __init__(self, name, utility=0, expand=None, key=None):
+        """
+        Initialize a node whose children are generated on demand.
+
+        The children are produced by calling expand(node) every time they are needed and are not
+        kept, so a searched subtree can be garbage collected as soon as the search leaves it.
+
+        Args:
+        name (str): The name of the node (city).
+        utility (int): The utility value of the node (default is 0).
+        expand (callable): A function returning the children of a node as an iterable of nodes
+            (default is None, which makes the node a leaf). It must be a module level function
+            for parallel_best_move to send it to worker processes.
+        key: A hashable state identifier. Regenerated nodes are new objects, so only nodes with
+            a key take part in the transposition table and the killer and history heuristics.
+        """
+        self.name = name
+        self.utility = utility
+        self.expand = expand
+        self.key = key
+
+    @property
+    def children(self):
+        """
+        Generate the list of child nodes.
+        """
+        return list(self.expand(self)) if self.expand is not None else []
+
+    @property
+    def is_terminal(self):
+        """
+        Whether the node is a leaf, known without generating its children.
+        """
+        return self.expand is None
+
+class ArrayGameTree:
+    """
+    A game tree stored as flat parallel arrays instead of one object per node.
+
+    Nodes are numbered in breadth-first order, so the children of node i are exactly the nodes
+    first_child[i] to first_child[i + 1] - 1. A tree of n nodes costs one utility and one offset
+    per node plus the names.
+    """
+
+    __slots__ = ("names", "utilities", "first_child")
+
+    def __init__(self, names, utilities, first_child):
+        """
+        Initialize the tree from its arrays.
+
+        Args:
+        names (list): The name of every node.
+        utilities (array): The utility of every node.
+        first_child (array): The ID of the first child of every node, of length len(names) + 1.
+        """
+        self.names = names
+        self.utilities = utilities
+        self.first_child = first_child
+
+    @classmethod
+    def from_node(cls, root):
+        """
+        Flatten a tree of Node or LazyNode objects.
+
+        Args:
+        root (Node): The root node of the graph.
+
+        Returns:
+        ArrayGameTree: The flattened tree.
+        """
+        names = []
+        utilities = []
+        first_child = array('q', [1])
+        level = [root]
+        while level:
+            next_level = []
+            for node in level:
+                names.append(node.name)
+                utilities.append(node.utility)
+                children = node.children
+                next_level.extend(children)
+                first_child.append(first_child[-1] + len(children))
+            level = next_level
+        integral = all(isinstance(utility, int) for utility in utilities)
+        return cls(names, array('q' if integral else 'd', utilities), first_child)
+
+    @property
+    def root(self):
+        """
+        A handle on the root node.
+        """
+        return ArrayNode(self, 0)
+
+    def __len__(self):
+        return len(self.names)
+
+class ArrayNode:
+    __slots__ = ("tree", "key")
+
+    def __init__(self, tree, key):
+        """
+        Initialize a lightweight handle on one node of an ArrayGameTree.
+
+        Handles are created on demand while searching and can be discarded at any time; the
+        node ID doubles as the transposition table key.
+
+        Args:
+        tree (ArrayGameTree): The tree the node belongs to.
+        key (int): The node ID.
+        """
+        self.tree = tree
+        self.key = key
+
+    @property
+    def name(self):
+        """
+        The name of the node (city).
+        """
+        return self.tree.names[self.key]
+
+    @property
+    def utility(self):
+        """
+        The utility value of the node.
+        """
+        return self.tree.utilities[self.key]
+
+    @property
+    def children(self):
+        """
+        Handles on the child nodes, created on demand.
+        """
+        tree = self.tree
+        return [ArrayNode(tree, child) for child in range(tree.first_child[self.key], tree.first_child[self.key + 1])]
+
+    @property
+    def is_terminal(self):
+        """
+        Whether the node has no children.
+        """
+        return self.tree.first_child[self.key] == self.tree.first_child[self.key + 1]
 
 class MiniMaxSearch:
-    def __init__(self, root):
+    def __init__(self, root, ordering=None, use_transpositions=True, probe=None):
         """
         Initialize the MiniMax search with the root node.
 
         Args:
-        root (Node): The root node of the graph.
+        root (Node, LazyNode or ArrayNode): The root node of the graph.
+        ordering (str or tuple): The move ordering used by alpha-beta: any of "utility" (static
+            utility of the children), "killer" (moves that caused a cutoff at the same depth) and
+            "history" (moves that caused cutoffs anywhere), applied in the given priority.
+            Children keep their original order if omitted.
+        use_transpositions (bool): Whether alpha-beta stores searched positions in a transposition
+            table so repeated positions are not searched again (default is True). The table lives
+            as long as the search object, so the tree must not be changed between searches.
+        probe (SearchProbe): An optional probe told about every node visited by the searches run
+            in this process. Workers of parallel_best_move only report their node counts.
         """
         self.root = root
+        self.ordering = (ordering,) if isinstance(ordering, str) else tuple(ordering or ())
+        self.use_transpositions = use_transpositions
+        self.probe = probe
+        self.transpositions = {}  # (state key, maximizing) -> (depth, value, flag, best child position, depth limited)
+        self.killers = {}  # Depth -> keys of the last two children that caused a cutoff there
+        self.history = {}  # State key -> accumulated cutoff score
+        self.stats = {"nodes": 0, "cutoffs": 0, "transposition_hits": 0}
+        self.deadline = None  # perf_counter() time at which an anytime search must stop
+        self.node_budget = None  # Node count at which an anytime search must stop
+        self.horizon_reached = False  # Whether the last search cut off part of the tree at its depth limit
+
+    def reset_stats(self):
+        """
+        Reset the node, cutoff and transposition hit counters.
+        """
+        self.stats = {"nodes": 0, "cutoffs": 0, "transposition_hits": 0}
 
     def minimax(self, node, depth, maximizing_player):
         """
@@ -34,15 +235,19 @@ class MiniMaxSearch:
         Returns:
         int: The utility value of the node.
         """
+        self.stats["nodes"] += 1
+        if self.probe is not None:
+            self.probe.expand(node.name, depth=depth, maximizing=maximizing_player)
         # Base case: if depth is 0 or the node has no children, return the node's utility value
-        if depth == 0 or not node.children:
+        if depth == 0 or node.is_terminal:
             return node.utility
 
+        children = node.children  # Fetched once, since lazy nodes generate them on every access
         # If the current player is maximizing
         if maximizing_player:
             max_eval = float('-inf')
             # Evaluate each child node
-            for child in node.children:
+            for child in children:
                 eval = self.minimax(child, depth - 1, False)
                 max_eval = max(max_eval, eval)
             return max_eval
@@ -50,39 +255,396 @@ class MiniMaxSearch:
         else:
             min_eval = float('inf')
             # Evaluate each child node
-            for child in node.children:
+            for child in children:
                 eval = self.minimax(child, depth - 1, True)
                 min_eval = min(min_eval, eval)
             return min_eval
 
-    def best_move(self):
+    def alphabeta(self, node, depth, alpha, beta, maximizing_player):
+        """
+        Perform the MiniMax search with alpha-beta pruning, move ordering and a transposition table.
+
+        Args:
+        node (Node): The current node in the search.
+        depth (int): The current depth of the search.
+        alpha (float): The value the maximizing player is already assured of.
+        beta (float): The value the minimizing player is already assured of.
+        maximizing_player (bool): Whether the current player is maximizing.
+
+        Returns:
+        int: The utility value of the node if it lies strictly between alpha and beta, otherwise
+            a bound on the other side of the window, which is all the caller needs.
+        """
+        self.stats["nodes"] += 1
+        if self.probe is not None:
+            self.probe.expand(node.name, depth=depth, maximizing=maximizing_player, alpha=alpha, beta=beta)
+        if self.deadline is not None or self.node_budget is not None:
+            self.check_budget()
+        # Base case: if depth is 0 or the node has no children, return the node's utility value
+        terminal = node.is_terminal
+        if depth == 0 or terminal:
+            if not terminal:
+                self.horizon_reached = True
+            return node.utility
+
+        original_alpha, original_beta = alpha, beta
+        node_key = self.node_key(node)
+        table_key = (node_key, maximizing_player)
+        use_table = self.use_transpositions and node_key is not None
+        entry = self.transpositions.get(table_key) if use_table else None
+        best_first = None
+        if entry is not None:
+            # Only an entry searched to the same depth stands in for this search: a deeper value
+            # is not what a depth-limited minimax returns. Any entry still orders the children.
+            entry_depth, value, flag, best_first, limited = entry
+            if entry_depth == depth:
+                if flag == EXACT or (flag == LOWER_BOUND and value >= beta) or (flag == UPPER_BOUND and value <= alpha):
+                    self.stats["transposition_hits"] += 1
+                    self.horizon_reached = self.horizon_reached or limited
+                    return value
+
+        # Track whether this subtree hits the depth limit separately, so its table entry can record it
+        outer_limited, self.horizon_reached = self.horizon_reached, False
+        best_value = float('-inf') if maximizing_player else float('inf')
+        best_position = None
+        for position, child in self.ordered_children(node, depth, maximizing_player, best_first):
+            value = self.alphabeta(child, depth - 1, alpha, beta, not maximizing_player)
+            if maximizing_player:
+                if value > best_value:
+                    best_value, best_position = value, position
+                alpha = max(alpha, value)
+            else:
+                if value < best_value:
+                    best_value, best_position = value, position
+                beta = min(beta, value)
+            if alpha >= beta:
+                self.stats["cutoffs"] += 1
+                self.record_cutoff(child, depth)
+                break
+        limited, self.horizon_reached = self.horizon_reached, outer_limited or self.horizon_reached
+
+        if use_table:
+            if best_value <= original_alpha:
+                flag = UPPER_BOUND
+            elif best_value >= original_beta:
+                flag = LOWER_BOUND
+            else:
+                flag = EXACT
+            self.transpositions[table_key] = (depth, best_value, flag, best_position, limited)
+        return best_value
+
+    def node_key(self, node):
+        """
+        Return the transposition table key of a node: its state key if it has one, else the identity
+        of a materialized Node, or None for a generated node that cannot be recognized again.
+        """
+        key = node.key
+        if key is None and type(node) is Node:
+            return id(node)
+        return key
+
+    def ordered_children(self, node, depth, maximizing_player, best_first=None):
+        """
+        Order the children of a node for alpha-beta, most promising first.
+
+        Args:
+        node (Node): The node whose children are ordered.
+        depth (int): The remaining depth at the node.
+        maximizing_player (bool): Whether the player to move is maximizing.
+        best_first (int): The position of a child to try first, such as the best child found
+            by an earlier search of the same position.
+
+        Returns:
+        list: (position, child) pairs, where position is the child's index in node.children.
+        """
+        children = list(enumerate(node.children))  # The only place a search visit reads the children
+        if self.ordering:
+            killers = self.killers.get(depth, ())
+            sign = -1 if maximizing_player else 1
+
+            def score(item):
+                child_key = self.node_key(item[1])
+                scores = []
+                for heuristic in self.ordering:
+                    if heuristic == "utility":
+                        scores.append(sign * item[1].utility)
+                    elif heuristic == "killer":
+                        scores.append(0 if child_key in killers else 1)
+                    elif heuristic == "history":
+                        scores.append(-self.history.get(child_key, 0))
+                return scores
+
+            children.sort(key=score)  # Stable, so ties keep their original order
+        if best_first is not None and best_first < len(children):
+            children.sort(key=lambda item: item[0] != best_first)
+        return children
+
+    def record_cutoff(self, child, depth):
+        """
+        Remember a child that caused a cutoff for the killer and history heuristics.
+        """
+        child_key = self.node_key(child)
+        if child_key is None:
+            return
+        killers = self.killers.setdefault(depth, [])
+        if child_key not in killers:
+            killers.insert(0, child_key)
+            del killers[2:]
+        self.history[child_key] = self.history.get(child_key, 0) + depth * depth
+
+    def best_move(self, depth=3, algorithm="alphabeta"):
         """
         Find the best move for the agent from the root node.
 
+        Args:
+        depth (int): The search depth below each root child (default is 3).
+        algorithm (str): "alphabeta" for the pruned search or "minimax" for the full tree
+            (default is "alphabeta"). Both return the same move; self.stats shows the work done.
+
         Returns:
         str: The name of the best achievable destination.
         """
+        self.reset_stats()
         best_value = float('-inf')
         best_move = None
-        # Evaluate each child node of the root
-        for child in self.root.children:
-            move_value = self.minimax(child, depth=3, maximizing_player=False)
-            if move_value > best_value:
+        with probe_search(self.probe, algorithm), probe_phase(self.probe, "search"):
+            if algorithm == "minimax":
+                # Evaluate each child node
+                for child in self.root.children:
+                    move_value = self.minimax(child, depth=depth, maximizing_player=False)
+                    if move_value > best_value:
+                        best_value = move_value
+                        best_move = child
+                return best_move.name
+
+            best_move, _, _ = self.search_root(depth, self.ordered_children(self.root, depth + 1, True))
+            return best_move.name
+
+    def search_root(self, depth, children):
+        """
+        Run alpha-beta below each root child and pick the best one.
+
+        Args:
+        depth (int): The search depth below each root child.
+        children (list): The (position, child) pairs of the root, in the order to search them.
+
+        Returns:
+        tuple: The best child, its value and its position among the root's children. Ties go to
+            the earliest position, as in the full minimax search.
+        """
+        best_value = float('-inf')
+        best_move = None
+        best_position = None
+        # Evaluate each child node, most promising first, with the best value so far as alpha
+        for position, child in children:
+            move_value = self.alphabeta(child, depth, best_value, float('inf'), False)
+            if move_value == best_value and best_position is not None and position < best_position:
+                # A fail-low result only bounds the value, so settle ties the way the full search does
+                move_value = self.alphabeta(child, depth, float('-inf'), float('inf'), False)
+                if move_value == best_value:
+                    best_move, best_position = child, position
+            elif move_value > best_value:
                 best_value = move_value
-                best_move = child
-        return best_move.name
-
-# Example usage:
-# Define the graph nodes and their connections
-addis_ababa = Node("Addis Ababa")
-gedo = Node("Gedo", children=[Node("Gimbi", 8), Node("Limu", 8)])
-ambo = Node("Ambo", children=[Node("Hossana", 6), Node("Durame", 5)])
-adama = Node("Adama", children=[Node("Harar", 10), Node("Chiro", 6)])
-addis_ababa.children = [gedo, ambo, adama]
-
-# Initialize the MiniMax search with the root node
-search = MiniMaxSearch(addis_ababa)
-
-# Find the best move
-best_destination = search.best_move()
-print(f"The best achievable destination is: {best_destination}")
+                best_move, best_position = child, position
+        return best_move, best_value, best_position
+
+    def best_move_anytime(self, time_budget=None, node_budget=None, max_depth=None):
+        """
+        Find the best move with iterative deepening until a time or node budget runs out.
+
+        Each iteration searches one level deeper than the last. The best move of the previous
+        iteration is searched first and the transposition table supplies the best reply found so
+        far at every inner node, so the principal variation guides the move ordering. An
+        iteration cut short by the budget is discarded.
+
+        Args:
+        time_budget (float): The wall-clock budget in seconds (default is None, no limit).
+        node_budget (int): The maximum number of nodes to visit (default is None, no limit).
+        max_depth (int): The deepest search below each root child (default is None, no limit).
+            Without any limit the search deepens until the whole tree has been searched.
+
+        Returns:
+        tuple: The name of the best move found by the last completed iteration and the depth
+            that iteration searched below each root child.
+        """
+        self.reset_stats()
+        started = time.perf_counter()
+        with probe_search(self.probe, "alphabeta_anytime"):
+            # Depth 0 only reads the root children's utilities, so it always completes and leaves a move
+            best_move, _, best_position = self.search_root(0, self.ordered_children(self.root, 1, True))
+            completed_depth = 0
+            self.deadline = None if time_budget is None else started + time_budget
+            self.node_budget = node_budget
+            try:
+                depth = 1
+                while max_depth is None or depth <= max_depth:
+                    self.horizon_reached = False
+                    with probe_phase(self.probe, f"depth_{depth}"):  # One timing per iteration
+                        children = self.ordered_children(self.root, depth + 1, True, best_position)
+                        move, _, position = self.search_root(depth, children)
+                    best_move, best_position, completed_depth = move, position, depth
+                    if not self.horizon_reached:
+                        break  # The whole tree fits within this depth, so deeper searches change nothing
+                    depth += 1
+            except SearchBudgetExceeded:
+                pass
+            finally:
+                self.deadline = None
+                self.node_budget = None
+        return best_move.name, completed_depth
+
+    def parallel_best_move(self, depth=3, processes=None, young_brothers_wait=True, split_depth=1):
+        """
+        Find the best move with the root subtrees spread across a pool of worker processes.
+
+        Workers share the best proven root value through shared memory and use it as alpha for
+        every subtree they start, so later subtrees are pruned almost as well as in the serial
+        search. The chosen move is always the one best_move(depth) returns.
+
+        With Young Brothers Wait the eldest child of a split node is searched first and its
+        value bounds the window its younger brothers are searched with in parallel. A split_depth
+        above 1 applies the same split to the eldest line below the root, so the serial part of
+        the search, the eldest brother's subtree, is itself spread over the pool.
+
+        Args:
+        depth (int): The search depth below each root child (default is 3).
+        processes (int): The number of worker processes (default is None, one per CPU core).
+        young_brothers_wait (bool): Whether to search the most promising root child first, so
+            that every parallel subtree starts with a useful bound (default is True).
+        split_depth (int): The number of plies along the eldest line that are split, counting
+            the root (default is 1, only the root). Only used with young_brothers_wait.
+
+        Returns:
+        str: The name of the best achievable destination.
+        """
+        self.reset_stats()
+        order = self.ordered_children(self.root, depth + 1, True)
+        shared_alpha = multiprocessing.Value('d', float('-inf'))
+        results = []
+        with ProcessPoolExecutor(processes, initializer=_init_parallel_worker,
+                                 initargs=(self.root, self.ordering, self.use_transpositions, shared_alpha)) as pool:
+            if young_brothers_wait and order:
+                eldest_position, eldest = order.pop(0)
+                value = self.split_search(pool, eldest, (eldest_position,), depth, float('-inf'), float('inf'),
+                                          False, split_depth - 1)
+                shared_alpha.value = value
+                results.append((eldest_position, value, float('-inf')))
+
+            # Root jobs pass alpha as None to start from, and raise, the shared root bound
+            jobs = [((position,), depth, None, float('inf'), False) for position, _ in order]
+            for job, (value, alpha, nodes) in zip(jobs, pool.map(_search_subtree, jobs)):
+                results.append((job[0][0], value, alpha))
+                self.stats["nodes"] += nodes
+
+        # A value above the alpha it was searched with is exact; anything else only bounds the child
+        best_value = max(value for _, value, alpha in results if value > alpha)
+        best_position = min(position for position, value, alpha in results if value > alpha and value == best_value)
+        for position, value, alpha in sorted(results):
+            if position >= best_position:
+                break
+            if value >= best_value:
+                # The bound ties the best value, so only an exact search can tell whether the child ties it too
+                exact = self.alphabeta(self.root.children[position], depth, float('-inf'), float('inf'), False)
+                if exact == best_value:
+                    best_position = position
+                    break
+        return self.root.children[best_position].name
+
+    def split_search(self, pool, node, path, depth, alpha, beta, maximizing_player, splits):
+        """
+        Search a node with Young Brothers Wait: the eldest child here, then its younger brothers
+        in parallel with the window the eldest left.
+
+        The younger brothers all start from the same window instead of tightening it one after
+        another, so they prune a little less than in the serial search, but the value returned
+        bounds the node exactly as alphabeta() does.
+
+        Args:
+        pool (ProcessPoolExecutor): The pool running _search_subtree jobs.
+        node (Node): The node to search.
+        path (tuple): The child positions leading from the root to the node.
+        depth (int): The remaining depth at the node.
+        alpha (float): The value the maximizing player is already assured of.
+        beta (float): The value the minimizing player is already assured of.
+        maximizing_player (bool): Whether the player to move is maximizing.
+        splits (int): How many more plies along the eldest line to split; 0 searches here.
+
+        Returns:
+        int: The value of the node within the window, or a bound outside it.
+        """
+        if splits <= 0 or depth <= 1 or node.is_terminal:
+            return self.alphabeta(node, depth, alpha, beta, maximizing_player)
+        self.stats["nodes"] += 1
+        children = self.ordered_children(node, depth, maximizing_player)
+        eldest_position, eldest = children[0]
+        best_value = self.split_search(pool, eldest, path + (eldest_position,), depth - 1, alpha, beta,
+                                       not maximizing_player, splits - 1)
+        if maximizing_player:
+            alpha = max(alpha, best_value)
+        else:
+            beta = min(beta, best_value)
+        if alpha >= beta:
+            self.stats["cutoffs"] += 1
+            return best_value
+
+        jobs = [(path + (position,), depth - 1, alpha, beta, not maximizing_player) for position, _ in children[1:]]
+        for value, _, nodes in pool.map(_search_subtree, jobs):
+            self.stats["nodes"] += nodes
+            best_value = max(best_value, value) if maximizing_player else min(best_value, value)
+        return best_value
+
+    def check_budget(self):
+        """
+        Raise SearchBudgetExceeded once the anytime search has used up its time or node budget.
+        """
+        if self.node_budget is not None and self.stats["nodes"] > self.node_budget:
+            raise SearchBudgetExceeded()
+        # Reading the clock on every node would dominate small searches, so only check every 64 nodes
+        if self.deadline is not None and self.stats["nodes"] % 64 == 0 and time.perf_counter() >= self.deadline:
+            raise SearchBudgetExceeded()
+
+def _init_parallel_worker(root, ordering, use_transpositions, shared_alpha):
+    global _worker_search, _worker_alpha
+    _worker_search = MiniMaxSearch(root, ordering, use_transpositions)
+    _worker_alpha = shared_alpha
+
+def _search_subtree(job):
+    """
+    Search one subtree in a worker. A root subtree, sent with alpha None, starts from the best
+    value any worker has proven so far and raises it when it proves a better one.
+
+    Returns:
+    tuple: The subtree's value, the alpha it was searched with and the nodes visited.
+    """
+    path, depth, alpha, beta, maximizing_player = job
+    search = _worker_search
+    search.reset_stats()
+    node = search.root
+    for position in path:
+        node = node.children[position]
+    shared = alpha is None
+    if shared:
+        alpha = _worker_alpha.value
+    value = search.alphabeta(node, depth, alpha, beta, maximizing_player)
+    if shared and value > alpha:
+        # The value is exact, so raise the shared bound for the subtrees still to come
+        with _worker_alpha.get_lock():
+            if value > _worker_alpha.value:
+                _worker_alpha.value = value
+    return value, alpha, search.stats["nodes"]
+
+if __name__ == "__main__":
+    # Example usage:
+    # Define the graph nodes and their connections
+    addis_ababa = Node("Addis Ababa")
+    gedo = Node("Gedo", children=[Node("Gimbi", 8), Node("Limu", 8)])
+    ambo = Node("Ambo", children=[Node("Hossana", 6), Node("Durame", 5)])
+    adama = Node("Adama", children=[Node("Harar", 10), Node("Chiro", 6)])
+    addis_ababa.children = [gedo, ambo, adama]
+
+    # Initialize the MiniMax search with the root node
+    search = MiniMaxSearch(addis_ababa)
+
+    # Find the best move
+    best_destination = search.best_move()
+    print(f"The best achievable destination is: {best_destination}")
@@ -0,0 +1,159 @@
+import time  # Import time for the search deadlines
+
+from compact_graph import to_node_id, to_node_name, to_node_names
+from search_core import IndexedHeap, reconstruct_path
+
+
+class AnytimeAStar:
+    """
+    An ARA* search: a weighted A* that returns a solution with a suboptimality bound quickly and
+    then keeps tightening it, reusing the previous iterations' work.
+
+    Each iteration expands nodes in order of g + epsilon * h, which finds a path costing at most
+    epsilon times the optimum. Nodes whose cost improves after they were expanded are set aside
+    as inconsistent instead of being expanded again, and seed the next iteration with a smaller
+    epsilon, so an iteration only repairs what the last one left behind.
+    """
+
+    def __init__(self, graph, start, goal, heuristic=None, epsilon=3.0, epsilon_step=0.5):
+        """
+        Initialize the search. Nothing is expanded until improve() or run() is called.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph with costs.
+        start (str): The initial state.
+        goal (str): The goal state.
+        heuristic (callable): A consistent estimate h(node) of the cost from a search key to the
+            goal, such as AStarSearch.heuristic_for(goal). Plain uniform cost search if omitted.
+        epsilon (float): The inflation of the heuristic in the first iteration (default is 3.0).
+        epsilon_step (float): How much epsilon drops after every completed iteration (default is 0.5).
+        """
+        self.graph = graph
+        self.start = to_node_id(graph, start)
+        self.goal = to_node_id(graph, goal)
+        self.heuristic = heuristic or (lambda node: 0)
+        self.epsilon = max(1.0, epsilon)
+        self.epsilon_step = epsilon_step
+        self.g_scores = {self.start: 0}  # Best known cost from the start to each reached node
+        self.parent = {self.start: None}  # Predecessor of each reached node on its best known path
+        self.closed = set()  # Nodes expanded in the current iteration
+        self.inconsistent = set()  # Closed nodes whose cost improved, deferred to the next iteration
+        self.frontier = IndexedHeap()
+        self.frontier.push(self.start, self._priority(self.start))
+        self.best_path = None  # Search keys of the best path found so far
+        self.cost = float('inf')  # Cost of that path
+        self.bound = float('inf')  # Proven ratio between that cost and the optimum
+        self.iterations = 0  # Completed iterations
+        self.expansions = 0
+
+    @property
+    def path(self):
+        """
+        The best path found so far, as node names, or None if no iteration has completed.
+        """
+        return None if self.best_path is None else to_node_names(self.graph, self.best_path)
+
+    @property
+    def done(self):
+        """
+        Whether the best path is proven optimal or the goal is proven unreachable.
+        """
+        return self.bound <= 1.0 or (not self.frontier and not self.inconsistent)
+
+    def run(self, time_budget=None, deadline=None, probe=None):
+        """
+        Keep improving the solution until it is optimal or the time runs out.
+
+        Args:
+        time_budget (float): The wall-clock budget in seconds from now.
+        deadline (float): An absolute time.perf_counter() deadline; the earlier of the two applies.
+        probe (SearchProbe): An optional probe told about every expansion and frontier push.
+
+        Returns:
+        tuple: The best path so far, its cost and its suboptimality bound (inf if there is no path yet).
+        """
+        if time_budget is not None:
+            budget_end = time.perf_counter() + time_budget
+            deadline = budget_end if deadline is None else min(deadline, budget_end)
+        while not self.done:
+            if not self.improve(deadline, probe):
+                break
+        return self.path, self.cost, self.bound
+
+    def improve(self, deadline=None, probe=None):
+        """
+        Run or resume the current iteration, then lower epsilon for the next one.
+
+        Args:
+        deadline (float): An optional time.perf_counter() time at which to stop expanding. An
+            interrupted iteration resumes where it stopped on the next call.
+        probe (SearchProbe): An optional probe told about every expansion and frontier push.
+
+        Returns:
+        bool: Whether the iteration completed before the deadline.
+        """
+        if not self._improve_path(deadline, probe):
+            return False
+        self.iterations += 1
+        if self.g_scores.get(self.goal, float('inf')) < self.cost:
+            self.cost = self.g_scores[self.goal]
+            self.best_path = reconstruct_path(self.parent, self.goal)
+        self.bound = self._proven_bound()
+        if self.bound <= 1.0:
+            return True
+
+        # Lower epsilon and requeue the frontier and the inconsistent nodes under the new priorities
+        self.epsilon = max(1.0, self.epsilon - self.epsilon_step)
+        frontier = IndexedHeap()
+        for node in list(self.frontier) + list(self.inconsistent):
+            frontier.push(node, self._priority(node))
+        self.frontier = frontier
+        self.inconsistent.clear()
+        self.closed.clear()
+        return True
+
+    def _improve_path(self, deadline, probe):
+        g_scores, parent, closed, frontier = self.g_scores, self.parent, self.closed, self.frontier
+        goal, inf = self.goal, float('inf')
+        while frontier and self._priority(goal) > frontier.peek()[1]:
+            if deadline is not None and self.expansions % 64 == 0 and time.perf_counter() >= deadline:
+                return False
+            node, _ = frontier.pop()
+            closed.add(node)
+            self.expansions += 1
+            g_score = g_scores[node]
+            if probe is not None:
+                probe.expand(to_node_name(self.graph, node), g_score=g_score, epsilon=self.epsilon)
+
+            for neighbor, cost in self.graph.get(node, ()):
+                g = g_score + cost
+                if g < g_scores.get(neighbor, inf):
+                    g_scores[neighbor] = g
+                    parent[neighbor] = node
+                    if neighbor in closed:
+                        self.inconsistent.add(neighbor)
+                    else:
+                        if probe is not None:
+                            if neighbor in frontier:
+                                probe.update()
+                            else:
+                                probe.push(len(frontier) + 1)
+                        frontier.push(neighbor, self._priority(neighbor))
+        return True
+
+    def _priority(self, node):
+        g = self.g_scores.get(node, float('inf'))
+        return (g + self.epsilon * self.heuristic(node), g) if g != float('inf') else (g, g)
+
+    def _proven_bound(self):
+        """
+        Return cost / (the least g + h over the unexpanded nodes), which bounds the suboptimality
+        of the current solution more tightly than epsilon usually does.
+        """
+        if self.cost == float('inf'):
+            return float('inf')
+        pending = list(self.frontier) + list(self.inconsistent)
+        lower = min((self.g_scores[node] + self.heuristic(node) for node in pending), default=float('inf'))
+        if lower >= self.cost:
+            return 1.0
+        return min(self.epsilon, self.cost / lower) if lower > 0 else self.epsilon
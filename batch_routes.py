@@ -0,0 +1,149 @@
+from concurrent.futures import ProcessPoolExecutor  # Run independent sources in worker processes
+
+from compact_graph import to_node_id, to_node_names
+from components import component_index
+from search_core import reconstruct_path, shortest_path_tree
+
+_worker_graph = None  # The graph each pool worker searches, sent once when the worker starts
+
+
+class RouteMatrix:
+    """
+    The result of a batch of route queries: a distance for every query and the shortest path
+    trees needed to extract any of their paths on demand.
+    """
+
+    def __init__(self, graph, sources, targets, distances, parents):
+        """
+        Initialize the matrix from the per-source search results.
+
+        Args:
+        graph (dict or CompactGraph): The graph the routes were computed on.
+        sources (list): The source states, in row order.
+        targets (list): The target states, in column order.
+        distances (dict): The settled cost of every reachable query, keyed by source then target.
+        parents (dict): The pruned predecessor map of every source's shortest path tree.
+        """
+        self.graph = graph
+        self.sources = sources
+        self.targets = targets
+        self.distances = distances
+        self.parents = parents
+
+    def distance(self, source, target):
+        """
+        Return the cost of the cheapest route from source to target, or inf if there is none.
+        """
+        return self.distances.get(source, {}).get(target, float('inf'))
+
+    def path(self, source, target):
+        """
+        Extract the cheapest route from source to target from the source's shortest path tree.
+
+        Returns:
+        list: The path from the source to the target, or None if there is none.
+        """
+        if target not in self.distances.get(source, {}):
+            return None
+        return to_node_names(self.graph, reconstruct_path(self.parents[source], to_node_id(self.graph, target)))
+
+    def matrix(self):
+        """
+        Return the distance matrix as a list of rows, one per source, with inf for missing routes.
+        """
+        return [[self.distance(source, target) for target in self.targets] for source in self.sources]
+
+
+def route_matrix(graph, sources, targets, processes=None, components=None):
+    """
+    Compute the cheapest route from every source to every target.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs.
+    sources (iterable): The source states.
+    targets (iterable): The target states.
+    processes (int): The number of worker processes. Sources are searched in this process if omitted.
+    components (ComponentIndex): An optional component index used to skip unreachable targets.
+
+    Returns:
+    RouteMatrix: The distances and the trees to extract paths from.
+    """
+    sources, targets = list(dict.fromkeys(sources)), list(dict.fromkeys(targets))
+    return batch_routes(graph, ((source, target) for source in sources for target in targets),
+                        processes, components, sources, targets)
+
+
+def batch_routes(graph, queries, processes=None, components=None, sources=None, targets=None):
+    """
+    Answer a batch of (source, target) route queries, growing one shortest path tree per source.
+
+    Queries are grouped by source, and each source's tree stops growing as soon as all of its
+    targets are settled, so a source shared by many queries is only searched once.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs.
+    queries (iterable): The (source, target) pairs to answer.
+    processes (int): The number of worker processes. Sources are searched in this process if omitted.
+    components (ComponentIndex): An optional component index used to skip unreachable targets.
+    sources (list): The row order of the result (default is the order sources first appear in).
+    targets (list): The column order of the result (default is the order targets first appear in).
+
+    Returns:
+    RouteMatrix: The distances and the trees to extract paths from.
+    """
+    components = component_index(graph, components)
+    grouped = {}  # Targets of each source, in the order they were asked for
+    for source, target in queries:
+        grouped.setdefault(source, {})
+        if components is None or components.reachable(source, target):
+            grouped[source][target] = None
+    if sources is None:
+        sources = list(grouped)
+    if targets is None:
+        targets = list(dict.fromkeys(target for wanted in grouped.values() for target in wanted))
+
+    jobs = [(to_node_id(graph, source), [to_node_id(graph, target) for target in wanted])
+            for source, wanted in grouped.items()]
+    if processes is None or processes <= 1 or len(jobs) <= 1:
+        results = [_source_tree(graph, source, wanted) for source, wanted in jobs]
+    else:
+        with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(graph,)) as pool:
+            results = list(pool.map(_worker_source_tree, jobs))
+
+    distances, parents = {}, {}
+    for source, (settled, parent) in zip(grouped, results):
+        distances[source] = {target: settled[to_node_id(graph, target)] for target in grouped[source]
+                             if to_node_id(graph, target) in settled}
+        parents[source] = parent
+    return RouteMatrix(graph, sources, targets, distances, parents)
+
+
+def _source_tree(graph, source, targets):
+    """
+    Grow one source's shortest path tree until its targets are settled.
+
+    Returns:
+    tuple: The settled cost of every reached target and the predecessor map pruned to the
+        branches leading to them, which is all that path extraction needs.
+    """
+    if not targets:
+        return {}, {}
+    distances, parent = shortest_path_tree(graph, source, set(targets))
+    settled = {target: distances[target] for target in targets if target in distances}
+    pruned = {}
+    for target in settled:
+        node = target
+        while node is not None and node not in pruned:
+            pruned[node] = parent[node]
+            node = parent[node]
+    return settled, pruned
+
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _worker_source_tree(job):
+    source, targets = job
+    return _source_tree(_worker_graph, source, targets)
@@ -0,0 +1,268 @@
+import argparse  # Import argparse for the command line
+import importlib.util  # Load the Q scripts, whose file names are not valid module names
+import json  # Import json for the saved baselines
+import math
+import os
+import platform
+import random  # Import random for reproducible queries
+import sys
+import time  # Import time for the latency measurements
+
+from instrumentation import SearchProbe
+from synthetic_graphs import game_tree, geometric_graph, grid_graph, scale_free_graph, unweighted_graph
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+GRAPH_GENERATORS = {
+    "grid": lambda size, seed: grid_graph(max(1, round(size ** 0.5)), seed=seed),
+    "geometric": lambda size, seed: geometric_graph(size, seed=seed),
+    "scale_free": lambda size, seed: scale_free_graph(size, seed=seed),
+}
+
+
+def load_script(file_name):
+    """
+    Import one of the Q scripts from the repository root by file name.
+
+    Args:
+    file_name (str): The script file, such as "Q-2.py".
+
+    Returns:
+    module: The imported module. Its demo does not run, since it is not __main__.
+    """
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    module_name = "bench_" + os.path.splitext(file_name)[0].replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, file_name))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module  # Lets worker processes unpickle the module's classes
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(sorted_values, fraction):
+    """
+    Return the nearest-rank percentile of an ascending list, such as fraction 0.9 for p90.
+    """
+    if not sorted_values:
+        return float('nan')
+    return sorted_values[max(1, math.ceil(len(sorted_values) * fraction)) - 1]
+
+
+def measure(workload, engine, nodes, calls, probe_call):
+    """
+    Time a list of calls and profile one extra call with a memory-tracking probe.
+
+    Args:
+    workload (str): The name of the graph or tree the calls run on.
+    engine (str): The name of the timed search.
+    nodes (int): The size of the workload.
+    calls (list): Zero-argument callables, one per query, timed without instrumentation.
+    probe_call (callable): Runs the first query again with the probe it is given.
+
+    Returns:
+    dict: The latency percentiles in milliseconds, the throughput in queries per second, the
+        expansions of the profiled query and its peak traced memory in bytes.
+    """
+    latencies = []
+    for call in calls:
+        started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    total = sum(latencies)
+
+    probe = SearchProbe(track_memory=True)
+    probe_call(probe)
+    return {
+        "workload": workload,
+        "engine": engine,
+        "nodes": nodes,
+        "queries": len(latencies),
+        "mean_ms": 1000 * total / len(latencies),
+        "p50_ms": 1000 * percentile(latencies, 0.5),
+        "p90_ms": 1000 * percentile(latencies, 0.9),
+        "p99_ms": 1000 * percentile(latencies, 0.99),
+        "throughput_qps": len(latencies) / total if total else float('inf'),
+        "expansions": probe.expansions,
+        "peak_memory_bytes": probe.peak_memory,
+    }
+
+
+def benchmark_graph(modules, workload, graph, queries, goal_count=5, seed=0):
+    """
+    Time every graph search engine on random queries against one graph.
+
+    Args:
+    modules (dict): The loaded Q scripts, keyed by file name.
+    workload (str): The name of the graph.
+    graph (dict): The graph in the adjacency_dict_costs format.
+    queries (int): The number of random (start, goal) queries per engine.
+    goal_count (int): The number of goals of each customized uniform cost search query.
+    seed (int): The random seed of the queries.
+
+    Returns:
+    list: One result dictionary per engine.
+    """
+    q1, q2, q3 = modules["Q-1search_strategies.py"], modules["Q-2.py"], modules["Q-3AStarSearch.py"]
+    rng = random.Random(seed)
+    nodes = list(graph)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(queries)]
+    goal_sets = [set(rng.sample(nodes, min(goal_count, len(nodes)))) for _ in range(queries)]
+    unweighted = unweighted_graph(graph)
+    a_star = q3.AStarSearch(graph)
+    a_star.heuristic_for(nodes[0])  # Build the landmark tables before the clock starts
+
+    engines = {
+        "bfs": lambda start, goal, probe=None: q1.SearchStrategies(unweighted, start, goal).bfs(probe),
+        "dfs": lambda start, goal, probe=None: q1.SearchStrategies(unweighted, start, goal).dfs(probe),
+        "uniform_cost_search": lambda start, goal, probe=None: q2.uniform_cost_search(graph, start, goal, probe=probe),
+        "a_star_search": lambda start, goal, probe=None: a_star.a_star_search(start, goal, probe),
+    }
+    results = []
+    for engine, search in engines.items():
+        calls = [lambda start=start, goal=goal, search=search: search(start, goal) for start, goal in pairs]
+        results.append(measure(workload, engine, len(nodes), calls,
+                               lambda probe, search=search: search(*pairs[0], probe)))
+
+    calls = [lambda start=start, goals=goals: q2.customized_uniform_cost_search(graph, start, goals)
+             for (start, _), goals in zip(pairs, goal_sets)]
+    results.append(measure(workload, "customized_uniform_cost_search", len(nodes), calls,
+                           lambda probe: q2.customized_uniform_cost_search(graph, pairs[0][0], goal_sets[0], probe=probe)))
+    return results
+
+
+def benchmark_game_tree(module, depth, branching, repeats, seed=0):
+    """
+    Time best_move on a synthetic game tree with both search algorithms.
+
+    Every call gets a fresh MiniMaxSearch, so the transposition table of one call does not
+    answer the next.
+
+    Returns:
+    list: One result dictionary per algorithm.
+    """
+    root = game_tree(module.Node, depth, branching, seed)
+    workload = f"game_tree-d{depth}-b{branching}"
+    nodes = sum(branching ** level for level in range(depth + 1))
+    results = []
+    for algorithm in ("alphabeta", "minimax"):
+        def search(probe=None, algorithm=algorithm):
+            return module.MiniMaxSearch(root, probe=probe).best_move(depth, algorithm)
+
+        results.append(measure(workload, f"best_move[{algorithm}]", nodes, [search] * repeats, search))
+    return results
+
+
+def run_benchmarks(kinds=tuple(GRAPH_GENERATORS), sizes=(1000, 10000), queries=20,
+                   tree_shapes=((6, 4), (8, 3)), seed=0, report=None):
+    """
+    Generate every requested workload and time the search engines on it.
+
+    Args:
+    kinds (iterable): The graph generators to use, from GRAPH_GENERATORS.
+    sizes (iterable): The approximate node counts of the graphs.
+    queries (int): The number of queries per engine and graph, and of repeats per game tree.
+    tree_shapes (iterable): The (depth, branching) pairs of the game trees.
+    seed (int): The random seed of the graphs, trees and queries.
+    report (callable): An optional function called with every result as soon as it is ready.
+
+    Returns:
+    list: The result dictionaries.
+    """
+    modules = {name: load_script(name) for name in ("Q-1search_strategies.py", "Q-2.py", "Q-3AStarSearch.py",
+                                                    "Q-4MiniMaxSearch.py")}
+    results = []
+    for kind in kinds:
+        for size in sizes:
+            graph = GRAPH_GENERATORS[kind](size, seed)
+            for result in benchmark_graph(modules, f"{kind}-{size}", graph, queries, seed=seed):
+                results.append(result)
+                if report is not None:
+                    report(result)
+    for depth, branching in tree_shapes:
+        for result in benchmark_game_tree(modules["Q-4MiniMaxSearch.py"], depth, branching, queries, seed):
+            results.append(result)
+            if report is not None:
+                report(result)
+    return results
+
+
+def save_baseline(path, results):
+    """
+    Write the results to a JSON baseline file together with a description of the machine.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }, file, indent=2)
+
+
+def compare_baseline(path, results, tolerance=0.25):
+    """
+    Compare results against a saved baseline.
+
+    Args:
+    path (str): The baseline file written by save_baseline().
+    results (list): The new result dictionaries.
+    tolerance (float): The relative increase of the median latency or peak memory that counts as
+        a regression (default is 0.25, i.e. 25%).
+
+    Returns:
+    list: A (workload, engine, metric, baseline value, new value) tuple for every regression.
+    """
+    with open(path, encoding="utf-8") as file:
+        baseline = {(result["workload"], result["engine"]): result for result in json.load(file)["results"]}
+    regressions = []
+    for result in results:
+        old = baseline.get((result["workload"], result["engine"]))
+        if old is None:
+            continue
+        for metric in ("p50_ms", "peak_memory_bytes"):
+            if result[metric] > old[metric] * (1 + tolerance):
+                regressions.append((result["workload"], result["engine"], metric, old[metric], result[metric]))
+    return regressions
+
+
+def print_result(result):
+    print(f"{result['workload']:<24} {result['engine']:<32} {result['p50_ms']:>10.3f} {result['p90_ms']:>10.3f} "
+          f"{result['p99_ms']:>10.3f} {result['throughput_qps']:>12.1f} {result['peak_memory_bytes'] / 1024:>12.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the search engines on synthetic graphs and game trees.")
+    parser.add_argument("--kinds", default=",".join(GRAPH_GENERATORS),
+                        help="comma separated graph generators (default: all)")
+    parser.add_argument("--sizes", default="1000,10000", help="comma separated node counts, up to 1e7")
+    parser.add_argument("--queries", type=int, default=20, help="queries per engine and workload")
+    parser.add_argument("--trees", default="6x4,8x3", help="comma separated game tree shapes as DEPTHxBRANCHING")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the results to this JSON baseline")
+    parser.add_argument("--compare", help="compare the results against this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    args = parser.parse_args(argv)
+
+    print(f"{'Workload':<24} {'Engine':<32} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'queries/s':>12} {'peak KiB':>12}")
+    results = run_benchmarks(
+        kinds=[kind for kind in args.kinds.split(",") if kind],
+        sizes=[int(float(size)) for size in args.sizes.split(",") if size],
+        queries=args.queries,
+        tree_shapes=[tuple(int(part) for part in shape.split("x")) for shape in args.trees.split(",") if shape],
+        seed=args.seed,
+        report=print_result,
+    )
+    if args.save:
+        save_baseline(args.save, results)
+    if args.compare:
+        regressions = compare_baseline(args.compare, results, args.tolerance)
+        for workload, engine, metric, old, new in regressions:
+            print(f"Regression: {workload} {engine} {metric} {old:.3f} -> {new:.3f}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+from compact_graph import to_node_name
+from instrumentation import probe_phase
+from search_core import IndexedHeap
+
+
+def ida_star_search(graph, start, goal, heuristic=None, table_size=1 << 16, probe=None):
+    """
+    Find the least-cost path from start to goal with iterative deepening A* (IDA*).
+
+    Each iteration is a depth-first search that cuts off paths whose f = g + h exceeds a
+    threshold, which then rises to the smallest f that was cut off. Memory is the current path
+    plus a transposition table of at most table_size entries: a node reached again within an
+    iteration at no lower cost than before is pruned, since its subtree was already searched
+    under the same threshold. Nodes already on the current path are skipped to break cycles.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs, keyed by search keys. Any
+        object with a dict-like get(node, default) returning (neighbor, cost) pairs will do, so
+        the graph can be generated on the fly.
+    start: The start key.
+    goal: The goal key.
+    heuristic (callable): An optional admissible estimate h(node) of the cost to the goal.
+    table_size (int): The most nodes the transposition table holds; 0 disables it.
+    probe (SearchProbe): An optional probe told about every expansion and frontier push. The
+        search runs a phase named "search" on it but leaves start() and finish() to the caller.
+
+    Returns:
+    tuple: The path from the start to the goal and its cost, or (None, inf) if the goal is unreachable.
+    """
+    with probe_phase(probe, "search"):
+        return _ida_star_search(graph, start, goal, heuristic or (lambda node: 0), table_size, probe)
+
+
+def _ida_star_search(graph, start, goal, heuristic, table_size, probe):
+    if start == goal:
+        return [start], 0
+    inf = float('inf')
+    threshold = heuristic(start)
+    while threshold < inf:
+        next_threshold = inf
+        path, g_scores = [start], [0]
+        on_path = {start}
+        edges = [iter(graph.get(start, ()))]  # Unexplored edges of every node on the path
+        table = {start: 0}  # Lowest cost at which each node was reached in this iteration
+        if probe is not None:
+            probe.push(1)
+            probe.expand(to_node_name(graph, start), g_score=0, f_score=threshold, threshold=threshold)
+
+        while edges:
+            g_score = g_scores[-1]
+            for neighbor, cost in edges[-1]:
+                if neighbor in on_path:
+                    continue
+                g = g_score + cost
+                f = g + heuristic(neighbor)
+                if f > threshold:
+                    if f < next_threshold:
+                        next_threshold = f
+                    continue
+                if table.get(neighbor, inf) <= g:
+                    if probe is not None:
+                        probe.stale_pop()
+                    continue
+                if neighbor in table or len(table) < table_size:
+                    table[neighbor] = g
+                if neighbor == goal:
+                    path.append(neighbor)
+                    return path, g
+
+                path.append(neighbor)
+                g_scores.append(g)
+                on_path.add(neighbor)
+                edges.append(iter(graph.get(neighbor, ())))
+                if probe is not None:
+                    probe.push(len(path))
+                    probe.expand(to_node_name(graph, neighbor), g_score=g, f_score=f, threshold=threshold)
+                break
+            else:
+                # Every edge of the deepest node is explored, backtrack
+                edges.pop()
+                g_scores.pop()
+                on_path.discard(path.pop())
+        threshold = next_threshold
+    return None, inf
+
+
+class _TreeNode:
+    """
+    A node of the SMA* search tree. The same state can appear in several branches.
+    """
+
+    __slots__ = ("state", "g", "f", "depth", "parent", "children", "forgotten", "expanded")
+
+    def __init__(self, state, g, f, depth, parent):
+        self.state = state
+        self.g = g
+        self.f = f  # Backed-up lower bound on the cost of any solution below this node
+        self.depth = depth
+        self.parent = parent
+        self.children = {}  # State -> child node held in memory
+        self.forgotten = {}  # State -> (backed-up f, g) of every evicted child
+        self.expanded = False
+
+
+def sma_star_search(graph, start, goal, heuristic=None, max_nodes=100000, probe=None):
+    """
+    Find the least-cost path from start to goal with simplified memory-bounded A* (SMA*).
+
+    The search runs A* over a tree of at most max_nodes nodes. When the tree is full, the
+    shallowest of the leaves with the highest f is evicted and its f is remembered by its
+    parent, which regenerates it only once everything cheaper has been explored. Every parent's
+    f is backed up to the lowest f of its children, so no evicted subtree is forgotten entirely.
+    The path found is optimal whenever it fits in memory with the nodes it competes with; a
+    state that cannot be reached within max_nodes tree nodes is treated as unreachable.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs, keyed by search keys. Any
+        object with a dict-like get(node, default) returning (neighbor, cost) pairs will do.
+    start: The start key.
+    goal: The goal key.
+    heuristic (callable): An optional admissible estimate h(node) of the cost to the goal.
+    max_nodes (int): The most search tree nodes held at once (default is 100000, at least 2).
+    probe (SearchProbe): An optional probe told about every expansion and frontier push. The
+        search runs a phase named "search" on it but leaves start() and finish() to the caller.
+
+    Returns:
+    tuple: The path from the start to the goal and its cost, or (None, inf) if no path was found
+        within the node limit.
+    """
+    with probe_phase(probe, "search"):
+        return _SMAStar(graph, goal, heuristic or (lambda node: 0), max(2, max_nodes), probe).search(start)
+
+
+class _SMAStar:
+    """
+    The state of one SMA* search: the tree, the frontier ordered by (f, deepest first) and the
+    leaves ordered by (highest f, shallowest first) for eviction.
+    """
+
+    def __init__(self, graph, goal, heuristic, max_nodes, probe):
+        self.graph = graph
+        self.goal = goal
+        self.heuristic = heuristic
+        self.max_nodes = max_nodes
+        self.probe = probe
+        self.frontier = IndexedHeap()  # Unexpanded nodes, and expanded nodes with forgotten children
+        self.leaves = IndexedHeap()  # Nodes without children in memory, except the root
+        self.cheapest = {}  # State -> the node in memory that reaches it at the lowest cost
+        self.used = 0
+
+    def search(self, start):
+        inf, probe = float('inf'), self.probe
+        root = _TreeNode(start, 0, self.heuristic(start), 0, None)
+        self.frontier.push(root, (root.f, 0, 0))
+        self.cheapest[start] = root
+        self.used = 1
+        if probe is not None:
+            probe.push(1)
+
+        while self.frontier:
+            node, (f, _, _) = self.frontier.peek()
+            if f == inf:
+                break
+            if not node.expanded:
+                if node.state == self.goal:
+                    cost, path = node.g, []
+                    while node is not None:
+                        path.append(node.state)
+                        node = node.parent
+                    return path[::-1], cost
+                successors = self._expand(node)
+            else:
+                # Regenerate the most promising evicted child
+                state = min(node.forgotten, key=lambda child: node.forgotten[child][0])
+                f, g = node.forgotten.pop(state)
+                successors = [(f, state, g)]
+
+            self.leaves.remove(node)
+            for f, state, g in successors:
+                self._add_child(node, _TreeNode(state, g, f, node.depth + 1, node))
+            if not node.children and node.parent is not None:
+                self.leaves.push(node, (-node.f, node.depth))
+            self._requeue(node)
+            self._backup(node)
+        return None, inf
+
+    def _expand(self, node):
+        """
+        Mark a node expanded and return its successors as (f, state, g), cheapest first, skipping
+        states already on its path.
+        """
+        node.expanded = True
+        if self.probe is not None:
+            self.probe.expand(to_node_name(self.graph, node.state), g_score=node.g, f_score=node.f,
+                              depth=node.depth)
+        ancestors = set()
+        ancestor = node
+        while ancestor is not None:
+            ancestors.add(ancestor.state)
+            ancestor = ancestor.parent
+        successors = {}
+        for neighbor, cost in self.graph.get(node.state, ()):
+            g = node.g + cost
+            if neighbor not in ancestors and g < successors.get(neighbor, (float('inf'),))[0]:
+                successors[neighbor] = (g, max(node.f, g + self.heuristic(neighbor)))  # Pathmax keeps f monotone
+        return sorted(((f, state, g) for state, (g, f) in successors.items()), key=lambda successor: successor[0])
+
+    def _add_child(self, node, child):
+        """
+        Put a child in the tree, evicting a worse leaf when memory is full. A child whose state is
+        already in memory at no higher cost is dropped, since that node covers everything below
+        it. A child that is worse than every leaf is forgotten straight away; one that no
+        eviction can make room for is out of reach and forgotten with an infinite f.
+        """
+        cheapest = self.cheapest.get(child.state)
+        if cheapest is not None and cheapest.g <= child.g:
+            return
+        if self.used >= self.max_nodes:
+            if not self.leaves:
+                node.forgotten[child.state] = (float('inf'), child.g)
+                return
+            worst, _ = self.leaves.peek()
+            if (worst.f, -worst.depth) < (child.f, -child.depth):
+                node.forgotten[child.state] = (child.f, child.g)
+                return
+            self._evict(worst)
+        node.children[child.state] = child
+        self.cheapest[child.state] = child
+        self.leaves.remove(node)  # The eviction may have taken its last other child
+        self.used += 1
+        self.frontier.push(child, (child.f, -child.depth, 0))
+        self.leaves.push(child, (-child.f, child.depth))
+        if self.probe is not None:
+            self.probe.push(len(self.frontier))
+
+    def _evict(self, leaf):
+        self.leaves.remove(leaf)
+        self.frontier.remove(leaf)
+        self.used -= 1
+        if self.cheapest.get(leaf.state) is leaf:
+            del self.cheapest[leaf.state]
+        parent = leaf.parent
+        del parent.children[leaf.state]
+        parent.forgotten[leaf.state] = (leaf.f, leaf.g)
+        if not parent.children and parent.parent is not None:
+            self.leaves.push(parent, (-parent.f, parent.depth))
+        self._requeue(parent)
+
+    def _requeue(self, node):
+        """
+        Queue a node by the f of what expanding it next would generate.
+        """
+        if not node.expanded:
+            self.frontier.push(node, (node.f, -node.depth, 0))
+        elif node.forgotten:
+            # Behind an unexpanded node of the same f and depth, so a regenerated child is expanded
+            # before its parent can regenerate the sibling it displaced
+            self.frontier.push(node, (min(f for f, _ in node.forgotten.values()), -node.depth - 1, 1))
+        else:
+            self.frontier.remove(node)
+
+    def _backup(self, node):
+        """
+        Raise the f of a node and its ancestors to the lowest f of their children.
+        """
+        while node is not None and node.expanded:
+            f = min([child.f for child in node.children.values()] +
+                    [f for f, _ in node.forgotten.values()], default=float('inf'))
+            if f == node.f:
+                break
+            node.f = f
+            if node in self.leaves:
+                self.leaves.push(node, (-f, node.depth))
+            node = node.parent
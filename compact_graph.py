@@ -0,0 +1,345 @@
+import weakref  # Cache derived views of frozen graphs without keeping the graphs alive
+from array import array  # Import array for flat, typed edge buffers
+
+# Reverse views of CompactGraphs, built on first use
+_reverse_views = weakref.WeakKeyDictionary()
+
+
+class CompactGraph:
+    """
+    A frozen graph that interns city names to integer IDs and stores its edges in CSR form.
+
+    The neighbors of node u are targets[offsets[u]:offsets[u + 1]] with the matching
+    weights in the same slice of the weights buffer. Node names are only needed at the
+    API boundary, so the search loops work on plain integers.
+    """
+
+    __slots__ = ("names", "offsets", "targets", "weights", "weighted", "_index", "__weakref__")
+
+    def __init__(self, names, offsets, targets, weights, weighted=True, index=None):
+        """
+        Initialize the graph from already built CSR buffers.
+
+        Args:
+        names (list): The node names, where names[i] is the name of node i.
+        offsets (sequence): The CSR row offsets, of length len(names) + 1.
+        targets (sequence): The target node ID of every edge.
+        weights (sequence): The weight of every edge.
+        weighted (bool): Whether the source graph carried weights (default is True).
+        index (dict): An optional prebuilt mapping from name to node ID.
+        """
+        self.names = names
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.weighted = weighted
+        self._index = index
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        """
+        Build a compact graph from an adjacency dictionary.
+
+        Args:
+        graph (dict): Either an unweighted graph mapping a node to a list of neighbor names
+            (as in Q-1) or a weighted graph mapping a node to a list of (neighbor, cost) tuples.
+
+        Returns:
+        CompactGraph: The interned, CSR encoded graph.
+        """
+        index = {}
+        names = []
+
+        def intern(name):
+            node_id = index.get(name)
+            if node_id is None:
+                node_id = index[name] = len(names)
+                names.append(name)
+            return node_id
+
+        # Intern the keys first so that a node keeps the position it had in the dict
+        for name in graph:
+            intern(name)
+
+        weighted = any(isinstance(edge, tuple) for edges in graph.values() for edge in edges)
+        rows = {}
+        for name, edges in graph.items():
+            if weighted:
+                rows[index[name]] = [(intern(neighbor), cost) for neighbor, cost in edges]
+            else:
+                rows[index[name]] = [(intern(neighbor), 1) for neighbor in edges]
+
+        costs = [cost for row in rows.values() for _, cost in row]
+        typecode = "q" if all(isinstance(cost, int) for cost in costs) else "d"
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array(typecode)
+        for node_id in range(len(names)):
+            for neighbor, cost in rows.get(node_id, ()):
+                targets.append(neighbor)
+                weights.append(cost)
+            offsets.append(len(targets))
+
+        return cls(names, offsets, targets, weights, weighted, index)
+
+    @classmethod
+    def from_edges(cls, names, edges, weighted=True):
+        """
+        Build a compact graph from an iterable of integer edges.
+
+        Args:
+        names (list): The node names, where names[i] is the name of node i.
+        edges (iterable): (source ID, target ID, weight) triples in any order.
+        weighted (bool): Whether the graph should present itself as weighted (default is True).
+
+        Returns:
+        CompactGraph: The CSR encoded graph, keeping the input order of each node's edges.
+        """
+        rows = [[] for _ in names]
+        integral = True
+        for source, target, cost in edges:
+            rows[source].append((target, cost))
+            integral = integral and isinstance(cost, int)
+
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("q" if integral else "d")
+        for row in rows:
+            for target, cost in row:
+                targets.append(target)
+                weights.append(cost)
+            offsets.append(len(targets))
+        return cls(names, offsets, targets, weights, weighted)
+
+    @property
+    def index(self):
+        """
+        The mapping from node name to node ID, built on first use.
+        """
+        if self._index is None:
+            self._index = {name: node_id for node_id, name in enumerate(self.names)}
+        return self._index
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __contains__(self, node_id):
+        return type(node_id) is int and 0 <= node_id < len(self.offsets) - 1
+
+    def __iter__(self):
+        return iter(range(len(self.offsets) - 1))
+
+    @property
+    def edge_count(self):
+        """
+        The number of directed edges stored in the graph.
+        """
+        return self.offsets[-1]
+
+    def node_id(self, name):
+        """
+        Translate a node name into its integer ID.
+
+        Args:
+        name (str): The node name.
+
+        Returns:
+        int: The node ID, or None if the name is not part of the graph.
+        """
+        return self.index.get(name)
+
+    def neighbors(self, node_id):
+        """
+        Return the target IDs of the edges leaving node_id.
+        """
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def edges(self, node_id):
+        """
+        Return an iterator of (target ID, weight) pairs for the edges leaving node_id.
+        """
+        start, end = self.offsets[node_id], self.offsets[node_id + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def get(self, node_id, default=None):
+        """
+        Mirror dict.get so that engines written against adjacency dictionaries run unchanged.
+
+        Weighted graphs yield (target, weight) pairs and unweighted graphs yield plain targets,
+        matching the shape of the dictionary the graph was built from.
+        """
+        if node_id not in self:
+            return default
+        return self.edges(node_id) if self.weighted else self.neighbors(node_id)
+
+    def reverse(self):
+        """
+        Build the transposed graph, where every edge u -> v becomes v -> u with the same weight.
+
+        Returns:
+        CompactGraph: The reverse graph, sharing this graph's names.
+        """
+        size = len(self)
+        counts = [0] * (size + 1)
+        for target in self.targets:
+            counts[target + 1] += 1
+        for node_id in range(size):
+            counts[node_id + 1] += counts[node_id]
+
+        offsets = array("q", counts)
+        cursor = counts[:-1]
+        targets = array("q", bytes(8 * len(self.targets)))
+        weights = array(_typecode(self.weights), [0]) * len(self.targets)
+        for source in range(size):
+            for position in range(self.offsets[source], self.offsets[source + 1]):
+                target = self.targets[position]
+                slot = cursor[target]
+                targets[slot] = source
+                weights[slot] = self.weights[position]
+                cursor[target] = slot + 1
+
+        return CompactGraph(self.names, offsets, targets, weights, self.weighted, self._index)
+
+    def to_adjacency(self):
+        """
+        Convert the graph back into the adjacency dictionary format it was built from.
+
+        Returns:
+        dict: The adjacency dictionary keyed by node name.
+        """
+        names = self.names
+        if self.weighted:
+            return {names[u]: [(names[v], w) for v, w in self.edges(u)] for u in self}
+        return {names[u]: [names[v] for v in self.neighbors(u)] for u in self}
+
+
+def _typecode(buffer):
+    """
+    Return the array typecode of a weight buffer, which may be an array or a memoryview.
+    """
+    return getattr(buffer, "typecode", None) or getattr(buffer, "format", "d")
+
+
+def reverse_view(graph):
+    """
+    Return the graph with every edge reversed, in the same format as the graph itself.
+
+    The reverse view of a CompactGraph is built once and cached, since the graph is frozen.
+    Adjacency dictionaries may change between calls, so their reverse is rebuilt every time.
+
+    Args:
+    graph (dict or CompactGraph): The graph to reverse, weighted or unweighted.
+
+    Returns:
+    dict or CompactGraph: The reverse graph.
+    """
+    if isinstance(graph, CompactGraph):
+        reverse = _reverse_views.get(graph)
+        if reverse is None:
+            reverse = _reverse_views[graph] = graph.reverse()
+        return reverse
+
+    reverse = {node: [] for node in graph}
+    for node, edges in graph.items():
+        for edge in edges:
+            if isinstance(edge, tuple):
+                neighbor, cost = edge
+                reverse.setdefault(neighbor, []).append((node, cost))
+            else:
+                reverse.setdefault(edge, []).append(node)
+    return reverse
+
+
+def graph_nodes(graph):
+    """
+    Return every search key of a graph, including nodes that only appear as edge targets.
+    """
+    if isinstance(graph, CompactGraph):
+        return list(graph)
+    nodes = dict.fromkeys(graph)
+    for node in graph:
+        nodes.update(dict.fromkeys(successor_keys(graph, node)))
+    return list(nodes)
+
+
+def successor_keys(graph, node):
+    """
+    Return the search keys of the successors of node, whether or not the graph is weighted.
+    """
+    if isinstance(graph, CompactGraph):
+        return graph.neighbors(node) if node in graph else ()
+    return [edge[0] if isinstance(edge, tuple) else edge for edge in graph.get(node, ())]
+
+
+def to_node_id(graph, name):
+    """
+    Translate a node name into the key the graph's search loops use.
+
+    Adjacency dictionaries are keyed by name, so the name is returned unchanged. Unknown
+    names are also returned unchanged, which the search loops treat as a node without edges.
+    """
+    if isinstance(graph, CompactGraph):
+        node_id = graph.node_id(name)
+        return name if node_id is None else node_id
+    return name
+
+
+def to_node_name(graph, node_id):
+    """
+    Translate a search key back into a node name.
+    """
+    if isinstance(graph, CompactGraph) and node_id in graph:
+        return graph.names[node_id]
+    return node_id
+
+
+def to_node_names(graph, path):
+    """
+    Translate a path of search keys back into node names.
+    """
+    if path is None or not isinstance(graph, CompactGraph):
+        return path
+    names = graph.names
+    return [names[node_id] if node_id in graph else node_id for node_id in path]
+
+
+# Callbacks to run when an adjacency dictionary is edited, keyed by id() since dicts cannot be weakly referenced
+_edit_watchers = {}
+
+
+def watch_edits(graph, callback):
+    """
+    Register a callback that graph_edited() runs whenever the edges of an adjacency dictionary change.
+
+    Args:
+    graph (dict): The adjacency dictionary to watch.
+    callback (callable): A function taking the state whose outgoing edges changed, or None when
+        any edge may have changed. Bound methods are held weakly, so watching a graph does not
+        keep their object alive.
+    """
+    reference = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+    _edit_watchers.setdefault(id(graph), []).append(reference)
+
+
+def graph_edited(graph, start=None):
+    """
+    Tell the watchers of an adjacency dictionary that its edges changed.
+
+    ShortestPathCache and EdgeCosts call this from their edge editing methods. Call it yourself
+    after editing the dictionary directly, so derived data such as landmark tables is rebuilt.
+
+    Args:
+    graph (dict): The edited adjacency dictionary.
+    start (str): The state whose outgoing edges changed, or None if any edge may have changed.
+    """
+    watchers = _edit_watchers.pop(id(graph), None)
+    if not watchers:
+        return
+    live = []
+    for reference in watchers:
+        callback = reference()
+        if callback is not None:
+            callback(start)
+            live.append(reference)
+    if live:
+        _edit_watchers.setdefault(id(graph), []).extend(live)
@@ -0,0 +1,195 @@
+import weakref  # Cache indexes of frozen graphs without keeping the graphs alive
+
+from compact_graph import CompactGraph, graph_nodes, successor_keys, to_node_id, watch_edits  # Graph format helpers
+
+# Component indexes of CompactGraphs, built on first use. CompactGraphs are frozen, so a cached index never goes stale.
+_compact_indexes = weakref.WeakKeyDictionary()
+
+
+class ComponentIndex:
+    """
+    A strongly connected component index that answers reachability queries without searching.
+
+    Every node is labelled with its strongly connected component, and every component stores
+    its successors in the condensation DAG. The set of components a component can reach is only
+    computed, as an integer bitset, the first time a query starts in it, so graphs with many
+    singleton components do not pay for a full transitive closure up front.
+
+    An index over an adjacency dictionary watches it through watch_edits(), so edits reported
+    with graph_edited() mark it stale and the next query rebuilds it.
+    """
+
+    def __init__(self, graph):
+        """
+        Initialize the index and build it for the current state of the graph.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph, weighted or unweighted.
+        """
+        self.graph = graph
+        self.component = {}  # Component ID of every node
+        self.successors = []  # Successor components of each component in the condensation DAG
+        self.reach = {}  # Bitset of the components reachable from each queried source component
+        self.stale = False  # Whether the graph changed since the index was built
+        self.refresh()
+        if not isinstance(graph, CompactGraph):
+            watch_edits(graph, self.invalidate)
+
+    def refresh(self):
+        """
+        Rebuild the index. Call this after editing the edges of an adjacency dictionary.
+        """
+        self.component, self.successors = _strongly_connected_components(self.graph)
+        self.reach = {}
+        self.stale = False
+
+    def invalidate(self, start=None):
+        """
+        Mark the index stale so the next query rebuilds it. graph_edited() calls this, so a burst
+        of edits costs one rebuild. The edited state given as start is not used.
+        """
+        self.stale = True
+
+    def reachable(self, start, goal):
+        """
+        Check whether goal can be reached from start.
+
+        Args:
+        start (str): The initial state.
+        goal (str): The goal state.
+
+        Returns:
+        bool: True if a path from start to goal exists.
+        """
+        if start == goal:
+            return True
+        if self.stale:
+            self.refresh()
+        source = self.component.get(to_node_id(self.graph, start))
+        target = self.component.get(to_node_id(self.graph, goal))
+        if source is None or target is None or target > source:
+            return False  # Components are numbered in reverse topological order
+        return (self._reach_from(source) >> target) & 1 == 1
+
+    def _reach_from(self, source):
+        """
+        Return the bitset of the components reachable from a component, computing it on first use.
+        """
+        bits = self.reach.get(source)
+        if bits is None:
+            bits = 1 << source
+            pending = [source]
+            while pending:
+                for successor in self.successors[pending.pop()]:
+                    known = self.reach.get(successor)
+                    if known is not None:
+                        bits |= known
+                    elif not (bits >> successor) & 1:
+                        bits |= 1 << successor
+                        pending.append(successor)
+            self.reach[source] = bits
+        return bits
+
+    def unreachable_goals(self, start, goals):
+        """
+        List the goals of a multi-goal request that cannot be reached from start.
+
+        Args:
+        start (str): The initial state.
+        goals (set): The set of goal states.
+
+        Returns:
+        set: The goals that no path from start reaches.
+        """
+        return {goal for goal in goals if not self.reachable(start, goal)}
+
+
+def component_index(graph, components=None):
+    """
+    Pick the component index an engine should consult before searching.
+
+    Args:
+    graph (dict or CompactGraph): The graph being searched.
+    components (ComponentIndex): An index supplied by the caller, which takes precedence.
+
+    Returns:
+    ComponentIndex: The caller's index, a cached index for a CompactGraph, or None for a
+        dictionary without a supplied index, since a dictionary may have changed since any
+        index was built for it.
+    """
+    if components is not None:
+        return components
+    if isinstance(graph, CompactGraph):
+        index = _compact_indexes.get(graph)
+        if index is None:
+            index = _compact_indexes[graph] = ComponentIndex(graph)
+        return index
+    return None
+
+
+def _strongly_connected_components(graph):
+    """
+    Label the strongly connected components of a graph with an iterative Tarjan's algorithm.
+
+    Tarjan's algorithm emits components in reverse topological order, so every edge of the
+    condensation DAG leads to a component with a lower ID.
+
+    Returns:
+    tuple: A dictionary mapping each node to its component ID and the list of successor
+        components of each component.
+    """
+    component = {}
+    successors_of = []
+    order = {}  # Discovery order of each visited node
+    low = {}  # Lowest discovery order reachable from each node's DFS subtree
+    stack = []  # Nodes of the components that are still open
+    on_stack = set()
+
+    for root in graph_nodes(graph):
+        if root in order:
+            continue
+        work = [(root, iter(successor_keys(graph, root)))]
+        order[root] = low[root] = len(order)
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for successor in successors:
+                if successor not in order:
+                    order[successor] = low[successor] = len(order)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(successor_keys(graph, successor))))
+                    advanced = True
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], order[successor])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+
+            if low[node] == order[node]:
+                # Pop the finished component and record the components its edges lead to
+                component_id = len(successors_of)
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component[member] = component_id
+                    members.append(member)
+                    if member == node:
+                        break
+                successors = set()
+                for member in members:
+                    for successor in successor_keys(graph, member):
+                        successors.add(component[successor])
+                successors.discard(component_id)
+                successors_of.append(tuple(successors))
+
+    return component, successors_of
@@ -0,0 +1,307 @@
+import heapq  # Import heapq for the witness search queue
+import json  # Import json for the serialized hierarchy
+import weakref  # Cache the hierarchies of frozen graphs without keeping the graphs alive
+
+from compact_graph import CompactGraph, graph_nodes, to_node_name
+from edge_index import DetailedPath, edge_index
+from search_core import IndexedHeap
+
+# Contraction hierarchy of each CompactGraph, built on first use
+_hierarchies = weakref.WeakKeyDictionary()
+
+
+class ContractionHierarchy:
+    """
+    A contraction hierarchy over a static weighted graph, answering point-to-point queries with
+    two small upward searches instead of a search over the whole graph.
+
+    Nodes are contracted one by one in order of importance. Contracting a node adds a shortcut
+    u -> x for every pair of remaining neighbors whose only shortest connection runs through it.
+    A query then only relaxes edges towards more important nodes: forward from the start and,
+    over reversed edges, backward from the goal.
+    """
+
+    def __init__(self, names, rank, upward, downward, middle):
+        """
+        Initialize the hierarchy from built or loaded parts. Use build() or load() to create one.
+
+        Args:
+        names (list): The node names, where names[i] is the name of node i.
+        rank (list): The contraction rank of every node.
+        upward (CompactGraph): The edges u -> x with rank[u] < rank[x].
+        downward (CompactGraph): The edges u -> x with rank[u] > rank[x], stored reversed as x -> u.
+        middle (dict): The contracted node of every shortcut, keyed by (u, x).
+        """
+        self.names = names
+        self.index = {name: node_id for node_id, name in enumerate(names)}
+        self.rank = rank
+        self.upward = upward
+        self.downward = downward
+        self.middle = middle
+
+    @classmethod
+    def build(cls, graph, witness_settle_limit=64):
+        """
+        Contract every node of a graph and build the hierarchy.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph with costs.
+        witness_settle_limit (int): The number of nodes a witness search may settle before it gives
+            up and a shortcut is added anyway (default is 64). Lower limits build faster but add
+            more shortcuts.
+
+        Returns:
+        ContractionHierarchy: The built hierarchy.
+        """
+        keys = graph_nodes(graph)
+        position = {key: node_id for node_id, key in enumerate(keys)}
+        names = [to_node_name(graph, key) for key in keys]
+        out_edges = [{} for _ in keys]  # Remaining edges leaving each node, cheapest per target
+        in_edges = [{} for _ in keys]  # Remaining edges entering each node, cheapest per source
+        for key in keys:
+            u = position[key]
+            for neighbor, cost in graph.get(key, ()):
+                x = position[neighbor]
+                if x != u and cost < out_edges[u].get(x, float('inf')):
+                    out_edges[u][x] = in_edges[x][u] = cost
+
+        all_edges = {(u, x): cost for u in range(len(keys)) for x, cost in out_edges[u].items()}
+        middle = {}
+        contracted = [False] * len(keys)
+        deleted_neighbors = [0] * len(keys)
+
+        def shortcuts_for(v, settle_limit=witness_settle_limit):
+            # Find the shortcuts needed to bypass v, running one witness search per in-neighbor
+            shortcuts = []
+            targets = {x: cost for x, cost in out_edges[v].items() if not contracted[x]}
+            for u, in_cost in in_edges[v].items():
+                if contracted[u] or not targets:
+                    continue
+                limit = in_cost + max(targets.values())
+                witness = _witness_distances(out_edges, contracted, u, v, limit, settle_limit)
+                for x, out_cost in targets.items():
+                    if x != u and witness.get(x, float('inf')) > in_cost + out_cost:
+                        shortcuts.append((u, x, in_cost + out_cost))
+            return shortcuts
+
+        def priority(v):
+            # Edge difference plus contracted neighbors, estimated with cheaper witness searches
+            degree = len(in_edges[v]) + len(out_edges[v])
+            return len(shortcuts_for(v, max(1, witness_settle_limit // 4))) - degree + deleted_neighbors[v]
+
+        # Neighbors are re-prioritized after every contraction, and a popped node whose priority has
+        # grown in the meantime goes back into the queue
+        queue = IndexedHeap()
+        for v in range(len(keys)):
+            queue.push(v, priority(v))
+        rank = [0] * len(keys)
+        next_rank = 0
+        while queue:
+            v, _ = queue.pop()
+            current = priority(v)
+            if queue and current > queue.peek()[1]:
+                queue.push(v, current)
+                continue
+
+            for u, x, cost in shortcuts_for(v):
+                if cost < out_edges[u].get(x, float('inf')):
+                    out_edges[u][x] = in_edges[x][u] = cost
+                    all_edges[(u, x)] = cost
+                    middle[(u, x)] = v
+            contracted[v] = True
+            rank[v] = next_rank
+            next_rank += 1
+            neighbors = set(out_edges[v]) | set(in_edges[v])
+            for neighbor in neighbors:
+                deleted_neighbors[neighbor] += 1
+                in_edges[neighbor].pop(v, None)
+                out_edges[neighbor].pop(v, None)
+            for neighbor in neighbors:
+                queue.push(neighbor, priority(neighbor))
+
+        upward = CompactGraph.from_edges(names, ((u, x, c) for (u, x), c in all_edges.items() if rank[u] < rank[x]))
+        downward = CompactGraph.from_edges(names, ((x, u, c) for (u, x), c in all_edges.items() if rank[u] > rank[x]))
+        return cls(names, rank, upward, downward, middle)
+
+    def search(self, start, goal):
+        """
+        Find the least-cost path from start to goal with an upward bidirectional search.
+
+        Args:
+        start (str): The initial state.
+        goal (str): The goal state.
+
+        Returns:
+        tuple: The path from the start to the goal and its cost, or (None, inf) if the goal is unreachable.
+        """
+        source, target = self.index.get(start), self.index.get(goal)
+        if source is None or target is None:
+            return ([start], 0) if start == goal else (None, float('inf'))
+
+        g_scores = ({source: 0}, {target: 0})
+        parents = ({source: None}, {target: None})
+        frontiers = (IndexedHeap(), IndexedHeap())
+        frontiers[0].push(source, 0)
+        frontiers[1].push(target, 0)
+        graphs = (self.upward, self.downward)
+        best_cost, meeting = (0, source) if source == target else (float('inf'), None)
+
+        while True:
+            # A direction stops once its minimum can no longer improve the best meeting point
+            active = [side for side in (0, 1) if frontiers[side] and frontiers[side].peek()[1] < best_cost]
+            if not active:
+                break
+            side = min(active, key=lambda side: len(frontiers[side]))
+            node, cost = frontiers[side].pop()
+            other = g_scores[1 - side]
+            if node in other and cost + other[node] < best_cost:
+                best_cost, meeting = cost + other[node], node
+            for neighbor, weight in graphs[side].edges(node):
+                g = cost + weight
+                if neighbor not in g_scores[side] or g < g_scores[side][neighbor]:
+                    g_scores[side][neighbor] = g
+                    parents[side][neighbor] = node
+                    frontiers[side].push(neighbor, g)
+
+        if meeting is None:
+            return None, float('inf')
+
+        hierarchy_path = []
+        node = meeting
+        while node is not None:
+            hierarchy_path.append(node)
+            node = parents[0][node]
+        hierarchy_path.reverse()
+        node = parents[1][meeting]
+        while node is not None:
+            hierarchy_path.append(node)
+            node = parents[1][node]
+        return [self.names[node] for node in self._unpack(hierarchy_path)], best_cost
+
+    def _unpack(self, path):
+        """
+        Replace every shortcut on a hierarchy path by the original edges it stands for.
+        """
+        unpacked = path[:1]
+        for u, x in zip(path, path[1:]):
+            stack = [(u, x)]
+            while stack:
+                u, x = stack.pop()
+                v = self.middle.get((u, x))
+                if v is None:
+                    unpacked.append(x)
+                else:
+                    stack.append((v, x))  # Second half, unpacked after the first
+                    stack.append((u, v))
+        return unpacked
+
+    def edge_cost(self, u, x):
+        """
+        Return the cost of the hierarchy edge u -> x, given as node IDs, or None if there is none.
+        """
+        graph, source, target = (self.upward, u, x) if self.rank[u] < self.rank[x] else (self.downward, x, u)
+        return edge_index(graph).cost(source, target)
+
+    def detailed_path(self, path):
+        """
+        Provide a detailed breakdown of an unpacked path with costs between nodes.
+
+        Args:
+        path (list): The path from the start to the goal, as returned by search().
+
+        Returns:
+        DetailedPath: The hops with their costs, the total cost and the hops that are not edges.
+            Print it, or call render(), for the formatted breakdown.
+        """
+        return DetailedPath(path, (self.edge_cost(self.index[current_node], self.index[next_node])
+                                   for current_node, next_node in zip(path, path[1:])))
+
+    def save(self, path):
+        """
+        Serialize the hierarchy to a JSON file.
+
+        Args:
+        path (str): The file to write.
+        """
+        def edge_list(graph):
+            return [[u, x, cost] for u in graph for x, cost in graph.edges(u)]
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({
+                "names": self.names,
+                "rank": self.rank,
+                "upward": edge_list(self.upward),
+                "downward": edge_list(self.downward),
+                "middle": [[u, x, v] for (u, x), v in self.middle.items()],
+            }, file)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a hierarchy written by save().
+
+        Args:
+        path (str): The file to read.
+
+        Returns:
+        ContractionHierarchy: The loaded hierarchy.
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        names = data["names"]
+        return cls(
+            names,
+            data["rank"],
+            CompactGraph.from_edges(names, data["upward"]),
+            CompactGraph.from_edges(names, data["downward"]),
+            {(u, x): v for u, x, v in data["middle"]},
+        )
+
+
+def _witness_distances(out_edges, contracted, source, skipped, limit, settle_limit):
+    """
+    Run a bounded Dijkstra from source over the remaining graph without the node being contracted.
+
+    Returns:
+    dict: The tentative distances found, which are upper bounds on the true witness costs.
+    """
+    distances = {source: 0}
+    queue = [(0, source)]
+    settled = 0
+    while queue and settled < settle_limit:
+        cost, node = heapq.heappop(queue)
+        if cost > distances[node]:
+            continue
+        if cost > limit:
+            break
+        settled += 1
+        for neighbor, weight in out_edges[node].items():
+            if neighbor == skipped or contracted[neighbor]:
+                continue
+            g = cost + weight
+            if g < distances.get(neighbor, float('inf')):
+                distances[neighbor] = g
+                heapq.heappush(queue, (g, neighbor))
+    return distances
+
+
+def contraction_hierarchy(graph):
+    """
+    Return the contraction hierarchy of a graph.
+
+    The hierarchy of a CompactGraph is built once and cached, since the graph is frozen.
+    Adjacency dictionaries may change between calls, so their hierarchy is rebuilt every time;
+    build one with ContractionHierarchy.build() and keep it if the graph does not change.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs.
+
+    Returns:
+    ContractionHierarchy: The hierarchy.
+    """
+    if isinstance(graph, CompactGraph):
+        hierarchy = _hierarchies.get(graph)
+        if hierarchy is None:
+            hierarchy = _hierarchies[graph] = ContractionHierarchy.build(graph)
+        return hierarchy
+    return ContractionHierarchy.build(graph)
@@ -0,0 +1,235 @@
+import weakref  # Cache the indexes of frozen graphs without keeping the graphs alive
+from array import array  # Import array for the ragged path offsets
+from bisect import bisect_right
+from itertools import accumulate, compress, repeat
+from operator import add, mul, sub
+
+from compact_graph import CompactGraph, to_node_id
+
+# Edge weight index of each CompactGraph, built on first use
+_edge_indexes = weakref.WeakKeyDictionary()
+
+
+class DetailedPath:
+    """
+    The hops of one path with the cost of each, where a hop without a matching edge has cost None.
+
+    str() renders the "Detailed Path:" breakdown that detailed_path() used to return.
+    """
+
+    __slots__ = ("hops", "total", "invalid")
+
+    def __init__(self, path, costs):
+        """
+        Pair up the hops of a path with their costs.
+
+        Args:
+        path (list): The path, as node names.
+        costs (iterable): The cost of every hop, or None for a hop that is not an edge.
+        """
+        self.hops = [(start, goal, cost) for start, goal, cost in zip(path, path[1:], costs)]
+        self.total = sum(cost for _, _, cost in self.hops if cost is not None)  # Cost of the valid hops
+        self.invalid = [position for position, (_, _, cost) in enumerate(self.hops) if cost is None]
+
+    @property
+    def valid(self):
+        """
+        Whether every hop of the path is an edge of the graph.
+        """
+        return not self.invalid
+
+    def render(self):
+        """
+        Format the path as one line per hop followed by the total cost.
+
+        Returns:
+        str: The formatted breakdown.
+        """
+        lines = ["Detailed Path:"]
+        for start, goal, cost in self.hops:
+            lines.append(f"{start} -> {goal} (No such edge)" if cost is None else f"{start} -> {goal} (Cost: {cost})")
+        lines.append(f"Total Cost: {self.total}")
+        return "\n".join(lines)
+
+    __str__ = render
+
+
+class PathCosts:
+    """
+    The hop and total costs of many paths, stored flat: the hops of path i are
+    hop_costs[hop_offsets[i]:hop_offsets[i + 1]].
+    """
+
+    __slots__ = ("hop_costs", "hop_offsets", "totals", "invalid")
+
+    def __init__(self, hop_costs, hop_offsets, totals, invalid):
+        self.hop_costs = hop_costs  # Cost of every hop of every path, None where there is no edge
+        self.hop_offsets = hop_offsets  # Position of every path's first hop, plus the end
+        self.totals = totals  # Cost of the valid hops of every path
+        self.invalid = invalid  # (path number, hop number) of every hop that is not an edge
+
+    def __len__(self):
+        return len(self.totals)
+
+    def hops(self, path_number):
+        """
+        Return the hop costs of one path.
+        """
+        return self.hop_costs[self.hop_offsets[path_number]:self.hop_offsets[path_number + 1]]
+
+
+class EdgeWeightIndex:
+    """
+    A hash index from (source, target) to edge cost, so costing a hop takes one lookup instead of
+    a scan of the source's neighbor list. Parallel edges collapse to the cheapest one, which is
+    the one a shortest path uses.
+
+    A CompactGraph's edges are keyed by the single integer source * node count + target, so the
+    bulk methods can build every key and look every cost up with C level map() calls.
+    """
+
+    def __init__(self, graph):
+        """
+        Index the edges of a weighted graph.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph with costs. Edits made to an
+            adjacency dictionary afterwards are not seen by the index.
+        """
+        self.graph = graph
+        if isinstance(graph, CompactGraph):
+            node_count = len(graph)
+            offsets = graph.offsets
+            sources = array("q")
+            for u in graph:
+                sources.extend(repeat(u, offsets[u + 1] - offsets[u]))
+            keys = list(map(add, map(mul, sources, repeat(node_count)), graph.targets))
+        else:
+            keys = [(node, neighbor) for node, edges in graph.items() for neighbor, _ in edges]
+        weights = [cost for _, cost in _edges(graph)]
+        self.costs = dict(zip(keys, weights))
+        if len(self.costs) < len(keys):
+            # Parallel edges: the last one won, keep the cheapest instead
+            for key, cost in zip(keys, weights):
+                if cost < self.costs[key]:
+                    self.costs[key] = cost
+
+    def cost(self, start, goal):
+        """
+        Return the cost of the edge start -> goal, given as search keys, or None if there is none.
+        """
+        if isinstance(self.graph, CompactGraph):
+            if not (isinstance(start, int) and isinstance(goal, int) and 0 <= goal < len(self.graph)):
+                return None
+            return self.costs.get(start * len(self.graph) + goal)
+        return self.costs.get((start, goal))
+
+    def detailed_path(self, path):
+        """
+        Cost every hop of a path.
+
+        Args:
+        path (list): The path, as node names.
+
+        Returns:
+        DetailedPath: The hops with their costs. Print it for the formatted breakdown.
+        """
+        keys = [to_node_id(self.graph, name) for name in path]
+        return DetailedPath(path, (self.cost(start, goal) for start, goal in zip(keys, keys[1:])))
+
+    def path_costs(self, paths):
+        """
+        Cost every hop of many paths.
+
+        Args:
+        paths (iterable): The paths as sequences of search keys: node ID arrays for a
+            CompactGraph and lists of names for an adjacency dictionary.
+
+        Returns:
+        PathCosts: The hop costs, totals and invalid hops of every path.
+        """
+        nodes, offsets = [], array("q", [0])
+        for path in paths:
+            nodes.extend(path)
+            offsets.append(len(nodes))
+        return self.ragged_path_costs(nodes, offsets)
+
+    def ragged_path_costs(self, nodes, offsets):
+        """
+        Cost every hop of many paths stored back to back in one ragged array.
+
+        The key of every consecutive pair of nodes is built, the pairs that straddle two paths are
+        dropped, and every cost is gathered with one dict lookup. The totals are differences of a
+        running sum taken at the path boundaries, so no per-path loop touches the hops.
+
+        Args:
+        nodes (sequence): The nodes of all paths, back to back, as search keys.
+        offsets (sequence): The start of every path in nodes, plus the end, as in a CSR row index.
+
+        Returns:
+        PathCosts: The hop costs, totals and invalid hops of every path.
+        """
+        path_count = len(offsets) - 1
+        hop_offsets = array("q", [0])
+        for i in range(path_count):
+            hop_offsets.append(hop_offsets[-1] + max(0, offsets[i + 1] - offsets[i] - 1))
+
+        # A pair j is a hop unless nodes[j + 1] starts a new path
+        is_hop = bytearray([1]) * max(0, len(nodes) - 1)
+        for start in offsets[1:-1]:
+            if 0 < start < len(nodes):
+                is_hop[start - 1] = 0
+
+        if isinstance(self.graph, CompactGraph):
+            node_count = len(self.graph)
+            if nodes and (min(nodes) < 0 or max(nodes) >= node_count):
+                raise ValueError(f"node IDs must be in range(0, {node_count})")
+            pairs = map(add, map(mul, nodes[:-1], repeat(node_count)), nodes[1:])
+        else:
+            pairs = zip(nodes[:-1], nodes[1:])
+        hop_costs = list(map(self.costs.get, compress(pairs, is_hop)))
+
+        invalid = []
+        summable = hop_costs
+        if None in hop_costs:
+            summable = [0 if cost is None else cost for cost in hop_costs]
+            for hop in (position for position, cost in enumerate(hop_costs) if cost is None):
+                path_number = bisect_right(hop_offsets, hop) - 1  # Paths without hops share the offset, take the last
+                invalid.append((path_number, hop - hop_offsets[path_number]))
+
+        running = list(accumulate(summable, initial=0))
+        totals = list(map(sub, map(running.__getitem__, hop_offsets[1:]), map(running.__getitem__, hop_offsets[:-1])))
+        return PathCosts(hop_costs, hop_offsets, totals, invalid)
+
+
+def _edges(graph):
+    """
+    Yield the (target, cost) pair of every edge, in the order EdgeWeightIndex builds its keys.
+    """
+    if isinstance(graph, CompactGraph):
+        yield from zip(graph.targets, graph.weights)
+    else:
+        for edges in graph.values():
+            yield from edges
+
+
+def edge_index(graph):
+    """
+    Return the edge weight index of a graph.
+
+    The index of a CompactGraph is built once and cached, since the graph is frozen. Adjacency
+    dictionaries may change between calls, so their index is rebuilt every time; keep it if the
+    graph does not change.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs.
+
+    Returns:
+    EdgeWeightIndex: The index.
+    """
+    if isinstance(graph, CompactGraph):
+        index = _edge_indexes.get(graph)
+        if index is None:
+            index = _edge_indexes[graph] = EdgeWeightIndex(graph)
+        return index
+    return EdgeWeightIndex(graph)
@@ -0,0 +1,349 @@
+import csv  # Import csv for CSV edge exports
+import mmap  # Map compiled graphs read-only so processes share one copy of the pages
+import struct  # Import struct for the file header
+import sys
+from array import array  # Import array for the per-node counters while compiling
+
+from compact_graph import CompactGraph, _typecode
+
+MAGIC = b"CSRGRAPH"
+VERSION = 1
+# Magic, version, byte order (0 little, 1 big), weighted, weight typecode, nodes, edges
+_HEADER = struct.Struct("<8sIBB1sxQQ")
+_SOURCE_COLUMNS = ("source", "from", "u", "start", "src")
+_TARGET_COLUMNS = ("target", "to", "v", "end", "dst")
+_WEIGHT_COLUMNS = ("weight", "cost", "length", "distance", "travel_time")
+
+
+class MappedNames:
+    """
+    The node names of a mapped graph, decoded from the file one at a time when they are asked for.
+    """
+
+    __slots__ = ("_offsets", "_blob")
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets  # Byte offset of every name in the blob, plus the end
+        self._blob = blob  # The UTF-8 encoded names, back to back
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, node_id):
+        if not 0 <= node_id < len(self._offsets) - 1:
+            raise IndexError(node_id)
+        return str(self._blob[self._offsets[node_id]:self._offsets[node_id + 1]], "utf-8")
+
+    def __iter__(self):
+        offsets, blob = self._offsets, self._blob
+        for node_id in range(len(offsets) - 1):
+            yield str(blob[offsets[node_id]:offsets[node_id + 1]], "utf-8")
+
+
+class MappedGraph(CompactGraph):
+    """
+    A CompactGraph whose CSR buffers are memoryviews into a read-only mapping of a compiled graph file.
+
+    Opening one only reads the header, so it takes milliseconds however large the graph is, and
+    every process that maps the same file shares its pages. The name index is built the first time
+    a name is looked up. Pickling a mapped graph sends only its path, so pool workers map the file
+    themselves instead of receiving a copy.
+    """
+
+    __slots__ = ("path", "_file", "_map")
+
+    def __init__(self, path):
+        """
+        Map a graph file written by compile_edge_list() or save_graph().
+
+        Args:
+        path (str): The graph file.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = self._map[:_HEADER.size]
+        if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a compiled graph file")
+        magic, version, byte_order, weighted, typecode, node_count, edge_count = _HEADER.unpack(header)
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is a version {version} graph file, expected version {VERSION}")
+        if byte_order != (sys.byteorder == "big"):
+            self.close()
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+
+        names, offsets, targets, weights = self._map_buffers()
+        super().__init__(names, offsets, targets, weights, bool(weighted))
+
+    def _map_buffers(self):
+        """
+        Return the names and the offsets, targets and weights buffers as views into the mapping.
+        """
+        _, _, _, _, typecode, node_count, edge_count = _HEADER.unpack(self._map[:_HEADER.size])
+        view = memoryview(self._map)
+        layout = _layout(node_count, edge_count, 0)
+        offsets = view[layout["offsets"]:layout["targets"]].cast("q")
+        targets = view[layout["targets"]:layout["weights"]].cast("q")
+        weights = view[layout["weights"]:layout["name_offsets"]].cast(typecode.decode())
+        name_offsets = view[layout["name_offsets"]:layout["names"]].cast("q")
+        names = MappedNames(name_offsets, view[layout["names"]:])
+        view.release()
+        return names, offsets, targets, weights
+
+    def close(self):
+        """
+        Release the buffers and unmap the file. The graph cannot be searched afterwards.
+
+        Raises:
+        BufferError: If slices returned by neighbors(), edges() or get() are still alive. The
+            graph is left open and usable; drop the slices, or copy them with list(), and retry.
+        """
+        if self._map.closed:
+            return
+        names = getattr(self, "names", None)
+        buffers = [getattr(self, name, None) for name in ("offsets", "targets", "weights")]
+        if isinstance(names, MappedNames):
+            buffers += [names._offsets, names._blob]
+        for buffer in buffers:
+            if isinstance(buffer, memoryview):
+                buffer.release()
+        try:
+            self._map.close()
+        except BufferError:
+            if isinstance(names, MappedNames):
+                # Map the buffers again so the graph stays whole instead of half-closed
+                names, self.offsets, self.targets, self.weights = self._map_buffers()
+                self.names._offsets, self.names._blob = names._offsets, names._blob
+            raise BufferError(f"cannot close {self.path}: slices of its buffers are still in use") from None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __reduce__(self):
+        return MappedGraph, (self.path,)
+
+
+def open_graph(path):
+    """
+    Map a compiled graph file read-only.
+
+    Args:
+    path (str): The file written by compile_edge_list() or save_graph().
+
+    Returns:
+    MappedGraph: A graph that SearchStrategies, uniform_cost_search, AStarSearch and the other
+        engines accept wherever they accept a CompactGraph.
+    """
+    return MappedGraph(path)
+
+
+def compile_edge_list(sources, path, format=None, delimiter=None, source_column=None, target_column=None,
+                      weight_column=None, undirected=False, encoding="utf-8"):
+    """
+    Stream one or more edge list or CSV files into a compiled graph file.
+
+    The input is read twice, one line at a time, so only the node names and a counter per node
+    are held in memory. The first pass interns the names and counts every node's out-degree, and
+    the second writes each edge straight into its CSR slot in the mapped output file.
+
+    Args:
+    sources (str or list): The input file or files, such as the parts of an OSM edge export.
+    path (str): The graph file to write.
+    format (str): "csv" for files with a header row or "edges" for whitespace separated
+        "source target [weight]" lines with "#" comments. Files ending in .csv are read as CSV
+        if omitted.
+    delimiter (str): The field separator (default is "," for CSV and any whitespace otherwise).
+    source_column (str or int): The CSV column holding the edge source. Common names such as
+        "source", "from" and "u" are recognized if omitted.
+    target_column (str or int): The CSV column holding the edge target ("target", "to", "v", ...).
+    weight_column (str or int): The CSV column holding the edge cost ("weight", "cost", "length",
+        ...). The graph is unweighted if there is none; every edge then costs 1.
+    undirected (bool): Whether every edge is also added in the reverse direction (default is False).
+    encoding (str): The text encoding of the input (default is "utf-8").
+
+    Returns:
+    MappedGraph: The compiled graph, mapped read-only.
+
+    Raises:
+    ValueError: If an edge has no cost in a file that has costs, such as a blank cell in the
+        weight column, or if some input files have costs and others do not.
+    """
+    sources = [sources] if isinstance(sources, str) else list(sources)
+    reader = _read_csv if (format or ("csv" if sources[0].lower().endswith(".csv") else "edges")) == "csv" \
+        else _read_edge_lines
+    options = (delimiter, source_column, target_column, weight_column, encoding)
+
+    def edges():
+        for source in sources:
+            for u, v, weight in reader(source, *options):
+                yield u, v, weight
+                if undirected:
+                    yield v, u, weight
+
+    # First pass: intern the names, count out-degrees and find out what the weights look like
+    index = {}
+    degrees = array("q")
+    weighted, unweighted, integral = False, False, True
+    for u, v, weight in edges():
+        for name in (u, v):
+            if name not in index:
+                index[name] = len(index)
+                degrees.append(0)
+        degrees[index[u]] += 1
+        if weight is None:
+            unweighted = True
+        else:
+            weighted = True
+            integral = integral and isinstance(weight, int)
+    if weighted and unweighted:
+        raise ValueError("some input files have edge costs and others do not")
+
+    # Second pass: write every edge into the next free slot of its source's row
+    def indexed_edges():
+        for u, v, weight in edges():
+            yield index[u], index[v], 1 if weight is None else weight
+
+    _write_graph(path, list(index), degrees, indexed_edges(), weighted, "q" if integral else "d")
+    return open_graph(path)
+
+
+def save_graph(graph, path):
+    """
+    Write an adjacency dictionary or CompactGraph to a compiled graph file.
+
+    Args:
+    graph (dict or CompactGraph): The graph to write.
+    path (str): The graph file to write.
+
+    Returns:
+    MappedGraph: The written graph, mapped read-only.
+    """
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph.from_adjacency(graph)
+    degrees = array("q", (graph.offsets[u + 1] - graph.offsets[u] for u in graph))
+    edges = ((u, v, w) for u in graph for v, w in graph.edges(u))
+    typecode = "d" if _typecode(graph.weights) == "d" else "q"
+    _write_graph(path, list(graph.names), degrees, edges, graph.weighted, typecode)
+    return open_graph(path)
+
+
+def _layout(node_count, edge_count, names_size):
+    """
+    Return the byte offset of every section of a graph file, each aligned to 8 bytes.
+    """
+    layout = {"offsets": _align(_HEADER.size)}
+    layout["targets"] = layout["offsets"] + 8 * (node_count + 1)
+    layout["weights"] = layout["targets"] + 8 * edge_count
+    layout["name_offsets"] = layout["weights"] + 8 * edge_count
+    layout["names"] = layout["name_offsets"] + 8 * (node_count + 1)
+    layout["end"] = layout["names"] + names_size
+    return layout
+
+
+def _align(size):
+    return (size + 7) & ~7
+
+
+def _write_graph(path, names, degrees, edges, weighted, typecode):
+    """
+    Write a graph file, filling the CSR rows from a stream of (source ID, target ID, weight) edges.
+    """
+    encoded = [name.encode("utf-8") for name in names]
+    name_offsets = array("q", [0])
+    for name in encoded:
+        name_offsets.append(name_offsets[-1] + len(name))
+    offsets = array("q", [0])
+    for degree in degrees:
+        offsets.append(offsets[-1] + degree)
+    node_count, edge_count = len(names), offsets[-1]
+    layout = _layout(node_count, edge_count, name_offsets[-1])
+
+    with open(path, "w+b") as file:
+        file.truncate(max(layout["end"], 1))
+        with mmap.mmap(file.fileno(), 0) as mapped:
+            header = _HEADER.pack(MAGIC, VERSION, sys.byteorder == "big", weighted, typecode.encode(),
+                                  node_count, edge_count)
+            mapped[:len(header)] = header
+            mapped[layout["offsets"]:layout["targets"]] = offsets.tobytes()
+            mapped[layout["name_offsets"]:layout["names"]] = name_offsets.tobytes()
+            mapped[layout["names"]:layout["end"]] = b"".join(encoded)
+
+            view = memoryview(mapped)
+            targets = view[layout["targets"]:layout["weights"]].cast("q")
+            weights = view[layout["weights"]:layout["name_offsets"]].cast(typecode)
+            try:
+                cursor = offsets[:-1]  # Next free slot of every row
+                for source, target, weight in edges:
+                    slot = cursor[source]
+                    targets[slot] = target
+                    weights[slot] = weight
+                    cursor[source] = slot + 1
+            finally:
+                targets.release()
+                weights.release()
+                view.release()
+            mapped.flush()
+
+
+def _parse_weight(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _read_edge_lines(path, delimiter, source_column, target_column, weight_column, encoding):
+    """
+    Yield the (source, target, weight) edges of a whitespace separated edge list file.
+    """
+    weighted = None  # Whether the file has costs, decided by its first edge
+    with open(path, encoding=encoding) as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            fields = line.split(delimiter)
+            if weighted is None:
+                weighted = len(fields) > 2
+            elif weighted != (len(fields) > 2):
+                raise ValueError(f"{path}, line {line_number}: some edges have costs and others do not")
+            yield fields[0], fields[1], _parse_weight(fields[2]) if weighted else None
+
+
+def _read_csv(path, delimiter, source_column, target_column, weight_column, encoding):
+    """
+    Yield the (source, target, weight) edges of a CSV file with a header row.
+    """
+    with open(path, newline="", encoding=encoding) as file:
+        reader = csv.reader(file, delimiter=delimiter or ",")
+        header = [column.strip().lower() for column in next(reader, [])]
+
+        def position(column, candidates, required=True):
+            if isinstance(column, int):
+                return column
+            for name in ((column,) if column is not None else candidates):
+                if name.lower() in header:
+                    return header.index(name.lower())
+            if required:
+                raise ValueError(f"{path} has none of the columns {', '.join((column,) if column else candidates)}")
+            return None
+
+        source = position(source_column, _SOURCE_COLUMNS)
+        target = position(target_column, _TARGET_COLUMNS)
+        weight = position(weight_column, _WEIGHT_COLUMNS, required=weight_column is not None)
+        for row in reader:
+            if not row:
+                continue
+            if weight is None:
+                yield row[source].strip(), row[target].strip(), None
+                continue
+            cost = row[weight].strip() if weight < len(row) else ""
+            if not cost:
+                raise ValueError(f"{path}, line {reader.line_num}: the edge cost is blank")
+            yield row[source].strip(), row[target].strip(), _parse_weight(cost)
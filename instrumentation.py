@@ -0,0 +1,265 @@
+import logging  # Import logging for the structured log sink
+import sys  # Import sys for the default trace table stream
+import time  # Import time for the phase timings
+import tracemalloc  # Import tracemalloc for the optional peak memory measurement
+from contextlib import contextmanager, nullcontext
+
+
+class SearchProbe:
+    """
+    Collects counters from instrumented searches and forwards their events to sinks.
+
+    Every engine takes an optional probe and only touches it behind an `if probe is not None`
+    check, so an uninstrumented search pays for nothing but that check. The counters describe
+    the last search; sinks such as PrometheusCounters accumulate them across searches.
+    """
+
+    def __init__(self, sinks=(), track_memory=False):
+        """
+        Initialize a probe with zeroed counters.
+
+        Args:
+        sinks (iterable): Objects notified of search events. A sink may define any of
+            on_start(engine), on_expand(event) and on_finish(probe); missing hooks are skipped.
+        track_memory (bool): Whether phases measure their peak memory with tracemalloc, which
+            slows the search down noticeably (default is False).
+        """
+        self.sinks = list(sinks)
+        self.track_memory = track_memory
+        self._expand_sinks = [sink for sink in self.sinks if hasattr(sink, "on_expand")]
+        self.reset()
+
+    def reset(self):
+        """
+        Zero every counter.
+        """
+        self.expansions = 0  # Nodes taken off the frontier and expanded
+        self.pushes = 0  # Nodes added to the frontier
+        self.updates = 0  # Decrease-key updates of nodes already on the frontier
+        self.stale_pops = 0  # Entries popped for nodes that were already expanded
+        self.max_frontier = 0  # Largest frontier size seen
+        self.phases = {}  # Seconds spent in each named phase
+        self.peak_memory = 0  # Largest traced allocation peak of any phase, in bytes
+
+    def start(self, engine):
+        """
+        Zero the counters and announce the start of a search to the sinks.
+
+        Args:
+        engine (str): The name of the search engine, such as "bfs" or "a_star".
+        """
+        self.reset()
+        for sink in self.sinks:
+            if hasattr(sink, "on_start"):
+                sink.on_start(engine)
+
+    def finish(self):
+        """
+        Announce the end of a search to the sinks.
+        """
+        for sink in self.sinks:
+            if hasattr(sink, "on_finish"):
+                sink.on_finish(self)
+
+    @contextmanager
+    def observe(self, engine):
+        """
+        Announce a search to the sinks on entry and its end on exit.
+
+        Args:
+        engine (str): The name of the search engine, such as "bfs" or "a_star".
+        """
+        self.start(engine)
+        try:
+            yield self
+        finally:
+            self.finish()
+
+    def expand(self, node, **details):
+        """
+        Record the expansion of a node.
+
+        Args:
+        node (str): The name of the expanded node.
+        **details: Engine specific values, such as g_score, h_score and f_score for A* or depth
+            for minimax, passed on to the sinks.
+        """
+        self.expansions += 1
+        if self._expand_sinks:
+            event = dict(details, node=node)
+            for sink in self._expand_sinks:
+                sink.on_expand(event)
+
+    def push(self, frontier_size):
+        """
+        Record a node added to the frontier, given the frontier size after the push.
+        """
+        self.pushes += 1
+        if frontier_size > self.max_frontier:
+            self.max_frontier = frontier_size
+
+    def update(self):
+        """
+        Record a decrease-key update of a node already on the frontier.
+        """
+        self.updates += 1
+
+    def stale_pop(self):
+        """
+        Record an entry popped for a node that was already expanded.
+        """
+        self.stale_pops += 1
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time a phase of a search and, if enabled, measure its peak memory.
+
+        Args:
+        name (str): The name of the phase. Repeated phases accumulate.
+        """
+        started_tracing = self.track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif self.track_memory:
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+            if self.track_memory:
+                self.peak_memory = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def snapshot(self):
+        """
+        Return the counters as a dictionary.
+        """
+        return {
+            "expansions": self.expansions,
+            "pushes": self.pushes,
+            "updates": self.updates,
+            "stale_pops": self.stale_pops,
+            "max_frontier": self.max_frontier,
+            "phases": dict(self.phases),
+            "peak_memory": self.peak_memory,
+        }
+
+
+def probe_search(probe, engine):
+    """
+    Return probe.observe(engine), or a no-op context manager when there is no probe.
+    """
+    return nullcontext() if probe is None else probe.observe(engine)
+
+
+def probe_phase(probe, name):
+    """
+    Return probe.phase(name), or a no-op context manager when there is no probe.
+    """
+    return nullcontext() if probe is None else probe.phase(name)
+
+
+class TraceTableSink:
+    """
+    Prints one table row per expansion, like the trace a_star_search used to print unconditionally.
+    """
+
+    def __init__(self, stream=None):
+        """
+        Initialize the sink.
+
+        Args:
+        stream (file): Where to write the table (default is None, which means sys.stdout).
+        """
+        self.stream = stream
+
+    def on_start(self, engine):
+        print(f"{'Node':<12} {'g_score (Backward Cost)':<25} {'Heuristic (h_score)':<20} {'f_score (Total)'}",
+              file=self.stream or sys.stdout)
+
+    def on_expand(self, event):
+        print(f"{event['node']:<12} {event.get('g_score', ''):<25} {event.get('h_score', ''):<20} {event.get('f_score', '')}",
+              file=self.stream or sys.stdout)
+
+
+class LoggingSink:
+    """
+    Emits structured log records: one DEBUG record per expansion and an INFO summary per search.
+    """
+
+    def __init__(self, logger=None, log_expansions=True):
+        """
+        Initialize the sink.
+
+        Args:
+        logger (logging.Logger): The logger to write to (default is the "search" logger).
+        log_expansions (bool): Whether to log every expansion at DEBUG level (default is True).
+        """
+        self.logger = logger or logging.getLogger("search")
+        self.log_expansions = log_expansions
+        self.engine = None
+
+    def on_start(self, engine):
+        self.engine = engine
+
+    def on_expand(self, event):
+        if self.log_expansions and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("expand", extra={"search": dict(event, engine=self.engine)})
+
+    def on_finish(self, probe):
+        self.logger.info("search finished", extra={"search": dict(probe.snapshot(), engine=self.engine)})
+
+
+class PrometheusCounters:
+    """
+    Accumulates the counters of every finished search per engine and renders them in the
+    Prometheus text exposition format.
+    """
+
+    def __init__(self, prefix="search"):
+        """
+        Initialize the counters.
+
+        Args:
+        prefix (str): The prefix of every metric name (default is "search").
+        """
+        self.prefix = prefix
+        self.engine = None
+        self.totals = {}  # (metric, labels) -> accumulated value
+        self.maxima = {}  # (metric, labels) -> largest value seen
+
+    def on_start(self, engine):
+        self.engine = engine
+
+    def on_finish(self, probe):
+        labels = (("engine", self.engine),)
+        self._add("searches", labels, 1)
+        for metric in ("expansions", "pushes", "updates", "stale_pops"):
+            self._add(metric, labels, getattr(probe, metric))
+        for name, seconds in probe.phases.items():
+            self._add("phase_seconds", labels + (("phase", name),), seconds)
+        for metric in ("max_frontier", "peak_memory"):
+            key = (metric, labels)
+            self.maxima[key] = max(self.maxima.get(key, 0), getattr(probe, metric))
+
+    def _add(self, metric, labels, value):
+        key = (metric, labels)
+        self.totals[key] = self.totals.get(key, 0) + value
+
+    def render(self):
+        """
+        Return the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for kind, values, suffix in (("counter", self.totals, "_total"), ("gauge", self.maxima, "")):
+            for metric in sorted({metric for metric, _ in values}):
+                name = f"{self.prefix}_{metric}{suffix}"
+                lines.append(f"# TYPE {name} {kind}")
+                for (other, labels), value in sorted(values.items(), key=lambda item: str(item[0])):
+                    if other == metric:
+                        label_text = ",".join(f'{label}="{text}"' for label, text in labels)
+                        lines.append(f"{name}{{{label_text}}} {value}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,109 @@
+from array import array  # Import array for compact distance tables
+
+from compact_graph import CompactGraph, graph_nodes, reverse_view, to_node_id
+from search_core import shortest_path_tree
+
+
+class LandmarkHeuristic:
+    """
+    An ALT (A*, Landmarks, Triangle inequality) heuristic that works for any goal.
+
+    A handful of landmarks are picked and the shortest path distance from and to every landmark
+    is stored for every node. By the triangle inequality, for any landmark L
+
+        d(node, goal) >= d(L, goal) - d(L, node)   and   d(node, goal) >= d(node, L) - d(goal, L)
+
+    so the largest of these lower bounds is an admissible, consistent estimate of the remaining cost.
+
+    The distance tables are a snapshot of the graph they were built from. They stay admissible
+    if edge costs only rise, but once any cost drops they can overestimate and A* may return a
+    route that is not the cheapest, so they are only valid for a frozen graph. Rebuild them after
+    editing an adjacency dictionary.
+    """
+
+    def __init__(self, graph, count=8):
+        """
+        Pick the landmarks and precompute their distance tables.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph with costs.
+        count (int): The number of landmarks to pick (default is 8).
+        """
+        self.graph = graph
+        nodes = graph_nodes(graph)
+        # A CompactGraph indexes its tables by node ID, a dictionary needs a position per name
+        self.position = None if isinstance(graph, CompactGraph) else {node: i for i, node in enumerate(nodes)}
+        self.landmarks = []
+        self.from_landmark = []  # from_landmark[i][v] = d(landmark i, v)
+        self.to_landmark = []  # to_landmark[i][v] = d(v, landmark i)
+        if not nodes:
+            return
+
+        reverse = reverse_view(graph)
+        closest = array("d", [float('inf')]) * len(nodes)  # Distance from each node to its nearest landmark
+        candidate = nodes[0]
+        for _ in range(min(count, len(nodes))):
+            self._add_landmark(candidate, nodes, reverse)
+            latest_from, latest_to = self.from_landmark[-1], self.to_landmark[-1]
+            # The next landmark is the node farthest from all landmarks picked so far. Nodes no landmark
+            # connects to count as infinitely far, so every component gets a landmark before any gets two.
+            best_node, best_distance = None, 0
+            for i, node in enumerate(nodes):
+                distance = min(latest_from[i], latest_to[i])
+                if distance < closest[i]:
+                    closest[i] = distance
+                if closest[i] > best_distance:
+                    best_node, best_distance = node, closest[i]
+            if best_node is None:
+                break  # Every node is a landmark already
+            candidate = best_node
+
+    def _add_landmark(self, landmark, nodes, reverse):
+        from_distances, _ = shortest_path_tree(self.graph, landmark)
+        to_distances, _ = shortest_path_tree(reverse, landmark)
+        self.landmarks.append(landmark)
+        self.from_landmark.append(array("d", (from_distances.get(node, float('inf')) for node in nodes)))
+        self.to_landmark.append(array("d", (to_distances.get(node, float('inf')) for node in nodes)))
+
+    def _slot(self, node):
+        if self.position is None:
+            return node if node in self.graph else None
+        return self.position.get(node)
+
+    def estimate(self, node, goal):
+        """
+        Estimate the cost of the cheapest path from node to goal.
+
+        Args:
+        node: The search key of the current node.
+        goal: The search key of the goal.
+
+        Returns:
+        float: A lower bound on the remaining cost, 0 when no landmark gives a bound.
+        """
+        v, t = self._slot(node), self._slot(goal)
+        if v is None or t is None:
+            return 0
+        bound = 0
+        inf = float('inf')
+        for from_table, to_table in zip(self.from_landmark, self.to_landmark):
+            from_v, from_t = from_table[v], from_table[t]
+            if from_v != inf and from_t != inf and from_t - from_v > bound:
+                bound = from_t - from_v
+            to_v, to_t = to_table[v], to_table[t]
+            if to_v != inf and to_t != inf and to_v - to_t > bound:
+                bound = to_v - to_t
+        return bound
+
+    def for_goal(self, goal):
+        """
+        Bind the heuristic to a goal state.
+
+        Args:
+        goal (str): The goal state.
+
+        Returns:
+        callable: A function h(node) estimating the cost from a search key to the goal.
+        """
+        goal = to_node_id(self.graph, goal)
+        return lambda node: self.estimate(node, goal)
@@ -0,0 +1,174 @@
+import weakref  # Cache the pull-step edge arrays of frozen graphs
+from array import array  # Import array for the per-node hop counts
+from collections import deque
+from itertools import compress, repeat
+
+from compact_graph import CompactGraph, reverse_view
+
+# (row, source) edge arrays of the reverse of each CompactGraph, built on first use
+_pull_edges = weakref.WeakKeyDictionary()
+
+
+class LevelSynchronousBFS:
+    """
+    A direction-optimizing breadth-first search that expands a whole level per step.
+
+    Small frontiers are pushed: the neighbor slices of the frontier nodes are merged into one
+    dictionary. Large frontiers are pulled: the frontier is marked in a flag array and a single
+    pass over every edge of the reverse graph gathers each edge's flag and keeps the edges that
+    leave the frontier, which is a boolean sparse matrix-vector product done by C level
+    iterators. Either way the interpreter only runs per frontier node or per newly found node,
+    never per edge.
+
+    Following Beamer et al., the search switches to pulling when the edges leaving the frontier
+    exceed 1/alpha of the edges still unexplored, and back to pushing when the frontier shrinks
+    below 1/beta of the nodes.
+    """
+
+    def __init__(self, graph, alpha=14, beta=24):
+        """
+        Initialize the search.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph, weighted or not; only hops count.
+            An adjacency dictionary is converted to a CompactGraph once, here.
+        alpha (float): The push-to-pull switching factor (default is 14).
+        beta (float): The pull-to-push switching factor (default is 24).
+        """
+        self.graph = graph if isinstance(graph, CompactGraph) else CompactGraph.from_adjacency(graph)
+        self.alpha = alpha
+        self.beta = beta
+        self.levels = []  # Whether each level of the last search was "push" or "pull"
+
+    def search(self, start, goal):
+        """
+        Find a path with the fewest hops from start to goal.
+
+        Args:
+        start (str): The initial state.
+        goal (str): The goal state.
+
+        Returns:
+        tuple: The path as node names and the depth reached, which is the goal's depth when it is
+            found and the depth of the farthest node reachable from the start otherwise.
+        """
+        graph = self.graph
+        source, target = graph.node_id(start), graph.node_id(goal)
+        if source is None:
+            return [], 0
+        parent = {source: None}
+        depth = self._run([source], target, parent)
+        if target is None or target not in parent:
+            return [], depth
+        path = []
+        node = target
+        while node is not None:
+            path.append(graph.names[node])
+            node = parent[node]
+        return path[::-1], depth
+
+    def distance_array(self, sources):
+        """
+        Compute the hop count from the nearest of several sources to every node.
+
+        Args:
+        sources (iterable): The source states.
+
+        Returns:
+        array: The hop count of every node ID of self.graph, or -1 for nodes no source reaches.
+        """
+        graph = self.graph
+        hops = array("q", [-1]) * len(graph)
+        frontier = [node for node in dict.fromkeys(graph.node_id(name) for name in sources) if node is not None]
+        self._run(frontier, None, None, hops)
+        return hops
+
+    def distances(self, sources):
+        """
+        Compute the hop count from the nearest of several sources to every reachable node.
+
+        Returns:
+        dict: The hop count of every reachable state, keyed by name.
+        """
+        names = self.graph.names
+        return {names[node]: hop for node, hop in enumerate(self.distance_array(sources)) if hop >= 0}
+
+    def _run(self, frontier, target, parent=None, hops=None):
+        """
+        Expand level after level from the frontier until the target is found or nothing is left.
+
+        Returns:
+        int: The depth of the last level that found new nodes.
+        """
+        graph = self.graph
+        offsets, targets = graph.offsets, graph.targets
+        node_count = len(graph)
+        visited = set(frontier)
+        if hops is not None:
+            for node in frontier:
+                hops[node] = 0
+        unexplored_edges = graph.edge_count - sum(offsets[u + 1] - offsets[u] for u in frontier)
+        pulling = False
+        level = 0
+        self.levels = []
+
+        while frontier and target not in visited:
+            frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+            if not pulling and frontier_edges * self.alpha > unexplored_edges:
+                pulling = True
+            elif pulling and len(frontier) * self.beta < node_count:
+                pulling = False
+            self.levels.append("pull" if pulling else "push")
+
+            if pulling:
+                rows, columns = self._reverse_edges()
+                flags = bytearray(node_count)
+                deque(map(flags.__setitem__, frontier, repeat(1)), maxlen=0)  # Mark the frontier without a Python loop
+                found = dict(compress(zip(rows, columns), map(flags.__getitem__, columns)))
+            else:
+                found = {}
+                for u in frontier:
+                    found.update(zip(targets[offsets[u]:offsets[u + 1]], repeat(u)))
+
+            new = found.keys() - visited
+            if not new:
+                break
+            level += 1
+            visited |= new
+            if parent is not None:
+                parent.update(zip(new, map(found.__getitem__, new)))
+            if hops is not None:
+                deque(map(hops.__setitem__, new, repeat(level)), maxlen=0)
+            frontier = list(new)
+            unexplored_edges -= sum(offsets[u + 1] - offsets[u] for u in frontier)
+        return level
+
+    def _reverse_edges(self):
+        """
+        Return the (row, column) arrays of the reverse graph's edges: edge i runs from
+        columns[i] to rows[i] in the original graph.
+        """
+        edges = _pull_edges.get(self.graph)
+        if edges is None:
+            reverse = reverse_view(self.graph)
+            rows = array("q")
+            for node in reverse:
+                rows.extend(repeat(node, reverse.offsets[node + 1] - reverse.offsets[node]))
+            edges = _pull_edges[self.graph] = (rows, reverse.targets)
+        return edges
+
+
+def multi_source_distances(graph, sources, alpha=14, beta=24):
+    """
+    Compute the hop count from the nearest of several sources to every reachable node.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph, weighted or not.
+    sources (iterable): The source states.
+    alpha (float): The push-to-pull switching factor (default is 14).
+    beta (float): The pull-to-push switching factor (default is 24).
+
+    Returns:
+    dict: The hop count of every reachable state, keyed by name.
+    """
+    return LevelSynchronousBFS(graph, alpha, beta).distances(sources)
@@ -0,0 +1,299 @@
+from compact_graph import CompactGraph, graph_edited
+from instrumentation import probe_phase, probe_search
+from search_core import IndexedHeap
+
+
+class EdgeCosts:
+    """
+    Successor and predecessor cost maps over an adjacency dictionary, kept in step with it as
+    edges are edited.
+
+    Parallel edges collapse to the cheapest one, which is the only one a shortest path uses.
+    Every cost must be positive: D* Lite repairs and path extraction both rely on a step always
+    costing something, and a zero-cost edge can stop a repair early or loop the extraction.
+    """
+
+    def __init__(self, graph):
+        """
+        Index the edges of a weighted adjacency dictionary.
+
+        Args:
+        graph (dict): The state space graph with costs, as in adjacency_dict_costs. Edits made
+            through set() and remove() are written back to it.
+
+        Raises:
+        ValueError: If an edge cost is not positive.
+        """
+        if isinstance(graph, CompactGraph):
+            raise TypeError("A CompactGraph is frozen; use an adjacency dictionary for a graph with live edits.")
+        self.graph = graph
+        self.successors = {}  # Node -> {successor: cost}
+        self.predecessors = {}  # Node -> {predecessor: cost}
+        for node, edges in graph.items():
+            for neighbor, cost in edges:
+                _check_cost(node, neighbor, cost)
+                if cost < self.successors.get(node, {}).get(neighbor, float('inf')):
+                    self.successors.setdefault(node, {})[neighbor] = cost
+                    self.predecessors.setdefault(neighbor, {})[node] = cost
+
+    def cost(self, start, goal):
+        """
+        Return the cost of the edge start -> goal, or inf if there is none.
+        """
+        return self.successors.get(start, {}).get(goal, float('inf'))
+
+    def set(self, start, goal, cost):
+        """
+        Add the edge start -> goal or change its cost, here and in the adjacency dictionary.
+
+        Returns:
+        float: The previous cost of the edge, or inf if it did not exist.
+
+        Raises:
+        ValueError: If the cost is not positive. Nothing is changed.
+        """
+        _check_cost(start, goal, cost)
+        old_cost = self.cost(start, goal)
+        self.successors.setdefault(start, {})[goal] = cost
+        self.predecessors.setdefault(goal, {})[start] = cost
+        edges = [(neighbor, weight) for neighbor, weight in self.graph.get(start, []) if neighbor != goal]
+        edges.append((goal, cost))
+        self.graph[start] = edges
+        graph_edited(self.graph, start)
+        return old_cost
+
+    def remove(self, start, goal):
+        """
+        Remove the edge start -> goal, here and in the adjacency dictionary.
+
+        Returns:
+        float: The previous cost of the edge, or inf if it did not exist.
+        """
+        old_cost = self.cost(start, goal)
+        self.successors.get(start, {}).pop(goal, None)
+        self.predecessors.get(goal, {}).pop(start, None)
+        if start in self.graph:
+            self.graph[start] = [(neighbor, weight) for neighbor, weight in self.graph[start] if neighbor != goal]
+            graph_edited(self.graph, start)
+        return old_cost
+
+
+def _check_cost(start, goal, cost):
+    if not cost > 0:
+        raise ValueError(f"edge {start} -> {goal} has cost {cost}; D* Lite needs positive edge costs")
+
+
+class DStarLitePlanner:
+    """
+    A D* Lite planner for one start/goal pair that repairs its previous search after edge cost
+    changes instead of searching again from scratch.
+
+    The search runs backward from the goal, so g[s] is the cost from s to the goal and every
+    queried start reuses the same tree. rhs[s] is the one-step lookahead min(cost(s, x) + g[x]);
+    a node whose g and rhs disagree is inconsistent and queued for repair. An edge change only
+    touches the rhs of the edge's source, and plan() then repairs just the nodes whose costs
+    actually change.
+    """
+
+    def __init__(self, edges, start, goal, heuristic=None):
+        """
+        Initialize the planner. Nothing is searched until plan() is called.
+
+        Args:
+        edges (EdgeCosts): The edge index of the graph, which may be shared between planners.
+        start (str): The initial state.
+        goal (str): The goal state.
+        heuristic (callable): An optional lower bound h(a, b) on the cost from a to b, such as
+            LandmarkHeuristic.estimate. It must stay admissible as costs change; landmark bounds do
+            while costs only rise above the values they were built from.
+        """
+        self.edges = edges
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic
+        self.g = {}  # Finite cost to the goal of every node the search has settled
+        self.rhs = {goal: 0}  # Finite one-step lookahead cost of every node the search has reached
+        self.frontier = IndexedHeap()  # Inconsistent nodes keyed by (k1, k2)
+        self.key_modifier = 0  # D* Lite's km: heuristic drift accumulated as the start moves
+        self.last_start = start
+        self.frontier.push(goal, self.key(goal))
+
+    def key(self, node):
+        """
+        Return the priority (k1, k2) of a node in the frontier.
+        """
+        best = min(self.g.get(node, float('inf')), self.rhs.get(node, float('inf')))
+        h = self.heuristic(self.start, node) if self.heuristic else 0
+        return best + h + self.key_modifier, best
+
+    def move_start(self, start):
+        """
+        Move the start, for a vehicle that has advanced along its route. The search tree stays valid.
+        """
+        if self.heuristic:
+            self.key_modifier += self.heuristic(self.last_start, start)
+        self.start = self.last_start = start
+
+    def edge_changed(self, start, goal, old_cost):
+        """
+        Update the planner after the edge start -> goal changed from old_cost to its current cost
+        in the shared edge index. The repair itself runs on the next plan().
+        """
+        if start == self.goal:
+            return
+        new_cost = self.edges.cost(start, goal)
+        goal_g = self.g.get(goal, float('inf'))
+        rhs = self.rhs.get(start, float('inf'))
+        if new_cost < old_cost:
+            if new_cost + goal_g < rhs:
+                self._set_rhs(start, new_cost + goal_g)
+        elif rhs == old_cost + goal_g:
+            self._set_rhs(start, self._lookahead(start))
+        self._update(start)
+
+    def plan(self, probe=None):
+        """
+        Repair the search as far as the current start needs and extract the cheapest path.
+
+        Args:
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
+
+        Returns:
+        tuple: The path from the start to the goal and its cost, or (None, inf) if the goal is unreachable.
+        """
+        with probe_search(probe, "d_star_lite"), probe_phase(probe, "search"):
+            self._repair(probe)
+            cost = self.g.get(self.start, float('inf'))
+            if cost == float('inf'):
+                return None, cost
+            path = [self.start]
+            node = self.start
+            while node != self.goal:
+                # Follow the consistent costs downhill; every step strictly approaches the goal
+                node = min(self.edges.successors.get(node, {}).items(),
+                           key=lambda edge: edge[1] + self.g.get(edge[0], float('inf')))[0]
+                path.append(node)
+            return path, cost
+
+    def _repair(self, probe):
+        g, rhs, frontier, inf = self.g, self.rhs, self.frontier, float('inf')
+        while frontier:
+            node, old_key = frontier.peek()
+            start_key = self.key(self.start)
+            if not (old_key < start_key or rhs.get(self.start, inf) != g.get(self.start, inf)):
+                break
+            new_key = self.key(node)
+            if old_key < new_key:
+                frontier.push(node, new_key)  # The start moved since the node was queued
+                continue
+            if probe is not None:
+                probe.expand(node, g_score=rhs.get(node, inf))
+            frontier.pop()
+            if g.get(node, inf) > rhs.get(node, inf):
+                g[node] = rhs[node]  # Overconsistent: the node got cheaper, settle it
+                for predecessor, cost in self.edges.predecessors.get(node, {}).items():
+                    if predecessor != self.goal and cost + g[node] < rhs.get(predecessor, inf):
+                        self._set_rhs(predecessor, cost + g[node])
+                    self._update(predecessor)
+            else:
+                old_g = g.pop(node)  # Underconsistent: the node got dearer, re-derive it and its dependents
+                for predecessor, cost in list(self.edges.predecessors.get(node, {}).items()) + [(node, None)]:
+                    if predecessor != self.goal and (cost is None or rhs.get(predecessor, inf) == cost + old_g):
+                        self._set_rhs(predecessor, self._lookahead(predecessor))
+                    self._update(predecessor)
+
+    def _lookahead(self, node):
+        g, inf = self.g, float('inf')
+        return min((cost + g.get(successor, inf) for successor, cost in self.edges.successors.get(node, {}).items()),
+                   default=inf)
+
+    def _set_rhs(self, node, value):
+        if value == float('inf'):
+            self.rhs.pop(node, None)
+        else:
+            self.rhs[node] = value
+
+    def _update(self, node):
+        if self.g.get(node, float('inf')) != self.rhs.get(node, float('inf')):
+            self.frontier.push(node, self.key(node))
+        else:
+            self.frontier.remove(node)
+
+
+class ReplanningService:
+    """
+    Keeps one D* Lite planner per route over a shared, editable graph, so a traffic update only
+    repairs the routes it can affect, and only when they are next asked for.
+    """
+
+    def __init__(self, graph, heuristic=None):
+        """
+        Initialize the service without any routes.
+
+        Args:
+        graph (dict): The state space graph with costs, as in adjacency_dict_costs. Edge updates
+            are written back to it. Every cost must be positive.
+        heuristic (callable): An optional lower bound h(a, b) shared by all planners.
+        """
+        self.edges = EdgeCosts(graph)
+        self.heuristic = heuristic
+        self.planners = {}  # Route ID -> DStarLitePlanner
+
+    def add_route(self, route_id, start, goal):
+        """
+        Register a route. It is planned the first time it is asked for.
+        """
+        self.planners[route_id] = DStarLitePlanner(self.edges, start, goal, self.heuristic)
+
+    def remove_route(self, route_id):
+        """
+        Forget a route and its search state.
+        """
+        self.planners.pop(route_id, None)
+
+    def route(self, route_id, probe=None):
+        """
+        Return the current cheapest (path, cost) of a route, repairing its search first if needed.
+        """
+        return self.planners[route_id].plan(probe)
+
+    def move(self, route_id, start):
+        """
+        Move the start of a route, for a vehicle that has advanced along it.
+        """
+        self.planners[route_id].move_start(start)
+
+    def update_edge(self, start, goal, cost=None):
+        """
+        Set the cost of the edge start -> goal, or remove the edge when cost is None.
+
+        Only planners whose search settled the edge's target can be affected by the change, since
+        for any other planner both the old and the new cost lead to an unsettled node.
+
+        Returns:
+        int: The number of routes that were notified.
+
+        Raises:
+        ValueError: If the cost is not positive. The graph and the routes are left unchanged.
+        """
+        if cost is not None:
+            _check_cost(start, goal, cost)
+        if cost is None or cost == float('inf'):
+            old_cost = self.edges.remove(start, goal)
+        else:
+            old_cost = self.edges.set(start, goal, cost)
+        notified = 0
+        for planner in self.planners.values():
+            if goal in planner.g:
+                planner.edge_changed(start, goal, old_cost)
+                notified += 1
+        return notified
+
+    def update_edges(self, changes):
+        """
+        Apply a batch of (start, goal, cost) edge updates, such as one live traffic message.
+
+        Returns:
+        int: The number of notifications sent to planners.
+        """
+        return sum(self.update_edge(start, goal, cost) for start, goal, cost in changes)
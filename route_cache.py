@@ -0,0 +1,163 @@
+from collections import OrderedDict  # Import OrderedDict to keep the trees in least recently used order
+
+from compact_graph import CompactGraph, graph_edited, to_node_id, to_node_names, watch_edits
+from components import component_index
+from search_core import ShortestPathTree
+
+
+class ShortestPathCache:
+    """
+    A least recently used cache of shortest path trees, one per source, in front of the route engines.
+
+    A tree is only grown as far as the goals asked for so far, and is resumed when a farther goal
+    is requested. Editing an edge drops the trees that already relaxed it, whether the edit is
+    made through the cache or reported by another editor with graph_edited().
+    """
+
+    def __init__(self, graph, max_bytes=64 * 1024 * 1024, components=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph with costs.
+        max_bytes (int): The approximate memory budget of the cached trees (default is 64 MiB).
+        components (ComponentIndex): An optional component index used to reject unreachable goals
+            without searching. It is refreshed when edits are reported with graph_edited().
+        """
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.components = components
+        self.trees = OrderedDict()  # Cached tree of each source key, least recently used first
+        self.sizes = {}  # Approximate size of each cached tree when it was last grown
+        self.bytes = 0
+        self.hits = 0  # Queries answered from an existing tree without growing it
+        self.resumes = 0  # Queries answered by growing an existing tree
+        self.misses = 0  # Queries that had to start a new tree
+        self.evictions = 0
+        self.invalidations = 0
+        if not isinstance(graph, CompactGraph):
+            watch_edits(graph, self._graph_edited)
+
+    def route(self, start, goal):
+        """
+        Find the least-cost path from start to goal, reusing the cached tree of start if there is one.
+
+        Args:
+        start (str): The initial state.
+        goal (str): The goal state.
+
+        Returns:
+        tuple: The path from the start to the goal and its cost, or (None, inf) if the goal is unreachable.
+        """
+        components = component_index(self.graph, self.components)
+        if components is not None and not components.reachable(start, goal):
+            return None, float('inf')
+
+        source, target = to_node_id(self.graph, start), to_node_id(self.graph, goal)
+        tree = self.trees.get(source)
+        if tree is None:
+            self.misses += 1
+            tree = self.trees[source] = ShortestPathTree(self.graph, source)
+        elif target in tree.distances or tree.complete:
+            self.hits += 1
+        else:
+            self.resumes += 1
+        self.trees.move_to_end(source)
+
+        if target not in tree.distances and not tree.complete:
+            tree.grow((target,))
+            self._account(source, tree)
+
+        if target not in tree.distances:
+            return None, float('inf')
+        return to_node_names(self.graph, tree.path(target)), tree.distances[target]
+
+    def set_edge(self, start, goal, cost):
+        """
+        Add the edge start -> goal to the adjacency dictionary or change its cost.
+
+        Args:
+        start (str): The state the edge leaves.
+        goal (str): The state the edge enters.
+        cost (int): The new cost of the edge.
+        """
+        self._check_mutable()
+        edges = [(neighbor, weight) for neighbor, weight in self.graph.get(start, []) if neighbor != goal]
+        edges.append((goal, cost))
+        self.graph[start] = edges
+        self._edge_changed(start)
+
+    def remove_edge(self, start, goal):
+        """
+        Remove the edge start -> goal from the adjacency dictionary.
+
+        Args:
+        start (str): The state the edge leaves.
+        goal (str): The state the edge enters.
+        """
+        self._check_mutable()
+        if start in self.graph:
+            self.graph[start] = [(neighbor, weight) for neighbor, weight in self.graph[start] if neighbor != goal]
+            self._edge_changed(start)
+
+    def invalidate(self, start=None):
+        """
+        Drop the cached tree of one source, or every tree if no source is given.
+
+        Edits reported with graph_edited() are handled without calling this; call it without
+        arguments after editing the adjacency dictionary directly and silently.
+        """
+        sources = list(self.trees) if start is None else [to_node_id(self.graph, start)]
+        for source in sources:
+            if source in self.trees:
+                self._drop(source)
+                self.invalidations += 1
+
+    def stats(self):
+        """
+        Report the cache counters.
+
+        Returns:
+        dict: The hit, resume, miss, eviction and invalidation counts, the number of cached
+            trees and their approximate size in bytes.
+        """
+        return {
+            "hits": self.hits,
+            "resumes": self.resumes,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "trees": len(self.trees),
+            "bytes": self.bytes,
+        }
+
+    def _edge_changed(self, start):
+        graph_edited(self.graph, start)  # Runs _graph_edited and the other watchers, such as components
+
+    def _graph_edited(self, start=None):
+        if start is None:
+            self.invalidate()
+            return
+        # Only trees that settled start have relaxed its edges. Any other tree reads the edge
+        # from the dictionary when it gets there, so it stays valid.
+        start = to_node_id(self.graph, start)
+        for source in [source for source, tree in self.trees.items() if start in tree.distances]:
+            self._drop(source)
+            self.invalidations += 1
+
+    def _check_mutable(self):
+        if isinstance(self.graph, CompactGraph):
+            raise TypeError("A CompactGraph is frozen; build a new one and a new cache instead.")
+
+    def _account(self, source, tree):
+        size = tree.memory_size()
+        self.bytes += size - self.sizes.get(source, 0)
+        self.sizes[source] = size
+        while self.bytes > self.max_bytes and len(self.trees) > 1:
+            oldest = next(iter(self.trees))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, source):
+        del self.trees[source]
+        self.bytes -= self.sizes.pop(source, 0)
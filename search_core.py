@@ -0,0 +1,368 @@
+import sys  # Import sys to measure the containers a tree holds
+
+from compact_graph import to_node_name  # Name expanded nodes for the probe sinks
+from instrumentation import probe_phase
+
+
+class IndexedHeap:
+    """
+    A binary min-heap that keeps every item at most once and supports decrease-key.
+
+    A position map from item to heap slot lets push() lower the priority of an item that is
+    already queued instead of adding a stale duplicate, as heapq based searches do.
+    """
+
+    __slots__ = ("_priorities", "_items", "_position")
+
+    def __init__(self):
+        self._priorities = []  # Priority of the entry stored in each heap slot
+        self._items = []  # Item stored in each heap slot
+        self._position = {}  # Heap slot of each queued item
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __contains__(self, item):
+        return item in self._position
+
+    def __iter__(self):
+        return iter(self._items)  # Queued items in heap order, not priority order
+
+    def priority(self, item):
+        """
+        Return the current priority of a queued item.
+        """
+        return self._priorities[self._position[item]]
+
+    def push(self, item, priority):
+        """
+        Insert an item, or move it to a new priority if it is already queued.
+
+        Args:
+        item: The item to queue. It must be hashable.
+        priority: The priority of the item. Lower priorities are popped first.
+        """
+        slot = self._position.get(item)
+        if slot is None:
+            slot = len(self._items)
+            self._items.append(item)
+            self._priorities.append(priority)
+            self._position[item] = slot
+            self._sift_up(slot)
+        elif priority < self._priorities[slot]:
+            self._priorities[slot] = priority
+            self._sift_up(slot)
+        else:
+            self._priorities[slot] = priority
+            self._sift_down(slot)
+
+    def peek(self):
+        """
+        Return the (item, priority) pair with the lowest priority without removing it.
+        """
+        return self._items[0], self._priorities[0]
+
+    def pop(self):
+        """
+        Remove and return the (item, priority) pair with the lowest priority.
+        """
+        item, priority = self._items[0], self._priorities[0]
+        self._remove_slot(0)
+        return item, priority
+
+    def remove(self, item):
+        """
+        Remove an item from the heap if it is queued.
+        """
+        slot = self._position.get(item)
+        if slot is not None:
+            self._remove_slot(slot)
+
+    def _remove_slot(self, slot):
+        items, priorities = self._items, self._priorities
+        del self._position[items[slot]]
+        last_item, last_priority = items.pop(), priorities.pop()
+        if slot < len(items):
+            items[slot], priorities[slot] = last_item, last_priority
+            self._position[last_item] = slot
+            self._sift_down(slot)
+            self._sift_up(slot)
+
+    def _sift_up(self, slot):
+        items, priorities, position = self._items, self._priorities, self._position
+        item, priority = items[slot], priorities[slot]
+        while slot > 0:
+            parent = (slot - 1) >> 1
+            if not priority < priorities[parent]:
+                break
+            items[slot], priorities[slot] = items[parent], priorities[parent]
+            position[items[slot]] = slot
+            slot = parent
+        items[slot], priorities[slot] = item, priority
+        position[item] = slot
+
+    def _sift_down(self, slot):
+        items, priorities, position = self._items, self._priorities, self._position
+        size = len(items)
+        item, priority = items[slot], priorities[slot]
+        while True:
+            child = 2 * slot + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if not priorities[child] < priority:
+                break
+            items[slot], priorities[slot] = items[child], priorities[child]
+            position[items[slot]] = slot
+            slot = child
+        items[slot], priorities[slot] = item, priority
+        position[item] = slot
+
+
+def reconstruct_path(parent, goal):
+    """
+    Rebuild a path by walking the predecessor map back from the goal.
+
+    Args:
+    parent (dict): A dictionary mapping each reached node to its predecessor (None for the start).
+    goal: The node the path ends at.
+
+    Returns:
+    list: The path from the start to the goal.
+    """
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    return path[::-1]
+
+
+def best_first_search(graph, start, goal, heuristic=None, probe=None):
+    """
+    Find the least-cost path from start to goal with uniform cost search or, given a heuristic, A*.
+
+    Every node is queued at most once in an IndexedHeap and its predecessor is recorded in a
+    map, so the path is rebuilt once at the end instead of being copied on every expansion.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs, keyed by search keys.
+    start: The start key.
+    goal: The goal key.
+    heuristic (callable): An optional consistent estimate h(node) of the cost to the goal.
+    probe (SearchProbe): An optional probe told about every expansion and frontier push. The
+        search runs a phase named "search" on it but leaves start() and finish() to the caller.
+
+    Returns:
+    tuple: The path from the start to the goal and its cost, or (None, inf) if the goal is unreachable.
+    """
+    with probe_phase(probe, "search"):
+        return _best_first_search(graph, start, goal, heuristic, probe)
+
+
+def _best_first_search(graph, start, goal, heuristic, probe):
+    g_scores = {start: 0}  # Best known cost from the start to each reached node
+    parent = {start: None}  # Predecessor of each reached node on its best known path
+    closed = set()  # Nodes whose cost is final
+    frontier = IndexedHeap()
+    frontier.push(start, (heuristic(start) if heuristic else 0, 0))  # (f_score, g_score) breaks ties on g
+    if probe is not None:
+        probe.push(1)
+
+    while frontier:
+        node, (f_score, g_score) = frontier.pop()
+        closed.add(node)
+        if probe is not None:
+            probe.expand(to_node_name(graph, node), g_score=g_score,
+                         h_score=heuristic(node) if heuristic else 0, f_score=f_score)
+
+        if node == goal:
+            return reconstruct_path(parent, goal), g_score
+
+        for neighbor, cost in graph.get(node, ()):
+            if neighbor in closed:
+                continue
+            g = g_score + cost
+            if neighbor not in g_scores or g < g_scores[neighbor]:
+                if probe is not None:
+                    if neighbor in frontier:
+                        probe.update()
+                    else:
+                        probe.push(len(frontier) + 1)
+                g_scores[neighbor] = g
+                parent[neighbor] = node
+                frontier.push(neighbor, (g + heuristic(neighbor) if heuristic else g, g))
+
+    return None, float('inf')
+
+
+class ShortestPathTree:
+    """
+    A Dijkstra shortest path tree that can be grown in steps and resumed later.
+
+    A node counts as settled once its final cost is known and its edges have been relaxed, so
+    growing the tree further always continues exactly where the previous call stopped.
+    """
+
+    __slots__ = ("graph", "source", "distances", "g_scores", "parent", "frontier")
+
+    def __init__(self, graph, source):
+        """
+        Initialize the tree with only the source on its frontier.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph with costs, keyed by search keys.
+        source: The source key.
+        """
+        self.graph = graph
+        self.source = source
+        self.distances = {}  # Final cost of every settled node, in settling order
+        self.g_scores = {source: 0}  # Best known cost of every reached node
+        self.parent = {source: None}  # Predecessor of every reached node
+        self.frontier = IndexedHeap()
+        self.frontier.push(source, 0)
+
+    @property
+    def complete(self):
+        """
+        Whether every node reachable from the source has been settled.
+        """
+        return not self.frontier
+
+    def grow(self, targets=None, probe=None):
+        """
+        Settle nodes until every target is settled or the reachable graph is exhausted.
+
+        Args:
+        targets (iterable): The keys to settle. The whole reachable graph is settled if omitted.
+        probe (SearchProbe): An optional probe told about every settled node and frontier push.
+        """
+        distances, g_scores, parent, frontier = self.distances, self.g_scores, self.parent, self.frontier
+        remaining = None if targets is None else {target for target in targets if target not in distances}
+        if remaining is not None and not remaining:
+            return
+
+        while frontier:
+            node, cost = frontier.pop()
+            distances[node] = cost
+            if probe is not None:
+                probe.expand(to_node_name(self.graph, node), g_score=cost)
+
+            for neighbor, weight in self.graph.get(node, ()):
+                if neighbor in distances:
+                    continue
+                g = cost + weight
+                if neighbor not in g_scores or g < g_scores[neighbor]:
+                    if probe is not None:
+                        if neighbor in frontier:
+                            probe.update()
+                        else:
+                            probe.push(len(frontier) + 1)
+                    g_scores[neighbor] = g
+                    parent[neighbor] = node
+                    frontier.push(neighbor, g)
+
+            if remaining is not None:
+                remaining.discard(node)
+                if not remaining:
+                    return
+
+    def memory_size(self):
+        """
+        Return the approximate size in bytes of the containers that hold the tree.
+        """
+        frontier = self.frontier
+        return sum(sys.getsizeof(container) for container in (
+            self.distances, self.g_scores, self.parent, frontier._items, frontier._priorities, frontier._position))
+
+    def path(self, goal):
+        """
+        Return the path from the source to a settled goal, or None if the goal is not settled.
+        """
+        if goal not in self.distances:
+            return None
+        return reconstruct_path(self.parent, goal)
+
+
+def shortest_path_tree(graph, start, targets=None, probe=None):
+    """
+    Grow a Dijkstra shortest path tree from start, stopping early once every target is settled.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs, keyed by search keys.
+    start: The start key.
+    targets (set): An optional set of keys to settle. The whole reachable graph is settled if omitted.
+    probe (SearchProbe): An optional probe told about every settled node and frontier push.
+
+    Returns:
+    tuple: A dictionary of settled costs and the predecessor map of the tree.
+    """
+    tree = ShortestPathTree(graph, start)
+    with probe_phase(probe, "search"):
+        tree.grow(targets, probe)
+    return tree.distances, tree.parent
+
+
+def bidirectional_search(graph, reverse, start, goal):
+    """
+    Find the least-cost path from start to goal with bidirectional Dijkstra.
+
+    A forward search from start and a backward search from goal over the reverse graph are
+    advanced alternately. Every edge relaxed into the other search's territory offers a
+    candidate path, and the search stops once the two frontier minimums together can no longer
+    beat the best candidate.
+
+    Args:
+    graph (dict or CompactGraph): The state space graph with costs, keyed by search keys.
+    reverse (dict or CompactGraph): The same graph with every edge reversed.
+    start: The start key.
+    goal: The goal key.
+
+    Returns:
+    tuple: The path from the start to the goal and its cost, or (None, inf) if the goal is unreachable.
+    """
+    if start == goal:
+        return [start], 0
+
+    g_scores = ({start: 0}, {goal: 0})  # Best known cost from start and to goal
+    parents = ({start: None}, {goal: None})  # Predecessor in each search tree
+    settled = (set(), set())
+    frontiers = (IndexedHeap(), IndexedHeap())
+    frontiers[0].push(start, 0)
+    frontiers[1].push(goal, 0)
+    graphs = (graph, reverse)
+    best_cost, meeting = float('inf'), None
+
+    while frontiers[0] and frontiers[1]:
+        if frontiers[0].peek()[1] + frontiers[1].peek()[1] >= best_cost:
+            break  # No path through an unsettled node can beat the best candidate
+
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        node, cost = frontiers[side].pop()
+        settled[side].add(node)
+        g_score, parent, other_scores = g_scores[side], parents[side], g_scores[1 - side]
+
+        for neighbor, weight in graphs[side].get(node, ()):
+            if neighbor in settled[side]:
+                continue
+            g = cost + weight
+            if neighbor not in g_score or g < g_score[neighbor]:
+                g_score[neighbor] = g
+                parent[neighbor] = node
+                frontiers[side].push(neighbor, g)
+            if neighbor in other_scores and g + other_scores[neighbor] < best_cost:
+                best_cost, meeting = g + other_scores[neighbor], neighbor
+
+    if meeting is None:
+        return None, float('inf')
+
+    path = reconstruct_path(parents[0], meeting)
+    node = parents[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = parents[1][node]
+    return path, best_cost
@@ -0,0 +1,173 @@
+import math  # Import math for the geometric edge lengths
+import random  # Import random for reproducible graphs and trees
+
+
+def grid_graph(width, height=None, seed=0, max_cost=10):
+    """
+    Generate a four-connected grid with random symmetric costs, in the adjacency_dict_costs format.
+
+    Args:
+    width (int): The number of columns.
+    height (int): The number of rows (default is width).
+    seed (int): The random seed, so the same arguments always give the same graph.
+    max_cost (int): The largest edge cost. Costs are drawn uniformly from 1 to max_cost.
+
+    Returns:
+    dict: The graph, with nodes named "r{row}c{column}".
+    """
+    height = width if height is None else height
+    rng = random.Random(seed)
+    graph = {f"r{row}c{column}": [] for row in range(height) for column in range(width)}
+    for row in range(height):
+        for column in range(width):
+            node = f"r{row}c{column}"
+            for neighbor in ((f"r{row}c{column + 1}",) if column + 1 < width else ()) + \
+                            ((f"r{row + 1}c{column}",) if row + 1 < height else ()):
+                cost = rng.randint(1, max_cost)
+                graph[node].append((neighbor, cost))
+                graph[neighbor].append((node, cost))
+    return graph
+
+
+def geometric_graph(node_count, average_degree=6, seed=0, scale=1000):
+    """
+    Generate a road-like random geometric graph in the adjacency_dict_costs format.
+
+    Nodes are scattered uniformly over the unit square and every pair closer than a radius chosen
+    for the requested average degree is joined in both directions. Points are bucketed into cells
+    the size of that radius, so only neighboring cells are compared.
+
+    Args:
+    node_count (int): The number of nodes.
+    average_degree (float): The expected number of neighbors of a node (default is 6).
+    seed (int): The random seed, so the same arguments always give the same graph.
+    scale (int): The cost of an edge is its Euclidean length times scale, rounded up.
+
+    Returns:
+    dict: The graph, with nodes named "g0", "g1", ...
+    """
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(node_count)]
+    radius = math.sqrt(average_degree / (math.pi * max(node_count, 1)))
+    cells = {}  # (cell column, cell row) -> indices of the points inside
+    for index, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(index)
+
+    graph = {f"g{index}": [] for index in range(node_count)}
+    for (column, row), members in cells.items():
+        for other_column in (column - 1, column, column + 1):
+            for other_row in (row - 1, row, row + 1):
+                for u in members:
+                    for x in cells.get((other_column, other_row), ()):
+                        if x <= u:
+                            continue  # Every pair is joined once, from its lower index
+                        length = math.dist(points[u], points[x])
+                        if length < radius:
+                            cost = max(1, math.ceil(length * scale))
+                            graph[f"g{u}"].append((f"g{x}", cost))
+                            graph[f"g{x}"].append((f"g{u}", cost))
+    return graph
+
+
+def scale_free_graph(node_count, edges_per_node=2, seed=0, max_cost=20):
+    """
+    Generate a scale-free graph by Barabasi-Albert preferential attachment, in the
+    adjacency_dict_costs format.
+
+    Args:
+    node_count (int): The number of nodes.
+    edges_per_node (int): The number of existing nodes every new node attaches to (default is 2).
+    seed (int): The random seed, so the same arguments always give the same graph.
+    max_cost (int): The largest edge cost. Costs are drawn uniformly from 1 to max_cost.
+
+    Returns:
+    dict: The graph, with nodes named "s0", "s1", ...
+    """
+    rng = random.Random(seed)
+    graph = {f"s{index}": [] for index in range(node_count)}
+    endpoints = []  # Every edge endpoint so far, so a uniform pick is proportional to degree
+    for node in range(1, node_count):
+        if node <= edges_per_node:
+            targets = set(range(node))  # The first nodes attach to everything before them
+        else:
+            targets = set()
+            while len(targets) < edges_per_node:
+                targets.add(rng.choice(endpoints))
+        for target in targets:
+            cost = rng.randint(1, max_cost)
+            graph[f"s{node}"].append((f"s{target}", cost))
+            graph[f"s{target}"].append((f"s{node}", cost))
+            endpoints += (node, target)
+    return graph
+
+
+def unweighted_graph(graph):
+    """
+    Drop the costs of a graph in the adjacency_dict_costs format, giving the adjacency_dict format.
+    """
+    return {node: [neighbor for neighbor, _ in edges] for node, edges in graph.items()}
+
+
+def game_tree(node_type, depth, branching, seed=0, low=0, high=100):
+    """
+    Generate a complete game tree of materialized nodes with random utilities.
+
+    Args:
+    node_type (type): The node class of the MiniMax module, called as node_type(name, utility, children).
+    depth (int): The number of moves from the root to the leaves.
+    branching (int): The number of children of every inner node.
+    seed (int): The random seed, so the same arguments always give the same tree.
+    low (int): The smallest utility.
+    high (int): The largest utility.
+
+    Returns:
+    Node: The root of the tree, with nodes named "t0", "t1", ... in depth-first order.
+    """
+    rng = random.Random(seed)
+    counter = [0]
+
+    def build(level):
+        name = f"t{counter[0]}"
+        counter[0] += 1
+        utility = rng.randint(low, high)
+        children = [build(level + 1) for _ in range(branching)] if level < depth else []
+        return node_type(name, utility, children)
+
+    return build(0)
+
+
+def lazy_game_tree(node_type, depth, branching, seed=0, low=0, high=100):
+    """
+    Generate a game tree whose children are only created when a search asks for them, for trees
+    too large to materialize.
+
+    Every node derives its utility from its own move path, so a subtree is identical each time it
+    is generated and the tree never depends on the order in which it is searched.
+
+    Args:
+    node_type (type): The lazy node class of the MiniMax module, called as
+        node_type(name, utility, expand, key).
+    depth (int): The number of moves from the root to the leaves.
+    branching (int): The number of children of every inner node.
+    seed (int): The random seed, so the same arguments always give the same tree.
+    low (int): The smallest utility.
+    high (int): The largest utility.
+
+    Returns:
+    LazyNode: The root of the tree, with nodes named after their move path, such as "t.0.2".
+    """
+    return _lazy_game_node(node_type, "t", (seed, depth, branching, low, high))
+
+
+def _lazy_game_node(node_type, name, shape):
+    seed, remaining, _, low, high = shape
+    utility = random.Random(f"{seed}:{name}").randint(low, high)
+    # The key carries everything needed to regenerate the subtree, so expansion stays a module
+    # level function that parallel searches can send to worker processes
+    return node_type(name, utility, _expand_lazy_game_node if remaining else None, (name, shape))
+
+
+def _expand_lazy_game_node(node):
+    name, (seed, remaining, branching, low, high) = node.key
+    shape = (seed, remaining - 1, branching, low, high)
+    return [_lazy_game_node(type(node), f"{name}.{move}", shape) for move in range(branching)]
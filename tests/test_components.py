@@ -0,0 +1,64 @@
+import copy
+import importlib.util
+import os
+import random
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from compact_graph import CompactGraph, graph_edited  # noqa: E402
+from components import ComponentIndex  # noqa: E402
+from replanning import ReplanningService  # noqa: E402
+
+spec = importlib.util.spec_from_file_location("ucs", os.path.join(ROOT, "Q-2.py"))
+ucs = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(ucs)
+
+
+def random_graph(node_count, edge_count, seed):
+    rng = random.Random(seed)
+    graph = {f"n{i}": [] for i in range(node_count)}
+    for _ in range(edge_count):
+        start, goal = rng.sample(range(node_count), 2)
+        graph[f"n{start}"].append((f"n{goal}", rng.randint(1, 9)))
+    return graph
+
+
+class ComponentIndexTest(unittest.TestCase):
+    def test_reachable_matches_search(self):
+        for seed in range(10):
+            graph = random_graph(30, 45, seed)
+            for searched in (graph, CompactGraph.from_adjacency(graph)):
+                index = ComponentIndex(searched)
+                for start in graph:
+                    for goal in graph:
+                        _, cost = ucs.uniform_cost_search(graph, start, goal)
+                        self.assertEqual(index.reachable(start, goal), cost != float('inf'), (seed, start, goal))
+
+    def test_unreachable_goals(self):
+        index = ComponentIndex(ucs.adjacency_dict_costs)
+        goals = {"Lalibela", "Bale", "Goba"}
+        self.assertEqual(index.unreachable_goals("Addis Ababa", goals), {"Bale", "Goba"})
+
+    def test_edit_through_replanning_service_is_seen(self):
+        graph = copy.deepcopy(ucs.adjacency_dict_costs)
+        index = ComponentIndex(graph)
+        self.assertEqual(ucs.uniform_cost_search(graph, "Addis Ababa", "Bale", components=index), (None, float('inf')))
+
+        ReplanningService(graph).update_edge("Addis Ababa", "Bale", 5)
+        self.assertEqual(ucs.uniform_cost_search(graph, "Addis Ababa", "Bale", components=index),
+                         (["Addis Ababa", "Bale"], 5))
+
+    def test_direct_edit_reported_with_graph_edited(self):
+        graph = {"a": [("b", 1)], "b": [], "c": []}
+        index = ComponentIndex(graph)
+        self.assertFalse(index.reachable("a", "c"))
+        graph["b"].append(("c", 1))
+        graph_edited(graph)
+        self.assertTrue(index.reachable("a", "c"))
+
+
+if __name__ == "__main__":
+    unittest.main()
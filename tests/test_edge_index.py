@@ -0,0 +1,83 @@
+import importlib.util
+import os
+import random
+import sys
+import unittest
+from array import array
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from compact_graph import CompactGraph, graph_edited  # noqa: E402
+from edge_index import EdgeWeightIndex  # noqa: E402
+from replanning import ReplanningService  # noqa: E402
+
+spec = importlib.util.spec_from_file_location("a_star", os.path.join(ROOT, "Q-3AStarSearch.py"))
+a_star = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(a_star)
+
+
+def random_graph(node_count, edge_count, seed):
+    rng = random.Random(seed)
+    graph = {f"n{i}": [] for i in range(node_count)}
+    for _ in range(edge_count):
+        start, goal = rng.sample(range(node_count), 2)
+        graph[f"n{start}"].append((f"n{goal}", rng.randint(1, 9)))  # Repeated pairs give parallel edges
+    return graph
+
+
+def cheapest_edge(graph, start, goal):
+    return min((cost for neighbor, cost in graph.get(start, ()) if neighbor == goal), default=None)
+
+
+class EdgeWeightIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.graph = random_graph(20, 120, 3)
+        self.compact = CompactGraph.from_adjacency(self.graph)
+
+    def test_cost_matches_cheapest_edge(self):
+        index, compact_index = EdgeWeightIndex(self.graph), EdgeWeightIndex(self.compact)
+        for start in self.graph:
+            for goal in self.graph:
+                expected = cheapest_edge(self.graph, start, goal)
+                self.assertEqual(index.cost(start, goal), expected)
+                self.assertEqual(compact_index.cost(self.compact.node_id(start), self.compact.node_id(goal)), expected)
+        self.assertIsNone(compact_index.cost(0, len(self.compact)))
+
+    def test_path_costs_match_detailed_path(self):
+        rng = random.Random(3)
+        names = list(self.graph)
+        paths = [[rng.choice(names) for _ in range(rng.randint(0, 6))] for _ in range(50)]
+        for graph in (self.graph, self.compact):
+            index = EdgeWeightIndex(graph)
+            keys = paths if graph is self.graph else [array("q", map(graph.node_id, path)) for path in paths]
+            costs = index.path_costs(keys)
+            invalid = set(costs.invalid)
+            for number, path in enumerate(paths):
+                detailed = index.detailed_path(path)
+                self.assertEqual(costs.totals[number], detailed.total)
+                self.assertEqual(list(costs.hops(number)), [cost for _, _, cost in detailed.hops])
+                self.assertEqual({hop for path_number, hop in invalid if path_number == number}, set(detailed.invalid))
+
+
+class AStarEdgeIndexTest(unittest.TestCase):
+    def test_index_is_cached_until_the_graph_is_edited(self):
+        graph = random_graph(20, 60, 4)
+        search = a_star.AStarSearch(graph)
+        index = search.edge_index()
+        self.assertIs(search.edge_index(), index)
+        graph_edited(graph)
+        self.assertIsNot(search.edge_index(), index)
+
+    def test_detailed_path_sees_edits(self):
+        graph = {"a": [("b", 5), ("b", 2)], "b": [("c", 1)], "c": []}
+        search = a_star.AStarSearch(graph)
+        self.assertEqual(search.detailed_path(["a", "b", "c"]).total, 3)
+        ReplanningService(graph).update_edge("b", "c", 7)
+        detailed = search.detailed_path(["a", "b", "c", "a"])
+        self.assertEqual(detailed.total, 9)
+        self.assertEqual(detailed.invalid, [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from graph_file import compile_edge_list, save_graph  # noqa: E402
+
+GRAPH = {
+    "Addis Ababa": [("Adama", 3), ("Ambo", 6)],
+    "Adama": [("Addis Ababa", 3)],
+    "Ambo": [("Addis Ababa", 6)],
+}
+
+
+class MappedGraphCloseTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.graph = save_graph(GRAPH, os.path.join(directory.name, "graph.csr"))
+        self.addCleanup(self.graph.close)
+
+    def test_close_unmaps_the_file(self):
+        self.graph.close()
+        self.assertTrue(self.graph._map.closed)
+        self.assertTrue(self.graph._file.closed)
+        self.graph.close()  # Closing twice is harmless
+
+    def test_close_with_live_slices_leaves_the_graph_usable(self):
+        source = self.graph.node_id("Addis Ababa")
+        neighbors = self.graph.neighbors(source)
+        edges = self.graph.get(source)
+        with self.assertRaises(BufferError):
+            self.graph.close()
+
+        self.assertFalse(self.graph._map.closed)
+        self.assertEqual(list(self.graph.edges(source)), [(self.graph.node_id("Adama"), 3),
+                                                          (self.graph.node_id("Ambo"), 6)])
+        self.assertEqual(list(self.graph.names), list(GRAPH))
+        self.assertEqual(list(neighbors), [self.graph.node_id("Adama"), self.graph.node_id("Ambo")])
+        self.assertEqual(len(list(edges)), 2)
+
+        del neighbors, edges
+        self.graph.close()
+        self.assertTrue(self.graph._map.closed)
+
+
+class CompileEdgeListTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+        return path
+
+    def compile(self, *sources):
+        graph = compile_edge_list(list(sources), os.path.join(self.directory, "graph.csr"))
+        self.addCleanup(graph.close)
+        return graph
+
+    def test_weighted_csv(self):
+        graph = self.compile(self.write("roads.csv", "source,target,length\na,b,3\nb,c,2.5\n"))
+        self.assertEqual(list(graph.edges(graph.node_id("b"))), [(graph.node_id("c"), 2.5)])
+
+    def test_csv_without_weight_column_costs_one(self):
+        graph = self.compile(self.write("roads.csv", "from,to\na,b\n"))
+        self.assertEqual(list(graph.edges(graph.node_id("a"))), [(graph.node_id("b"), 1)])
+
+    def test_blank_weight_cell_is_an_error(self):
+        path = self.write("roads.csv", "source,target,length\na,b,3\nb,c,\n")
+        with self.assertRaisesRegex(ValueError, "line 3"):
+            self.compile(path)
+
+    def test_edge_list_missing_a_cost_is_an_error(self):
+        path = self.write("roads.txt", "# source target cost\na b 3\nb c\n")
+        with self.assertRaisesRegex(ValueError, "line 3"):
+            self.compile(path)
+
+    def test_weighted_and_unweighted_files_do_not_mix(self):
+        with self.assertRaises(ValueError):
+            self.compile(self.write("a.txt", "a b 3\n"), self.write("b.txt", "b c\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import importlib.util
+import os
+import random
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from compact_graph import CompactGraph, graph_edited  # noqa: E402
+from landmarks import LandmarkHeuristic  # noqa: E402
+from replanning import ReplanningService  # noqa: E402
+from route_cache import ShortestPathCache  # noqa: E402
+
+
+def load_script(name):
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), os.path.join(ROOT, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ucs = load_script("Q-2")
+a_star = load_script("Q-3AStarSearch")
+
+
+def random_graph(node_count, edge_count, seed):
+    rng = random.Random(seed)
+    graph = {f"n{i}": [] for i in range(node_count)}
+    for _ in range(edge_count):
+        start, goal = rng.sample(range(node_count), 2)
+        graph[f"n{start}"].append((f"n{goal}", rng.randint(1, 9)))
+    return graph
+
+
+class LandmarkHeuristicTest(unittest.TestCase):
+    def test_estimate_is_a_lower_bound(self):
+        graph = random_graph(40, 120, 0)
+        heuristic = LandmarkHeuristic(graph, 4)
+        for start in graph:
+            for goal in graph:
+                _, cost = ucs.uniform_cost_search(graph, start, goal)
+                self.assertLessEqual(heuristic.estimate(start, goal), cost)
+
+    def test_a_star_matches_uniform_cost_search(self):
+        for seed in range(5):
+            graph = random_graph(40, 120, seed)
+            for searched in (graph, CompactGraph.from_adjacency(graph)):
+                search = a_star.AStarSearch(searched, landmark_count=4)
+                for start in list(graph)[:10]:
+                    for goal in graph:
+                        self.assertEqual(search.a_star_search(start, goal)[1],
+                                         ucs.uniform_cost_search(graph, start, goal)[1])
+
+
+class LandmarksAfterEditsTest(unittest.TestCase):
+    def setUp(self):
+        self.graph = random_graph(40, 120, 7)
+        self.search = a_star.AStarSearch(self.graph, landmark_count=4)
+        self.search.a_star_search("n0", "n1")  # Builds the landmark tables
+        self.edits = random.Random(7)
+
+    def shortcuts(self, count=15):
+        # Cheap edges between random nodes, which make the old landmark distances overestimate
+        return [tuple(self.edits.sample(list(self.graph), 2)) for _ in range(count)]
+
+    def assert_optimal(self):
+        for start in list(self.graph)[:10]:
+            for goal in self.graph:
+                self.assertEqual(self.search.a_star_search(start, goal)[1],
+                                 ucs.uniform_cost_search(self.graph, start, goal)[1], (start, goal))
+
+    def test_edit_through_replanning_service(self):
+        service = ReplanningService(self.graph)
+        for start, goal in self.shortcuts():
+            service.update_edge(start, goal, 1)
+        self.assert_optimal()
+
+    def test_edit_through_route_cache(self):
+        cache = ShortestPathCache(self.graph)
+        for start, goal in self.shortcuts():
+            cache.set_edge(start, goal, 1)
+        self.assert_optimal()
+
+    def test_direct_edit_reported_with_graph_edited(self):
+        for start, goal in self.shortcuts():
+            self.graph[start].append((goal, 1))
+        graph_edited(self.graph)
+        self.assert_optimal()
+
+    def test_supplied_heuristic_is_kept(self):
+        heuristic = LandmarkHeuristic(self.graph, 2)
+        search = a_star.AStarSearch(self.graph, heuristics=heuristic)
+        graph_edited(self.graph)
+        self.assertIs(search.heuristics, heuristic)
+
+
+if __name__ == "__main__":
+    unittest.main()
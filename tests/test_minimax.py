@@ -0,0 +1,72 @@
+import importlib.util
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from synthetic_graphs import game_tree, lazy_game_tree  # noqa: E402
+
+spec = importlib.util.spec_from_file_location("minimax", os.path.join(ROOT, "Q-4MiniMaxSearch.py"))
+minimax = importlib.util.module_from_spec(spec)
+sys.modules["minimax"] = minimax  # Worker processes unpickle the search functions and nodes by module name
+spec.loader.exec_module(minimax)
+
+ORDERINGS = (None, "utility", ("killer", "history", "utility"))
+
+
+def trees(seed):
+    yield game_tree(minimax.Node, 4, 3, seed)
+    yield lazy_game_tree(minimax.LazyNode, 4, 3, seed)
+    yield minimax.ArrayGameTree.from_node(game_tree(minimax.Node, 4, 3, seed)).root
+
+
+class AlphaBetaTest(unittest.TestCase):
+    def test_alphabeta_matches_minimax(self):
+        for seed in range(30):
+            for root in trees(seed):
+                for ordering in ORDERINGS:
+                    for depth in (1, 2, 3, 4):
+                        expected = minimax.MiniMaxSearch(root).best_move(depth, "minimax")
+                        search = minimax.MiniMaxSearch(root, ordering=ordering)
+                        self.assertEqual(search.best_move(depth), expected, (seed, ordering, depth))
+
+    def test_reused_search_matches_minimax_at_every_depth(self):
+        # A deeper search leaves its table behind; shallower searches must not answer from it
+        for seed in range(30):
+            for root in trees(seed):
+                for ordering in ORDERINGS:
+                    search = minimax.MiniMaxSearch(root, ordering=ordering)
+                    for depth in (4, 1, 2, 3, 4, 2):
+                        expected = minimax.MiniMaxSearch(root).best_move(depth, "minimax")
+                        self.assertEqual(search.best_move(depth), expected, (seed, ordering, depth))
+
+    def test_alphabeta_visits_fewer_nodes(self):
+        root = game_tree(minimax.Node, 5, 4, 0)
+        full = minimax.MiniMaxSearch(root)
+        full.best_move(5, "minimax")
+        pruned = minimax.MiniMaxSearch(root, ordering="utility")
+        pruned.best_move(5)
+        self.assertLess(pruned.stats["nodes"], full.stats["nodes"])
+
+    def test_anytime_search_matches_minimax(self):
+        for seed in range(10):
+            root = game_tree(minimax.Node, 4, 3, seed)
+            move, depth = minimax.MiniMaxSearch(root, ordering="utility").best_move_anytime(max_depth=3)
+            self.assertEqual(depth, 3)
+            self.assertEqual(move, minimax.MiniMaxSearch(root).best_move(3, "minimax"))
+
+    def test_parallel_search_matches_minimax(self):
+        for seed in range(3):
+            for root in (game_tree(minimax.Node, 4, 3, seed), lazy_game_tree(minimax.LazyNode, 5, 3, seed)):
+                expected = minimax.MiniMaxSearch(root).best_move(4, "minimax")
+                for young_brothers_wait, split_depth in ((False, 1), (True, 1), (True, 3)):
+                    search = minimax.MiniMaxSearch(root, ordering="utility")
+                    move = search.parallel_best_move(4, processes=2, young_brothers_wait=young_brothers_wait,
+                                                     split_depth=split_depth)
+                    self.assertEqual(move, expected, (seed, young_brothers_wait, split_depth))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import copy
+import importlib.util
+import os
+import random
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from compact_graph import CompactGraph, graph_edited  # noqa: E402
+from components import ComponentIndex  # noqa: E402
+from replanning import ReplanningService  # noqa: E402
+from route_cache import ShortestPathCache  # noqa: E402
+
+spec = importlib.util.spec_from_file_location("ucs", os.path.join(ROOT, "Q-2.py"))
+ucs = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(ucs)
+
+
+def random_graph(node_count, edge_count, seed):
+    rng = random.Random(seed)
+    graph = {f"n{i}": [] for i in range(node_count)}
+    for _ in range(edge_count):
+        start, goal = rng.sample(range(node_count), 2)
+        graph[f"n{start}"].append((f"n{goal}", rng.randint(1, 9)))
+    return graph
+
+
+class ShortestPathCacheTest(unittest.TestCase):
+    def assert_matches_search(self, cache, graph, starts):
+        for start in starts:
+            for goal in graph:
+                _, expected = ucs.uniform_cost_search(graph, start, goal)
+                path, cost = cache.route(start, goal)
+                self.assertEqual(cost, expected, (start, goal))
+                if path is not None:
+                    self.assertEqual(path[0], start)
+                    self.assertEqual(path[-1], goal)
+
+    def test_routes_match_search(self):
+        graph = random_graph(40, 100, 1)
+        for searched in (graph, CompactGraph.from_adjacency(graph)):
+            cache = ShortestPathCache(searched, max_bytes=4096)
+            self.assert_matches_search(cache, graph, list(graph)[:10])
+            self.assert_matches_search(cache, graph, list(graph)[:10])
+            self.assertGreater(cache.stats()["hits"], 0)
+
+    def test_edits_through_the_cache(self):
+        graph = random_graph(40, 100, 2)
+        cache = ShortestPathCache(graph, components=ComponentIndex(graph))
+        edits = random.Random(2)
+        for _ in range(20):
+            self.assert_matches_search(cache, graph, list(graph)[:5])
+            start, goal = edits.sample(list(graph), 2)
+            if edits.random() < 0.3:
+                cache.remove_edge(start, goal)
+            else:
+                cache.set_edge(start, goal, edits.randint(1, 9))
+        self.assert_matches_search(cache, graph, list(graph)[:5])
+
+    def test_edits_through_another_editor(self):
+        graph = copy.deepcopy(ucs.adjacency_dict_costs)
+        cache = ShortestPathCache(graph, components=ComponentIndex(graph))
+        self.assertEqual(cache.route("Addis Ababa", "Goba"), (None, float('inf')))
+        self.assertEqual(cache.route("Addis Ababa", "Batu")[1], 8)
+
+        service = ReplanningService(graph)
+        service.update_edge("Addis Ababa", "Bale", 5)
+        service.update_edge("Addis Ababa", "Batu", 6)
+        self.assertEqual(cache.route("Addis Ababa", "Goba"), (["Addis Ababa", "Bale", "Goba"], 8))
+        self.assertEqual(cache.route("Addis Ababa", "Batu"), (["Addis Ababa", "Batu"], 6))
+
+    def test_edit_only_drops_trees_that_relaxed_it(self):
+        graph = {"a": [("b", 1)], "b": [("c", 1)], "c": [], "x": [("y", 1)], "y": []}
+        cache = ShortestPathCache(graph)
+        cache.route("a", "c")
+        cache.route("x", "y")
+        graph["b"].append(("y", 1))
+        graph_edited(graph, "b")
+        self.assertEqual(cache.stats()["trees"], 1)
+        self.assertEqual(cache.route("a", "y"), (["a", "b", "y"], 2))
+
+        graph_edited(graph)
+        self.assertEqual(cache.stats()["trees"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
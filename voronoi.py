@@ -0,0 +1,203 @@
+from compact_graph import reverse_view, to_node_id, to_node_name, to_node_names
+from instrumentation import probe_phase, probe_search
+from search_core import IndexedHeap
+
+
+class FacilityIndex:
+    """
+    A graph Voronoi partition: every node labeled with its nearest facility, the distance to it
+    and its predecessor on the shortest path, from one multi-source Dijkstra seeded with all
+    facilities at once.
+
+    A node always carries the label of its predecessor, so the cell of a facility is a subtree
+    of the shortest path forest, and a facility always labels itself, even when another one is
+    as close. Opening a facility grows a new cell over the nodes it is strictly closer to and
+    the nodes hanging below it in the forest. Closing one only relabels its own cell, seeded
+    from the labeled nodes bordering it, since no other node's distance can change.
+    """
+
+    def __init__(self, graph, facilities=(), to_facilities=False, probe=None):
+        """
+        Label every node reachable from a facility.
+
+        Args:
+        graph (dict or CompactGraph): The state space graph with costs. It must not change while
+            the index is in use.
+        facilities (iterable): The facility states, such as depots.
+        to_facilities (bool): Whether distances run from each node to the facility (for
+            customers travelling to a depot) instead of from the facility to each node (for
+            deliveries). Default is False.
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
+        """
+        self.graph = graph
+        self.to_facilities = to_facilities
+        self.search_graph = reverse_view(graph) if to_facilities else graph
+        self.in_edges = None  # Reverse of search_graph, built on the first close
+        self.nearest = {}  # Node -> nearest facility, as search keys
+        self.distance = {}  # Node -> distance to its nearest facility
+        self.parent = {}  # Node -> predecessor on the path from its facility, None for a facility
+        self.cells = {}  # Facility -> set of nodes labeled with it
+
+        with probe_search(probe, "voronoi"), probe_phase(probe, "search"):
+            seeds = []
+            for facility in facilities:
+                facility = to_node_id(graph, facility)
+                self.cells.setdefault(facility, set())
+                seeds.append((facility, 0, facility, None))
+            self._grow(seeds, None, probe)
+
+    def __len__(self):
+        return len(self.distance)
+
+    @property
+    def facilities(self):
+        """
+        The open facilities, as node names.
+        """
+        return [to_node_name(self.graph, facility) for facility in self.cells]
+
+    def nearest_facility(self, node):
+        """
+        Look up the nearest facility of a node.
+
+        Args:
+        node (str): The state, such as a customer city.
+
+        Returns:
+        tuple: The nearest facility and the distance to it, or (None, inf) if no facility is connected.
+        """
+        key = to_node_id(self.graph, node)
+        facility = self.nearest.get(key)
+        if facility is None:
+            return None, float('inf')
+        return to_node_name(self.graph, facility), self.distance[key]
+
+    def path(self, node):
+        """
+        Return the shortest path between a node and its nearest facility: from the facility to
+        the node, or from the node to the facility with to_facilities.
+
+        Returns:
+        list: The path as node names, or None if no facility is connected.
+        """
+        key = to_node_id(self.graph, node)
+        if key not in self.parent:
+            return None
+        path = []
+        while key is not None:
+            path.append(key)
+            key = self.parent[key]
+        if not self.to_facilities:
+            path.reverse()
+        return to_node_names(self.graph, path)
+
+    def cell(self, facility):
+        """
+        Return the nodes whose nearest facility is the given one, as node names.
+        """
+        return [to_node_name(self.graph, node) for node in self.cells.get(to_node_id(self.graph, facility), ())]
+
+    def open_facility(self, facility, probe=None):
+        """
+        Add a facility and move the nodes that are now closer to it into its cell.
+
+        Args:
+        facility (str): The new facility state.
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
+
+        Returns:
+        int: The number of nodes that changed facility.
+        """
+        facility = to_node_id(self.graph, facility)
+        if facility in self.cells:
+            return 0
+        with probe_search(probe, "voronoi_open"), probe_phase(probe, "search"):
+            self.cells[facility] = set()
+            self._grow([(facility, 0, facility, None)], None, probe)
+            return len(self.cells[facility])
+
+    def close_facility(self, facility, probe=None):
+        """
+        Remove a facility and relabel the nodes of its cell with their next nearest facility.
+
+        Args:
+        facility (str): The facility state to close.
+        probe (SearchProbe): An optional probe that counts the work done and notifies its sinks.
+
+        Returns:
+        int: The number of nodes that were relabeled, including those left without a facility.
+        """
+        facility = to_node_id(self.graph, facility)
+        region = self.cells.pop(facility, None)
+        if region is None:
+            return 0
+        with probe_search(probe, "voronoi_close"), probe_phase(probe, "search"):
+            for node in region:
+                del self.nearest[node], self.distance[node], self.parent[node]
+            if self.in_edges is None:
+                self.in_edges = reverse_view(self.search_graph)
+
+            # Seed every node of the cell with its best entry from a labeled node outside it, and
+            # every open facility inside it with itself
+            seeds = []
+            for node in region:
+                if node in self.cells:
+                    seeds.append((node, 0, node, None))
+                    continue
+                best = None
+                for neighbor, cost in self.in_edges.get(node, ()):
+                    if neighbor in self.distance:
+                        distance = self.distance[neighbor] + cost
+                        if best is None or distance < best[1]:
+                            best = (node, distance, self.nearest[neighbor], neighbor)
+                if best is not None:
+                    seeds.append(best)
+            self._grow(seeds, region, probe)
+            return len(region)
+
+    def _grow(self, seeds, region, probe):
+        """
+        Run a multi-source Dijkstra from (node, distance, facility, parent) seeds, relabeling every
+        node it reaches more cheaply than its current label, within region if one is given. A
+        facility seed always wins its own node, and a node whose predecessor changes facility
+        follows it at the same distance.
+        """
+        graph, nearest, distance, parent = self.search_graph, self.nearest, self.distance, self.parent
+        inf = float('inf')
+        frontier = IndexedHeap()
+        for node, cost, facility, predecessor in seeds:
+            if cost < distance.get(node, inf) or (predecessor is None and nearest.get(node) != facility):
+                self._label(node, cost, facility, predecessor)
+                frontier.push(node, cost)
+                if probe is not None:
+                    probe.push(len(frontier))
+
+        while frontier:
+            node, cost = frontier.pop()
+            facility = nearest[node]
+            if probe is not None:
+                probe.expand(to_node_name(self.graph, node), g_score=cost,
+                             facility=to_node_name(self.graph, facility))
+            for neighbor, edge_cost in graph.get(node, ()):
+                new_cost = cost + edge_cost
+                old_cost = distance.get(neighbor, inf)
+                if region is not None and neighbor not in region:
+                    continue
+                if new_cost < old_cost or (new_cost == old_cost and parent[neighbor] == node
+                                           and nearest[neighbor] != facility):
+                    if probe is not None:
+                        if neighbor in frontier:
+                            probe.update()
+                        else:
+                            probe.push(len(frontier) + 1)
+                    self._label(neighbor, new_cost, facility, node)
+                    frontier.push(neighbor, new_cost)
+
+    def _label(self, node, cost, facility, predecessor):
+        old_facility = self.nearest.get(node)
+        if old_facility is not None and old_facility != facility:
+            self.cells[old_facility].discard(node)
+        self.nearest[node] = facility
+        self.distance[node] = cost
+        self.parent[node] = predecessor
+        self.cells[facility].add(node)